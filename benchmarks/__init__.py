@@ -0,0 +1,5 @@
+""" Benchmarks for the hash table, dictionary and list ADTs.
+
+Each module can be run on its own from the repository root, e.g.
+python -m benchmarks.link_list
+"""
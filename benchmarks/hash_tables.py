@@ -0,0 +1,247 @@
+""" Reproducible hash table workloads with regression tracking.
+
+Every workload is a fixed sequence of operations built from one of the
+bundled word lists with a fixed random seed, so runs are comparable
+across machines and commits:
+
+    insert   insert every word into an empty table
+    hit      look up words that are in the table
+    miss     look up words that are not in the table
+    delete   delete-heavy mix: 50% delete, 25% insert, 25% hit
+    zipf     look ups drawn from a Zipf distribution over the words, as
+             word frequencies in real text are
+
+Each (table, workload) pair is run once as a warmup and then REPEAT
+times. ops/sec comes from the fastest repetition, the p50/p99 latencies
+from every timed operation, and the peak memory from one more run under
+tracemalloc (kept separate as tracing slows everything down).
+
+Results can be saved as a baseline JSON file and later runs compared
+against it; a run is flagged as a regression when its ops/sec falls more
+than the tolerance below the baseline. The exit status is 1 if anything
+regressed, so the module can gate a CI job:
+
+    python -m benchmarks.hash_tables --save-baseline baseline.json
+    python -m benchmarks.hash_tables --baseline baseline.json
+
+Table implementations are looked up by name in TABLES; anything taking
+(hash_base, table_size) and supporting [], [] =, del and in can be added.
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+from hash_table import LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable, \
+    SeparateChainingHashTable, SwissHashTable, PackedKeyHashTable
+
+
+class BuiltinDict(dict):
+    """ Python's dict, as a reference point, taking the same arguments as the tables """
+
+    def __init__(self, hash_base: int = 0, table_size: int = 0) -> None:
+        dict.__init__(self)
+
+
+TABLES = {
+    "linear_probe": LinearProbeHashTable,
+    "quadratic_probe": QuadraticProbeHashTable,
+    "double_hashing": DoubleHashingHashTable,
+    "separate_chaining": SeparateChainingHashTable,
+    "swiss": SwissHashTable,
+    "packed": PackedKeyHashTable,
+    "dict": BuiltinDict,
+}
+
+DEFAULT_TABLES = ["linear_probe"]
+DEFAULT_WORDLIST = "english_small.txt"
+DEFAULT_SIZE = 20000
+DEFAULT_HASH_BASE = 31
+DEFAULT_TABLE_SIZE = 17
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.10
+SEED = 1008
+ZIPF_EXPONENT = 1.0
+
+Operation = Tuple[str, str]
+
+
+def load_words(filename: str, size: int) -> List[str]:
+    """ Returns size distinct words of filename, in a fixed shuffled order """
+    with open(filename, encoding='UTF-8') as file:
+        words = list(dict.fromkeys(line.rstrip() for line in file))
+    random.Random(SEED).shuffle(words)
+    return words[:size]
+
+
+def build_workloads(words: List[str]) -> Dict[str, Tuple[List[str], List[Operation]]]:
+    """ Returns, for each workload name, the words to prefill the table with and the operations to time """
+    rng = random.Random(SEED)
+    half = len(words) // 2
+    present, absent = words[:half], words[half:]
+
+    delete_mix = []
+    live, spare = list(present), list(absent)
+    for _ in range(len(words)):
+        choice = rng.random()
+        if choice < 0.5 and live:
+            delete_mix.append(("delete", live.pop(rng.randrange(len(live)))))
+        elif choice < 0.75 and spare:
+            key = spare.pop()
+            live.append(key)
+            delete_mix.append(("insert", key))
+        elif live:
+            delete_mix.append(("get", live[rng.randrange(len(live))]))
+
+    weights = [1 / rank ** ZIPF_EXPONENT for rank in range(1, len(present) + 1)]
+    zipf = [("get", key) for key in rng.choices(present, weights=weights, k=len(words))]
+
+    return {
+        "insert": ([], [("insert", key) for key in words]),
+        "hit": (present, [("get", rng.choice(present)) for _ in range(len(words))]),
+        "miss": (present, [("miss", key) for key in absent] * 2),
+        "delete": (present, delete_mix),
+        "zipf": (present, zipf),
+    }
+
+
+def run_operations(table, operations: List[Operation], latencies: List[float] = None) -> float:
+    """ Runs the operations against table, appending each one's latency if a list is given.
+    Returns the total elapsed time.
+    """
+    timer = timeit.default_timer
+    start = timer()
+    for operation, key in operations:
+        before = timer() if latencies is not None else 0
+        if operation == "insert":
+            table[key] = 1
+        elif operation == "get":
+            _ = table[key]
+        elif operation == "miss":
+            _ = key in table
+        else:
+            del table[key]
+        if latencies is not None:
+            latencies.append(timer() - before)
+    return timer() - start
+
+
+def fresh_table(factory: Callable, prefill: List[str], hash_base: int, table_size: int):
+    """ Returns a new table holding the prefill words """
+    table = factory(hash_base, table_size)
+    for key in prefill:
+        table[key] = 1
+    return table
+
+
+def measure(factory: Callable, prefill: List[str], operations: List[Operation], repeat: int,
+            hash_base: int, table_size: int) -> Dict[str, float]:
+    """ Returns ops/sec, latency percentiles in microseconds and peak memory in bytes for one workload """
+    run_operations(fresh_table(factory, prefill, hash_base, table_size), operations)  # warmup
+
+    best = None
+    latencies = []
+    for _ in range(repeat):
+        table = fresh_table(factory, prefill, hash_base, table_size)
+        # latencies come from their own run, as timing every operation slows the total down
+        run_operations(table, operations, latencies)
+        table = fresh_table(factory, prefill, hash_base, table_size)
+        elapsed = run_operations(table, operations)
+        best = elapsed if best is None else min(best, elapsed)
+    latencies.sort()
+
+    tracemalloc.start()
+    table = fresh_table(factory, prefill, hash_base, table_size)
+    run_operations(table, operations)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": len(operations) / best,
+        "p50_us": 1e6 * latencies[len(latencies) // 2],
+        "p99_us": 1e6 * latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+        "peak_bytes": peak,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """ Returns the names of the results whose ops/sec fell more than tolerance below the baseline """
+    regressions = []
+    for name, result in results.items():
+        if name in baseline and result["ops_per_sec"] < baseline[name]["ops_per_sec"] * (1 - tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def run(tables: List[str], workloads: List[str], wordlist: str, size: int, repeat: int,
+        hash_base: int, table_size: int) -> Dict[str, Dict[str, float]]:
+    """ Runs every workload on every table, returning the results keyed by "table/workload" """
+    words = load_words(wordlist, size)
+    built = build_workloads(words)
+    results = {}
+    for table in tables:
+        for workload in workloads:
+            prefill, operations = built[workload]
+            results[f"{table}/{workload}"] = measure(TABLES[table], prefill, operations, repeat,
+                                                     hash_base, table_size)
+    return results
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+           regressions: List[str]) -> None:
+    """ Prints one row per result, with the change against the baseline where there is one """
+    print(f"{'table/workload':<28}{'ops/sec':>12}{'p50 (us)':>10}{'p99 (us)':>10}{'peak (KB)':>11}"
+          f"{'vs baseline':>13}")
+    for name, result in results.items():
+        change = ""
+        if name in baseline:
+            change = f"{100 * (result['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1):+.1f}%"
+            if name in regressions:
+                change += " !"
+        print(f"{name:<28}{result['ops_per_sec']:>12.0f}{result['p50_us']:>10.2f}{result['p99_us']:>10.2f}"
+              f"{result['peak_bytes'] / 1024:>11.0f}{change:>13}")
+
+
+def main(argv: List[str] = None) -> int:
+    """ Command line entry point; returns the exit status """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", default=",".join(DEFAULT_TABLES),
+                        help=f"comma separated, from {', '.join(TABLES)}")
+    parser.add_argument("--workloads", default="insert,hit,miss,delete,zipf")
+    parser.add_argument("--wordlist", default=DEFAULT_WORDLIST)
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="number of distinct words used")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--hash-base", type=int, default=DEFAULT_HASH_BASE)
+    parser.add_argument("--table-size", type=int, default=DEFAULT_TABLE_SIZE)
+    parser.add_argument("--baseline", help="baseline JSON file to compare against")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed fractional drop in ops/sec before flagging a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.tables.split(","), args.workloads.split(","), args.wordlist, args.size, args.repeat,
+                  args.hash_base, args.table_size)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    regressions = compare(results, baseline, args.tolerance)
+    report(results, baseline, regressions)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {100 * args.tolerance:.0f}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+""" Import time budget for the dictionary.
+
+Compiles the package's bytecode (so that compiling isn't what is measured),
+then runs python -X importtime -c "from dictionary import Dictionary" in a
+fresh interpreter REPEAT times, keeps the best cumulative time of the
+dictionary import and compares it with a budget, listing the modules that
+cost the most. Exits with status 1 if the budget is exceeded or if one of
+the FORBIDDEN modules, which are only needed for tests or profiling, is
+imported, so it can gate changes that pull them back into the import path:
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget 30
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+STATEMENT = "from dictionary import Dictionary"
+MODULE = "dictionary"
+BUDGET_MS = 40.0
+REPEAT = 7
+OFFENDERS = 10
+FORBIDDEN = ("unittest", "timeit", "cProfile", "pstats", "tracemalloc")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times() -> Dict[str, Tuple[float, float]]:
+    """ Imports MODULE in a fresh interpreter and returns module -> (self ms, cumulative ms) """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", STATEMENT],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own) / 1000, int(cumulative) / 1000)
+    return times
+
+
+def best_run() -> Dict[str, Tuple[float, float]]:
+    """ Returns the import times of the fastest of REPEAT runs """
+    runs = [import_times() for _ in range(REPEAT)]
+    return min(runs, key=lambda times: times[MODULE][1])
+
+
+def offenders(times: Dict[str, Tuple[float, float]]) -> List[Tuple[str, float]]:
+    """ Returns the OFFENDERS modules with the largest self time, largest first """
+    return sorted(((name, own) for name, (own, _) in times.items()), key=lambda item: -item[1])[:OFFENDERS]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="budget in milliseconds")
+    args = parser.parse_args()
+
+    compileall.compile_dir(ROOT, maxlevels=0, quiet=1)
+    times = best_run()
+    total = times[MODULE][1]
+    print(f"{STATEMENT}: {total:.1f} ms (budget {args.budget:.1f} ms, best of {REPEAT})")
+    print(f"{'module':<32}{'self (ms)':>12}")
+    for name, own in offenders(times):
+        print(f"{name:<32}{own:>12.2f}")
+
+    failed = False
+    for name in FORBIDDEN:
+        if name in times:
+            print(f"FAIL: {name} is imported")
+            failed = True
+    if total > args.budget:
+        print(f"FAIL: {total:.1f} ms is over the budget of {args.budget:.1f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
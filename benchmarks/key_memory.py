@@ -0,0 +1,61 @@
+""" Memory footprint of the dictionary's keys.
+
+Loads each word list into a Dictionary backed by LinearProbeHashTable,
+which keeps a str and a tuple per word, and by PackedKeyHashTable, before
+and after compact() with front coding, and reports the memory the
+dictionary holds on to once loaded (traced with tracemalloc, so the list
+of lines read is not counted) next to the size of the file, along with
+the time taken to look up LOOKUPS of its words.
+"""
+__docformat__ = 'reStructuredText'
+
+import os
+import timeit
+import tracemalloc
+from dictionary import Dictionary
+from hash_table import LinearProbeHashTable, PackedKeyHashTable
+
+FILENAMES = ["english_large.txt", "french.txt"]
+HASH_BASE = 250726
+TABLE_SIZE = 402221
+LOOKUPS = 20000
+
+
+def load(filename: str, table_type, front_coding: bool) -> tuple:
+    """ Returns the loaded dictionary and the bytes it holds """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    dictionary = Dictionary(HASH_BASE, TABLE_SIZE, table_type)
+    dictionary.load_dictionary(filename)
+    if table_type is PackedKeyHashTable:
+        dictionary.hash_table.compact(front_coding)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return dictionary, held
+
+
+def lookup_time(dictionary: Dictionary, words: list) -> float:
+    """ Returns the time in microseconds per find_word of words """
+    start = timeit.default_timer()
+    for word in words:
+        dictionary.find_word(word)
+    return 1e6 * (timeit.default_timer() - start) / len(words)
+
+
+def run() -> None:
+    print(f"{'file':<20}{'table':<22}{'file (KB)':>11}{'held (KB)':>11}{'x file':>8}{'lookup (us)':>13}")
+    for filename in FILENAMES:
+        size = os.path.getsize(filename)
+        with open(filename, encoding='UTF-8') as file:
+            words = [line.rstrip() for line in file]
+        words = words[::max(1, len(words) // LOOKUPS)]
+        for name, table_type, front_coding in [("linear probe", LinearProbeHashTable, False),
+                                               ("packed", PackedKeyHashTable, False),
+                                               ("packed, front-coded", PackedKeyHashTable, True)]:
+            dictionary, held = load(filename, table_type, front_coding)
+            print(f"{filename:<20}{name:<22}{size / 1024:>11.0f}{held / 1024:>11.0f}{held / size:>8.1f}"
+                  f"{lookup_time(dictionary, words):>13.2f}")
+
+
+if __name__ == '__main__':
+    run()
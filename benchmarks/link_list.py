@@ -0,0 +1,75 @@
+""" Indexed traversal of a LinkList, before and after the cursor/skips.
+
+The "before" figures walk from the head for every index, which is what
+LinkList.__get_node_at_index did before it kept a cursor. Walking from the
+head is quadratic, so for large lists it is timed on a sample of evenly
+spaced indices and scaled up to the full traversal. Random access without
+skips is quadratic as well and is timed on a prefix of the shuffled
+indices, scaled the same way.
+"""
+__docformat__ = 'reStructuredText'
+
+import random
+import sys
+import timeit
+from list_adt import LinkList
+
+DEFAULT_SIZE = 100000
+HEAD_WALK_SAMPLE = 500
+RANDOM_SAMPLE = 2000
+
+
+def walk_from_head(link_list: LinkList, index: int):
+    """ Returns the item at index by walking from the head
+    :complexity: O(index)
+    """
+    current = link_list.head
+    for _ in range(index):
+        current = current.link
+    return current.item
+
+
+def time_head_walk(link_list: LinkList, indices: list) -> float:
+    """ Time to look up every index walking from the head, estimated from
+    an evenly spaced sample of at most HEAD_WALK_SAMPLE of them
+    """
+    step = max(1, len(indices) // HEAD_WALK_SAMPLE)
+    sample = indices[::step]
+    start = timeit.default_timer()
+    for index in sample:
+        walk_from_head(link_list, index)
+    return (timeit.default_timer() - start) * len(indices) / len(sample)
+
+
+def time_indexed(link_list: LinkList, indices: list, limit: int = None) -> float:
+    """ Time to look up every index with link_list[index], estimated from
+    the first limit of them if a limit is given
+    """
+    sample = indices[:limit]
+    start = timeit.default_timer()
+    for index in sample:
+        _ = link_list[index]
+    return (timeit.default_timer() - start) * len(indices) / len(sample)
+
+
+def run(size: int = DEFAULT_SIZE) -> None:
+    """ Prints before/after timings for sequential and random indexed access """
+    random.seed(1008)
+    sequential = list(range(size))
+    shuffled = random.sample(sequential, len(sequential))
+    print(f"LinkList indexed traversal, {size} elements")
+    print(f"{'access':<12}{'list':<18}{'head walk (s)':>15}{'indexed (s)':>15}{'speedup':>10}")
+    for skip_interval in [0, 64]:
+        link_list = LinkList(skip_interval)
+        for i in range(size):
+            link_list.append(i)
+        label = f"skips of {skip_interval}" if skip_interval else "cursor only"
+        for name, indices in [("sequential", sequential), ("random", shuffled)]:
+            limit = RANDOM_SAMPLE if name == "random" and not skip_interval else None
+            before = time_head_walk(link_list, indices)
+            after = time_indexed(link_list, indices, limit)
+            print(f"{name:<12}{label:<18}{before:>15.3f}{after:>15.3f}{before / after:>9.0f}x")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
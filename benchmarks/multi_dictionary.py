@@ -0,0 +1,66 @@
+""" Multi-language lookup.
+
+Loads english_large.txt and french.txt into a Dictionary each, and into
+one MultiDictionary, then times asking which languages contain each word
+of the corpus: one find_words pass per Dictionary against a single
+language_masks pass over the shared table. Load times are reported too;
+the MultiDictionary reads its lists in parallel but has one larger table
+to fill. Each timing is the best of REPEAT runs.
+"""
+__docformat__ = 'reStructuredText'
+
+import timeit
+from dictionary import Dictionary, MultiDictionary
+from tokenizer import tokenize
+
+CORPUS = "215-0.txt"
+LANGUAGES = {"english": "english_large.txt", "french": "french.txt"}
+HASH_BASE = 250726
+TABLE_SIZE = 402221
+REPEAT = 5
+
+
+def load_separate() -> list:
+    """ Returns a Dictionary per language """
+    dictionaries = []
+    for filename in LANGUAGES.values():
+        dictionary = Dictionary(HASH_BASE, TABLE_SIZE)
+        dictionary.load_dictionary(filename)
+        dictionaries.append(dictionary)
+    return dictionaries
+
+
+def load_shared() -> MultiDictionary:
+    """ Returns one MultiDictionary holding every language """
+    dictionary = MultiDictionary(HASH_BASE, TABLE_SIZE)
+    dictionary.load_dictionaries(LANGUAGES)
+    return dictionary
+
+
+def timed(function) -> tuple:
+    """ Returns the result of calling function and the time it took """
+    began = timeit.default_timer()
+    result = function()
+    return result, timeit.default_timer() - began
+
+
+def run() -> None:
+    with open(CORPUS, encoding='UTF-8') as file:
+        words = tokenize(file.read()) * 20
+    separate, separate_load = timed(load_separate)
+    shared, shared_load = timed(load_shared)
+
+    def lookup_separate() -> list:
+        return [dictionary.find_words(words) for dictionary in separate]
+
+    separate_lookup = min(timeit.repeat(lookup_separate, number=1, repeat=REPEAT))
+    shared_lookup = min(timeit.repeat(lambda: shared.language_masks(words), number=1, repeat=REPEAT))
+
+    print(f"{len(words)} words of {CORPUS}, {len(LANGUAGES)} languages")
+    print(f"{'dictionaries':<24}{'load (s)':>10}{'lookup (ms)':>13}")
+    print(f"{'one per language':<24}{separate_load:>10.2f}{1000 * separate_lookup:>13.1f}")
+    print(f"{'MultiDictionary':<24}{shared_load:>10.2f}{1000 * shared_lookup:>13.1f}")
+
+
+if __name__ == '__main__':
+    run()
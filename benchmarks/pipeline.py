@@ -0,0 +1,54 @@
+""" Per-stage breakdown of the Frequency pipeline.
+
+Runs Frequency(), add_file on a corpus, ranking and rarity of every word
+of the corpus with the profiling spans enabled, and prints the time (and
+with --allocations, the memory) spent in each stage. --profile STAGE
+attaches cProfile to a stage and prints its most expensive functions:
+
+    python -m benchmarks.pipeline
+    python -m benchmarks.pipeline --allocations --profile frequency.sort
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import profiling
+from frequency import Frequency
+from tokenizer import read_tokens
+
+DEFAULT_CORPUS = "215-0.txt"
+PROFILE_LINES = 15
+
+
+def run(corpus: str, word_ids: bool) -> None:
+    """ Runs every stage of the pipeline once """
+    frequency = Frequency(word_ids)
+    frequency.add_file(corpus)
+    frequency.max_word
+    frequency.ranking()
+    with open(corpus, encoding='UTF-8') as file:
+        for words in read_tokens(file):
+            for word in words:
+                frequency.rarity(word)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--word-ids", action="store_true", help="count by dictionary word ID")
+    parser.add_argument("--allocations", action="store_true", help="also record memory allocated per stage")
+    parser.add_argument("--profile", action="append", default=[], metavar="STAGE",
+                        help="attach cProfile to a stage; may be repeated")
+    args = parser.parse_args()
+
+    profiling.enable(allocations=args.allocations, profile=args.profile)
+    run(args.corpus, args.word_ids)
+    profiling.disable()
+
+    profiling.print_breakdown()
+    for stage in args.profile:
+        print(f"\ncProfile of {stage}:")
+        profiling.profile_stats(stage).sort_stats("cumulative").print_stats(PROFILE_LINES)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+""" Frequency start-up time.
+
+Times how long Frequency() takes to return and how long until the first
+answer (a rarity lookup after add_file), three ways:
+
+    eager    the dictionary and table are used straight after construction,
+             which is what Frequency.__init__ used to do
+    lazy     the default: everything is loaded on first use
+    preload  the dictionary loads on a background thread while the caller
+             is busy for IDLE seconds (as frequency_analysis is while
+             waiting for input), and first use waits for what is left
+
+Each is run REPEAT times in a fresh Frequency, keeping the best time.
+"""
+__docformat__ = 'reStructuredText'
+
+import time
+import timeit
+from frequency import Frequency
+
+CORPUS = "215-0.txt"
+IDLE = 1.0
+REPEAT = 3
+
+
+def eager() -> Frequency:
+    """ Constructs a Frequency and loads and allocates everything straight away """
+    frequency = Frequency()
+    frequency.dictionary
+    frequency.hash_table
+    return frequency
+
+
+def lazy() -> Frequency:
+    """ Constructs a Frequency, leaving everything to first use """
+    return Frequency()
+
+
+def preload() -> Frequency:
+    """ Constructs a preloading Frequency, then stays busy for IDLE seconds """
+    frequency = Frequency(preload=True)
+    time.sleep(IDLE)
+    return frequency
+
+
+def first_use(frequency: Frequency) -> None:
+    """ Counts the corpus and answers one rarity query """
+    frequency.add_file(CORPUS)
+    frequency.rarity("the")
+
+
+def best_times(start) -> tuple:
+    """ Returns the best construction time and time to first answer of REPEAT runs """
+    construct = answer = None
+    for _ in range(REPEAT):
+        began = timeit.default_timer()
+        frequency = start()
+        built = timeit.default_timer()
+        first_use(frequency)
+        done = timeit.default_timer()
+        # the idle time stands for the caller's own work, so it isn't counted against start-up
+        idle = IDLE if start is preload else 0
+        construct = built - began - idle if construct is None else min(construct, built - began - idle)
+        answer = done - began - idle if answer is None else min(answer, done - began - idle)
+    return construct, answer
+
+
+def run() -> None:
+    print(f"{'mode':<10}{'Frequency() (ms)':>18}{'first answer (ms)':>19}")
+    for start in [eager, lazy, preload]:
+        construct, answer = best_times(start)
+        print(f"{start.__name__:<10}{1000 * construct:>18.1f}{1000 * answer:>19.1f}")
+
+
+if __name__ == '__main__':
+    run()
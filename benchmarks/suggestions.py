@@ -0,0 +1,54 @@
+""" Spelling suggestions for the misspelt tokens of 215-0.txt.
+
+Loads english_large.txt, builds the symmetric delete index, then asks for
+suggestions for every distinct word of 215-0.txt that the dictionary does
+not contain: once with an empty cache and once more answered from the
+cache.
+"""
+__docformat__ = 'reStructuredText'
+
+import sys
+import timeit
+from dictionary import Dictionary
+
+DEFAULT_DICTIONARY = "english_large.txt"
+DEFAULT_TEXT = "215-0.txt"
+
+
+def percentile(times: list, fraction: float) -> float:
+    """ Returns the value below which the given fraction of sorted times fall """
+    return times[min(len(times) - 1, int(fraction * len(times)))]
+
+
+def time_queries(suggester, words: list) -> list:
+    """ Returns the sorted time taken by suggest for each word """
+    times = []
+    for word in words:
+        start = timeit.default_timer()
+        suggester.suggest(word)
+        times.append(timeit.default_timer() - start)
+    return sorted(times)
+
+
+def run(dictionary_file: str = DEFAULT_DICTIONARY, text_file: str = DEFAULT_TEXT) -> None:
+    """ Prints the build time and per-query latencies """
+    dictionary = Dictionary(31, 250727)
+    dictionary.load_dictionary(dictionary_file)
+    _, misspelt = dictionary.check_file(text_file)
+
+    start = timeit.default_timer()
+    suggester = dictionary.get_suggester()
+    build = timeit.default_timer() - start
+    print(f"{len(suggester.index)} deletes indexed for {len(dictionary.hash_table)} words in {build:.2f}s")
+    print(f"{len(misspelt)} distinct misspelt tokens in {text_file}")
+
+    print(f"{'pass':<8}{'mean (ms)':>12}{'p50 (ms)':>12}{'p99 (ms)':>12}{'max (ms)':>12}")
+    for name in ["cold", "cached"]:
+        times = time_queries(suggester, misspelt)
+        print(f"{name:<8}{1000 * sum(times) / len(times):>12.3f}{1000 * percentile(times, 0.5):>12.3f}"
+              f"{1000 * percentile(times, 0.99):>12.3f}{1000 * times[-1]:>12.3f}")
+    print(f"cache hits {suggester.cache_hits}, misses {suggester.cache_misses}")
+
+
+if __name__ == '__main__':
+    run(*sys.argv[1:3])
@@ -0,0 +1,67 @@
+""" Control byte groups against linear probing at rising load factors.
+
+Fills a SwissHashTable and a LinearProbeHashTable of the same capacity to
+each load factor in LOADS, then times lookups of words that are in the
+table (hit) and of words that aren't (miss), keeping the best of REPEAT
+runs. Linear probing would normally rehash past half full, so it is
+measured through a subclass whose MAX_LOAD lets it reach the same loads;
+neither table re-seeds its hash base.
+"""
+__docformat__ = 'reStructuredText'
+
+import random
+import timeit
+from typing import List
+from hash_table import HashTable, LinearProbeHashTable, SwissHashTable
+
+WORDLIST = "english_large.txt"
+CAPACITY = 2 ** 15
+LOADS = [0.25, 0.5, 0.75, 0.85]
+HASH_BASE = 31
+REPEAT = 5
+SEED = 1008
+
+
+class FullLinearProbeHashTable(LinearProbeHashTable):
+    """ Linear probing left to fill up as far as SwissHashTable does """
+    MAX_LOAD = SwissHashTable.MAX_LOAD
+
+
+def load_words() -> List[str]:
+    """ Returns the distinct words of WORDLIST in a fixed shuffled order """
+    with open(WORDLIST, encoding='UTF-8') as file:
+        words = list(dict.fromkeys(line.rstrip() for line in file))
+    random.Random(SEED).shuffle(words)
+    return words
+
+
+def best_lookup_time(table: HashTable, keys: List[str]) -> float:
+    """ Returns the best time of REPEAT passes looking up every key """
+    best = None
+    for _ in range(REPEAT):
+        start = timeit.default_timer()
+        for key in keys:
+            key in table
+        elapsed = timeit.default_timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run() -> None:
+    words = load_words()
+    print(f"{'load':>6}{'table':>10}{'hit (ns/op)':>14}{'miss (ns/op)':>15}{'probes/insert':>15}")
+    for load in LOADS:
+        count = int(load * CAPACITY)
+        present, absent = words[:count], words[count:2 * count]
+        for name, table_type in [("linear", FullLinearProbeHashTable), ("swiss", SwissHashTable)]:
+            table = table_type(HASH_BASE, CAPACITY, False)
+            for key in present:
+                table[key] = 1
+            probes = table.getProbeChainCounter() / count
+            hit = best_lookup_time(table, present) / count
+            miss = best_lookup_time(table, absent) / len(absent)
+            print(f"{load:>6.2f}{name:>10}{1e9 * hit:>14.0f}{1e9 * miss:>15.0f}{probes:>15.2f}")
+
+
+if __name__ == '__main__':
+    run()
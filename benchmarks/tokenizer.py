@@ -0,0 +1,61 @@
+""" Tokenizer throughput on the bundled corpora.
+
+Compares the per-token split/strip(punctuation)/lower loop that
+Frequency.add_file used to run with tokenizer.read_tokens, reading each
+file from disk every repetition and keeping the best of REPEAT runs.
+"""
+__docformat__ = 'reStructuredText'
+
+import os
+import timeit
+from string import punctuation
+from tokenizer import read_tokens
+
+FILENAMES = ["215-0.txt", "english_small.txt", "english_large.txt", "french.txt"]
+REPEAT = 5
+
+
+def split_strip(filename: str) -> int:
+    """ The old tokenization loop; returns the number of tokens """
+    tokens = 0
+    with open(filename, encoding='UTF-8') as file:
+        for line in file:
+            for word in line.split():
+                word = word.strip(punctuation)
+                word = word.lower()
+                tokens += 1
+    return tokens
+
+
+def buffered(filename: str) -> int:
+    """ tokenizer.read_tokens; returns the number of tokens """
+    tokens = 0
+    with open(filename, encoding='UTF-8') as file:
+        for words in read_tokens(file):
+            tokens += len(words)
+    return tokens
+
+
+def best_time(function, filename: str) -> tuple:
+    """ Returns the number of tokens and the best time of REPEAT calls """
+    best = None
+    for _ in range(REPEAT):
+        start = timeit.default_timer()
+        tokens = function(filename)
+        elapsed = timeit.default_timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return tokens, best
+
+
+def run() -> None:
+    """ Prints MB/s and tokens/s of both tokenizers for every corpus """
+    print(f"{'file':<20}{'tokenizer':<14}{'tokens':>10}{'MB/s':>10}{'Mtokens/s':>12}")
+    for filename in FILENAMES:
+        megabytes = os.path.getsize(filename) / 1e6
+        for name, function in [("split/strip", split_strip), ("read_tokens", buffered)]:
+            tokens, elapsed = best_time(function, filename)
+            print(f"{filename:<20}{name:<14}{tokens:>10}{megabytes / elapsed:>10.1f}{tokens / elapsed / 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    run()
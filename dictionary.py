@@ -1,100 +1,197 @@
-import timeit
-from hash_table import LinearProbeHashTable
-from typing import Tuple
+from time import perf_counter
+from hash_table import HashTable, LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable, \
+    SeparateChainingHashTable, SwissHashTable
+from referential_array import ArrayR
+from prefix_index import PrefixIndex
+from suggestions import SpellingSuggester
+from typing import Dict, Tuple, Iterable, List, Type
+from tokenizer import read_lines, tokenize
+from profiling import span
 
 
 class Statistics:
     """
     Statistics class is a class to output all the counters and other elements
     required for analysis in csv format.
+
+    constants:
+        CSV_HEADER: the columns of the csv file written by table_load_statistics
     """
+    CSV_HEADER = ["FileName", "Table Size", "Hash Base", "Total Words", "Total Collision", "Total Probe Length",
+                  "Maximum Probe Length", "Rehash Count", "Reseed Count", "Final Hash Base", "Loading Time",
+                  "Table Type"]
 
-    def load_statistics(self, hash_base: int, table_size: int, filename: str, max_time: int) -> Tuple:
+    def __load(self, hash_base: int, table_size: int, filename: str, max_time: int,
+               table_type: Type[HashTable]) -> Tuple:
         """
-        load statistics is a method that creates an instance of Dictionary and time the loading time to see if it
-        exceeds its determined max_time and also it calls a statistics method from LinearProbe class to get all the
-        counter value.
-
-        :param hash_base: a base for hash table
-        :type hash_base: int
-        :param table_size: a size of the hash table
-        :type table_size: int
-        :param filename: a file to be processed with
-        :type filename: str
-        :param max_time: a limit for loading time of a file
-        :type max_time: int
-        :return: words, time, collision_count, probe_total, probe_max, rehash_count
-        :complexity: O(1)
+        Loads filename into a new Dictionary, stopping once max_time has passed
+        :return: the dictionary, the number of words loaded and the loading time (max_time if it was exceeded)
+        :complexity: O(N) where N is the number of words in filename
         """
-        dictionary = Dictionary(hash_base, table_size)
+        dictionary = Dictionary(hash_base, table_size, table_type)
 
         try:
-            start_time = timeit.default_timer()
+            start_time = perf_counter()
             words = dictionary.load_dictionary(filename, max_time)
-            end_time = timeit.default_timer()
-            collision_count, probe_total, probe_max, rehash_count = dictionary.hash_table.statistics()
+            end_time = perf_counter()
             time = end_time - start_time
 
         except TimeoutError:
             words = len(dictionary.hash_table)
             time = max_time
             print(f"Loading time has exceeded the limit of {max_time}")
-            collision_count, probe_total, probe_max, rehash_count = dictionary.hash_table.statistics()
 
-        return words, time, collision_count, probe_total, probe_max, rehash_count
+        return dictionary, words, time
 
-    def table_load_statistics(self, max_time: int) -> None:
+    def load_statistics(self, hash_base: int, table_size: int, filename: str, max_time: int,
+                        table_type: Type[HashTable] = LinearProbeHashTable) -> Tuple:
         """
-        This method opens a writeable csv file and writes all the required values in a proper format.
-        It uses three for loop to create 27 combinations from three arrays of table_size, filename, base_list.
+        load statistics is a method that creates an instance of Dictionary and time the loading time to see if it
+        exceeds its determined max_time and also it calls a statistics method from the hash table class to get all
+        the counter value.
 
+        :param hash_base: a base for hash table
+        :type hash_base: int
+        :param table_size: a size of the hash table
+        :type table_size: int
+        :param filename: a file to be processed with
+        :type filename: str
         :param max_time: a limit for loading time of a file
         :type max_time: int
-        :return: None
-        :complexity: O(N)
+        :param table_type: the hash table class the dictionary uses
+        :type table_type: Type[HashTable]
+        :return: words, time, collision_count, probe_total, probe_max, rehash_count, reseed_count
+        :complexity: O(N) where N is the number of words in filename
         """
+        dictionary, words, time = self.__load(hash_base, table_size, filename, max_time, table_type)
+        return (words, time) + dictionary.hash_table.statistics()
+
+    def table_load_statistics(self, max_time: int,
+                              table_types: Iterable[Type[HashTable]] = (LinearProbeHashTable,),
+                              output: str = 'output_task2.csv', histogram_output: str = 'output_task2.jsonl',
+                              resume: bool = True, table_sizes: Iterable[int] = (250727, 402221, 1000081),
+                              filenames: Iterable[str] = ("french.txt", "english_small.txt", "english_large.txt"),
+                              hash_bases: Iterable[int] = (1, 27183, 250726)) -> None:
+        """
+        This method writes the statistics of loading every combination of table_sizes, filenames and hash_bases
+        (27 of them by default) for each of the table_types, so probing strategies can be compared row by row.
 
-        file = open('output_task2.csv', 'w')
-
-        file.write("FileName" + "," + "Table Size" + "," + "Hash Base" + "," + "Total Words" + "," + "Total Collision"
-                   + "," + "Total Probe Length" + "," + "Maximum Probe Length" + ","
-                   + "Rehash Count" + "," + "Loading Time" + "\n")
+        Each combination is written as a csv row to output as soon as it is loaded, and as a JSON line to
+        histogram_output with the same values and the probe histogram of the table (how many inserts had a probe
+        chain of 0, 1, 2, ...). Both files are flushed after every combination, so a sweep that is stopped or
+        crashes keeps what it has done. When resuming, the combinations already in output are skipped and new
+        ones are appended to both files; a combination whose JSON line was written just before a crash can appear
+        twice in histogram_output, and the last line counts.
 
-        table_size = [250727, 402221, 1000081]
-        filename = ["french.txt", "english_small.txt", "english_large.txt"]
-        base_list = [1, 27183, 250726]
+        Tables re-seed a hash base that clusters badly, so "Hash Base" is the base a combination asked for and
+        "Final Hash Base" the one the table ended up with (they differ when "Reseed Count" isn't 0).
 
-        for index_base in base_list:
-            for index_table in table_size:
-                for index_file in filename:
-                    words, time, collision_count, probe_total, probe_max, rehash_count = self.load_statistics(index_base, index_table, index_file, max_time)
-                    file.write(index_file + "," + str(index_table) + "," + str(index_base) + "," + str(words)
-                               + "," + str(collision_count) + "," + str(probe_total) + "," + str(probe_max)
-                               + "," + str(rehash_count) + "," + str(time) + "\n"
-                               )
-        file.close()
+        :param max_time: a limit for loading time of a file
+        :type max_time: int
+        :param table_types: the hash table classes to compare
+        :type table_types: Iterable[Type[HashTable]]
+        :param output: the csv file
+        :type output: str
+        :param histogram_output: the JSON Lines file
+        :type histogram_output: str
+        :param resume: whether to carry on from the combinations already in output rather than starting over
+        :type resume: bool
+        :param table_sizes: the table sizes to sweep
+        :type table_sizes: Iterable[int]
+        :param filenames: the files to load
+        :type filenames: Iterable[str]
+        :param hash_bases: the hash bases to sweep
+        :type hash_bases: Iterable[int]
+        :raises ValueError: when resuming from an output whose columns aren't CSV_HEADER
+        :return: None
+        :complexity: O(N) where N is the total number of words loaded
+        """
+        import csv
+        import json
+        import os
+
+        table_sizes, filenames, hash_bases = tuple(table_sizes), tuple(filenames), tuple(hash_bases)
+        done = set()
+        if resume and os.path.exists(output) and os.path.getsize(output) > 0:
+            with open(output, newline='') as file:
+                reader = csv.reader(file)
+                if next(reader) != self.CSV_HEADER:
+                    raise ValueError(f"{output} has different columns, so it can't be resumed")
+                for row in reader:
+                    if row:
+                        done.add((row[0], row[1], row[2], row[-1]))
+        else:
+            resume = False
+
+        mode = 'a' if resume else 'w'
+        with open(output, mode, newline='') as file, open(histogram_output, mode) as histogram_file:
+            writer = csv.writer(file)
+            if not resume:
+                writer.writerow(self.CSV_HEADER)
+                file.flush()
+
+            for table_type in table_types:
+                for index_base in hash_bases:
+                    for index_table in table_sizes:
+                        for index_file in filenames:
+                            if (index_file, str(index_table), str(index_base), table_type.__name__) in done:
+                                continue
+                            dictionary, words, time = self.__load(index_base, index_table, index_file, max_time,
+                                                                  table_type)
+                            hash_table = dictionary.hash_table
+                            collision_count, probe_total, probe_max, rehash_count, reseed_count = \
+                                hash_table.statistics()
+
+                            histogram_file.write(json.dumps({
+                                "file": index_file, "table_size": index_table, "hash_base": index_base,
+                                "table_type": table_type.__name__, "words": words, "time": time,
+                                "collisions": collision_count, "probe_total": probe_total, "probe_max": probe_max,
+                                "rehashes": rehash_count, "reseeds": reseed_count,
+                                "final_hash_base": hash_table.hash_base,
+                                "probe_histogram": hash_table.probe_histogram()}) + "\n")
+                            histogram_file.flush()
+                            writer.writerow([index_file, index_table, index_base, words, collision_count,
+                                             probe_total, probe_max, rehash_count, reseed_count,
+                                             hash_table.hash_base, time, table_type.__name__])
+                            file.flush()
 
 
 class Dictionary:
     """
-    Dictionary class creates an instance of LinearProbeHashTable class to create a hash table.
+    Dictionary class creates an instance of LinearProbeHashTable class (or another HashTable, see table_type) to
+    create a hash table.
     Then, it prints out a menu where a user can choose whether to load its file, add a word, find a word, or
     delete a word.
+
+    The prefix_index used for prefix queries and the suggester used for spelling suggestions are built from the
+    hash table on the first query after the words change (None until then), so loading or editing the
+    dictionary never pays for building them.
+
+    Every word is stored in the hash table with a dense integer ID as its data, assigned in the order the words
+    are first added (next_id is the ID the next new word gets). IDs of deleted words are not reused. words, the
+    array from ID back to word, is likewise only built when asked for.
     """
 
-    def __init__(self, hash_base: int, table_size: int) -> None:
+    def __init__(self, hash_base: int, table_size: int,
+                 table_type: Type[HashTable] = LinearProbeHashTable) -> None:
         """
         A constructor of Dictionary class
         :param hash_base: a base for hash table
         :type hash_base: int
         :param table_size: a size of hash table
         :type table_size: int
+        :param table_type: the hash table class to store the words in
+        :type table_type: Type[HashTable]
         :return None:
         :complexity: O(1)
         """
         self.hash_base = hash_base
         self.table_size = table_size
-        self.hash_table = LinearProbeHashTable(self.hash_base, self.table_size)
+        self.hash_table = table_type(self.hash_base, self.table_size)
+        self.prefix_index = None
+        self.suggester = None
+        self.next_id = 0
+        self.words = None
 
     def load_dictionary(self, filename: str, time_limit: int = None) -> int:
         """
@@ -108,27 +205,40 @@ class Dictionary:
         :complexity: O(N) for best/worst
         :pre: time_limit < elapsed_time
         """
-        start_time = timeit.default_timer()
-        file = open(filename, encoding='UTF-8')
-
-        if type(time_limit) is int:  # time limit
-            for word in file:
-                self.hash_table.insert(word.rstrip(), 1)
-                elapsed_time = timeit.default_timer() - start_time
-
-                if time_limit < elapsed_time:
-                    file.close()
-                    raise TimeoutError("TimeoutError has occurred")
+        with span("dictionary.load"):
+            start_time = perf_counter()
+            with span("dictionary.read"):
+                file = open(filename, encoding='UTF-8')
+                words = read_lines(file)
+                file.close()
+            self.__words_changed()
+
+            with span("dictionary.insert"):
+                if type(time_limit) is int:  # time limit
+                    for word in words:
+                        if self.hash_table.setdefault(word, self.next_id) == self.next_id:
+                            self.next_id += 1
+                        elapsed_time = perf_counter() - start_time
+
+                        if time_limit < elapsed_time:
+                            raise TimeoutError("TimeoutError has occurred")
+
+                else:  # no time limit
+                    for word in words:
+                        if self.hash_table.setdefault(word, self.next_id) == self.next_id:
+                            self.next_id += 1
 
-            file.close()
             return len(self.hash_table)
 
-        else:  # no time limit
-            for word in file:
-                self.hash_table.insert(word.rstrip(), 1)
-
-            file.close()
-            return len(self.hash_table)
+    def __words_changed(self) -> None:
+        """
+        Drops everything built from the words, to be rebuilt on its next use.
+        :return None:
+        :complexity: O(1)
+        """
+        self.prefix_index = None
+        self.suggester = None
+        self.words = None
 
     def add_word(self, word: str) -> None:
         """
@@ -138,7 +248,9 @@ class Dictionary:
         :return None:
         :complexity: O(1)
         """
-        self.hash_table.insert(word.lower(), 1)
+        if self.hash_table.setdefault(word.lower(), self.next_id) == self.next_id:
+            self.next_id += 1
+        self.__words_changed()
 
     def find_word(self, word: str) -> bool:
         """
@@ -154,6 +266,88 @@ class Dictionary:
         else:
             return False
 
+    def find_words(self, words: Iterable[str]) -> List[bool]:
+        """
+        Batch version of find_word. Repeated words are only hashed and probed once, and every distinct word
+        is looked up in a single pass over the hash table.
+        :param words: the words to be found from the hash_table
+        :type words: Iterable[str]
+        :return: a list with, for each word in order, whether it exists in the hash table
+        :complexity: O(N + U * P) where N is the number of words, U the number of distinct words and P the
+                     cost of one probe
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+        found = dict(zip(unique, self.hash_table.contains_many(unique)))
+        return [found[word] for word in words]
+
+    def pooled_words(self, words: Iterable[str]) -> List[str]:
+        """
+        Batch lookup returning the hash table's own string for each known word, in order, and leaving out
+        unknown words. The dictionary acts as a key pool: tables that store the returned strings share them with
+        the dictionary instead of each holding their own copy of the word.
+        :param words: the words to be looked up
+        :type words: Iterable[str]
+        :return: a list of the dictionary's strings for the known words
+        :complexity: same as find_words
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+        pooled = dict(zip(unique, self.hash_table.lookup_keys(unique)))
+        return [key for key in map(pooled.__getitem__, words) if key is not None]
+
+    def word_ids(self, words: Iterable[str]) -> List[int]:
+        """
+        Batch lookup returning the ID of each known word, in order, and leaving out unknown words.
+        :param words: the words to be looked up
+        :type words: Iterable[str]
+        :return: a list of the IDs of the known words
+        :complexity: same as find_words
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+        ids = dict(zip(unique, self.hash_table.lookup_items(unique)))
+        return [item[1] for item in map(ids.__getitem__, words) if item is not None]
+
+    def get_words(self) -> ArrayR:
+        """
+        Returns the array from word ID to word, holding None for the IDs of deleted words, building it from the
+        hash table if the words changed since it was last built.
+        :return: an ArrayR of length next_id (at least 1)
+        :complexity: O(1) if up to date, O(N) otherwise where N is the table size
+        """
+        if self.words is None:
+            self.words = ArrayR(max(1, self.next_id))
+            for word, word_id in self.hash_table.items():
+                self.words[word_id] = word
+        return self.words
+
+    def filter_known(self, words: Iterable[str]) -> List[str]:
+        """
+        Returns the words that exist inside the hash table, in their original order.
+        :param words: the words to be filtered
+        :type words: Iterable[str]
+        :return: a list of the known words
+        :complexity: same as find_words
+        """
+        words = list(words)
+        return [word for word, found in zip(words, self.find_words(words)) if found]
+
+    def check_file(self, filename: str) -> Tuple[int, List[str]]:
+        """
+        Checks every word of a text file against the dictionary in one batch. Words are found by
+        tokenizer.tokenize.
+        :param filename: a file to be checked
+        :type filename: str
+        :return: the number of words checked and the distinct unknown words, in order of first appearance
+        :complexity: same as find_words
+        :raises FileNotFoundError: when the file does not exist
+        """
+        with open(filename, encoding='UTF-8') as file:
+            words = tokenize(file.read())
+        unknown = dict.fromkeys(word for word, found in zip(words, self.find_words(words)) if not found)
+        return len(words), list(unknown)
+
     def delete_word(self, word: str) -> None:
         """
         This method uses del to enable deleting a word inside a hash table.
@@ -164,6 +358,54 @@ class Dictionary:
         """
         # self.hash_table.__delitem__(word)
         del self.hash_table[word.lower()]
+        self.__words_changed()
+
+    def words_with_prefix(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Returns the words of the dictionary starting with prefix, in sorted order.
+        :param prefix: the prefix to complete
+        :type prefix: str
+        :param limit: the maximum number of words to return, or None for all of them
+        :type limit: int or None
+        :return: a list of the matching words
+        :complexity: O(log N + M) comparisons where M is the number of words returned, plus O(N log N) to
+                     rebuild the prefix index if the words changed since the last query
+        """
+        return self.get_prefix_index().words_with_prefix(prefix, limit)
+
+    def get_prefix_index(self) -> PrefixIndex:
+        """
+        Returns the prefix index, building it from the hash table if the words changed since it was last built.
+        :return: the PrefixIndex over the current words
+        :complexity: O(1) if up to date, O(N log N) otherwise
+        """
+        if self.prefix_index is None:
+            self.prefix_index = PrefixIndex(self.hash_table.keys())
+        return self.prefix_index
+
+    def suggest(self, word: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Suggests corrections for a misspelt word.
+        :param word: the word to find corrections for
+        :type word: str
+        :param limit: the maximum number of suggestions
+        :type limit: int
+        :return: up to limit (word, edit distance) pairs within edit distance 2, closest first
+        :complexity: see SpellingSuggester.suggest, plus building the suggester if the words changed since the
+                     last suggestion
+        """
+        return self.get_suggester().suggest(word.lower(), limit)
+
+    def get_suggester(self) -> SpellingSuggester:
+        """
+        Returns the spelling suggester, building it from the hash table if the words changed since it was last
+        built.
+        :return: the SpellingSuggester over the current words
+        :complexity: O(1) if up to date, O(N) otherwise where N is the number of words
+        """
+        if self.suggester is None:
+            self.suggester = SpellingSuggester(self.hash_table.keys())
+        return self.suggester
 
     def menu(self) -> None:
         """
@@ -176,7 +418,8 @@ class Dictionary:
         print('2.␣add a word')
         print('3.␣find a word')
         print('4.␣delete a word')
-        print('5.␣quit')
+        print('5.␣check a file')
+        print('6.␣quit')
 
     def menu_select(self):
         """
@@ -236,14 +479,179 @@ class Dictionary:
                     print("The word you entered is successfully deleted from the dictionary")
 
             elif command == 5:
+                user_filename = str(input("Enter a name of the file to check\n"))
+                try:
+                    total, unknown = self.check_file(user_filename)
+                except FileNotFoundError:
+                    raise FileNotFoundError(
+                        "File name that you entered could not be found. Please enter the correct file "
+                        "name.")
+                print(f"{total} words checked, {len(unknown)} distinct words do not exist in the dictionary")
+                for word in unknown:
+                    print(word)
+
+            elif command == 6:
                 selected_quit = True
             else:
                 print("Invalid option number. Please try again with valid number")
 
 
+class MultiDictionary:
+    """
+    MultiDictionary loads the word lists of several languages into one shared hash table instead of one
+    Dictionary each. Every word is stored with a bitmask of the languages whose lists contain it as its data
+    (bit i is languages[i]), so a single probe answers which languages know a word, where separate dictionaries
+    cost one probe per language.
+
+    load_dictionaries reads the lists in parallel, on a thread each, then grows the table once for all of their
+    entries and inserts them on the caller's thread (the hash tables aren't thread safe). Growing up front
+    matters more than it would for one list: the lists together are several times the size of any one of them,
+    and rehashing the shared table as it fills up would cost more than the inserts themselves.
+
+    constants:
+        MAX_LANGUAGES: the most languages a mask can hold, so that masks fit the int64 data of PackedKeyHashTable
+    """
+    MAX_LANGUAGES = 63
+
+    def __init__(self, hash_base: int, table_size: int,
+                 table_type: Type[HashTable] = LinearProbeHashTable) -> None:
+        """
+        A constructor of MultiDictionary class
+        :param hash_base: a base for hash table
+        :param table_size: a size of hash table
+        :param table_type: the hash table class to store the words in
+        :complexity: O(1)
+        """
+        self.hash_table = table_type(hash_base, table_size)
+        self.languages = []
+
+    def __language_bit(self, language: str) -> int:
+        """
+        Returns the bit of language, giving it the next free bit if it is new
+        :complexity: O(L) where L is the number of languages
+        """
+        if language not in self.languages:
+            self.languages.append(language)
+        return 1 << self.languages.index(language)
+
+    @staticmethod
+    def __read(filename: str) -> List[str]:
+        """
+        Returns the entries of a word list file. Run on a reader thread by load_dictionaries.
+        :complexity: O(N) where N is the size of the file
+        :raises FileNotFoundError: when the file does not exist
+        """
+        with open(filename, encoding='UTF-8') as file:
+            return read_lines(file)
+
+    def __insert(self, words: List[str], bit: int) -> None:
+        """
+        Adds bit to the mask of every word, inserting the words that are new with bit as their mask.
+        New words are probed once; only words already known in another language are probed a second time.
+        :complexity: O(N * P) where N is the number of words and P the cost of one probe
+        """
+        table = self.hash_table
+        for word in words:
+            mask = table.setdefault(word, bit)
+            if not mask & bit:
+                table[word] = mask | bit
+
+    def load_dictionaries(self, filenames: Dict[str, str]) -> int:
+        """
+        Loads the word list of each language, reading the files in parallel. Loading another list for a
+        language that is already loaded adds its words to that language.
+        :param filenames: the word list file of each language, by language name
+        :return: the number of distinct words over all the languages
+        :complexity: O(N * P) where N is the total number of entries and P the cost of one probe
+        :raises FileNotFoundError: when one of the files does not exist, in which case none of them is loaded
+        :raises ValueError: when there would be more than MAX_LANGUAGES languages
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if len(set(self.languages).union(filenames)) > self.MAX_LANGUAGES:
+            raise ValueError(f"A MultiDictionary holds at most {self.MAX_LANGUAGES} languages")
+        with span("multi_dictionary.load"):
+            with span("multi_dictionary.read"), ThreadPoolExecutor(max_workers=max(1, len(filenames))) as readers:
+                lists = list(readers.map(self.__read, filenames.values()))
+            bits = [self.__language_bit(language) for language in filenames]
+            with span("multi_dictionary.insert"):
+                # words in several lists are counted once per list, so this can leave the table larger than it needs
+                self.hash_table.reserve(len(self.hash_table) + sum(map(len, lists)))
+                for words, bit in zip(lists, bits):
+                    self.__insert(words, bit)
+        return len(self.hash_table)
+
+    def __names(self, mask: int) -> List[str]:
+        """
+        Returns the languages whose bits are set in mask, in the order they were loaded
+        :complexity: O(L) where L is the number of languages
+        """
+        return [language for i, language in enumerate(self.languages) if mask >> i & 1]
+
+    def find_languages(self, word: str) -> List[str]:
+        """
+        Returns the languages that contain word, in the order they were loaded, with a single probe
+        :param word: the word to be found
+        :return: the names of the languages containing word, empty if none does
+        :complexity: O(P + L) where P is the cost of one probe and L the number of languages
+        """
+        return self.__names(self.hash_table.get(word, 0))
+
+    def language_masks(self, words: Iterable[str]) -> List[int]:
+        """
+        Batch version of find_languages returning language bitmasks (bit i for languages[i], 0 for an unknown
+        word). Repeated words are only probed once, in a single pass over the hash table.
+        :param words: the words to be looked up
+        :return: a list with the mask of each word, in order
+        :complexity: O(N + U * P) where N is the number of words, U the number of distinct words and P the
+                     cost of one probe
+        """
+        words = list(words)
+        unique = list(dict.fromkeys(words))
+        masks = {word: 0 if item is None else item[1]
+                 for word, item in zip(unique, self.hash_table.lookup_items(unique))}
+        return [masks[word] for word in words]
+
+    def coverage(self, filename: str) -> Tuple[int, Tuple[int, ...], int]:
+        """
+        Checks every word of a text file against all the languages in one batch. Words are found by
+        tokenizer.tokenize.
+        :param filename: a file to be checked
+        :return: the number of words checked, the number known by each language (in the order of languages) and
+                 the number known by none of them
+        :complexity: O(N + U * P + M * L) where N is the number of words, U the number of distinct words, P the
+                     cost of one probe, M the number of distinct masks and L the number of languages
+        :raises FileNotFoundError: when the file does not exist
+        """
+        with open(filename, encoding='UTF-8') as file:
+            words = tokenize(file.read())
+        # tally the (few) distinct masks first, so each word costs one dict update rather than one per language
+        tally = {}
+        for mask in self.language_masks(words):
+            tally[mask] = tally.get(mask, 0) + 1
+        known = tuple(sum(count for mask, count in tally.items() if mask >> i & 1)
+                      for i in range(len(self.languages)))
+        return len(words), known, tally.get(0, 0)
+
+    def coverage_report(self, filename: str) -> str:
+        """
+        Returns the coverage of a text file as a table with the words known and their share for each language,
+        and for none of them
+        :param filename: a file to be checked
+        :complexity: same as coverage
+        :raises FileNotFoundError: when the file does not exist
+        """
+        total, known, unknown = self.coverage(filename)
+        lines = [f"{filename}: {total} words", f"{'Language':<12}{'Words':>10}{'Share':>9}"]
+        for language, count in zip(self.languages + ["(none)"], known + (unknown,)):
+            lines.append(f"{language:<12}{count:>10}{count / max(1, total):>9.1%}")
+        return "\n".join(lines)
+
+
 if __name__ == '__main__':
     stats = Statistics()
-    stats.table_load_statistics(10)
+    stats.table_load_statistics(10, [LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable,
+                                     SeparateChainingHashTable, SwissHashTable])
 
 
 
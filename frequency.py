@@ -2,9 +2,17 @@ from hash_table import LinearProbeHashTable
 from dictionary import Dictionary
 from list_adt import ArrayList
 from enum import Enum
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Iterator
+from array import array
+from collections import Counter
+from itertools import chain, compress
+from operator import itemgetter
+import heapq
 import random
-from string import punctuation
+import threading
+from tokenizer import read_tokens
+from profiling import span
+import profiling
 import sys
 
 
@@ -24,76 +32,361 @@ class Frequency:
     Frequency class is a class that keeps tack of words and their occurrences from an updated
     file and create a ranking system.
 
+    Occurrences are kept in one of two ways. By default they are the data of a second hash table
+    keyed by word. With word_ids, they are kept in an array('l') indexed by the word IDs the
+    dictionary assigns, so counting a word costs one dictionary probe and one array increment, and
+    no second hash table is allocated at all.
+
+    Nothing is loaded or allocated up front: the dictionary is loaded from DICTIONARY_FILE the first
+    time it is needed, and the hash table or counts array is allocated the first time it is used, so
+    creating a Frequency is instant. With preload, the dictionary is instead loaded on a background
+    thread straight away, and its first use waits for it, which hides the load behind whatever the
+    caller does in between (such as waiting for input).
+
+    constants:
+        DICTIONARY_FILE: The word list words are counted against.
+        HASH_BASE: The hash base of the dictionary and the hash table.
+        TABLE_SIZE: The initial size of the dictionary and the hash table.
+
     attributes:
-        hash_table: An instance of LinearProbeHashTable.
-        dictionary: An instance of Dictionary.
-        max_word_arr: A list of a tuple that contains word and its occurrence data.
-        max_word: A tuple of a word with the highest occurrence.
+        hash_table: An instance of LinearProbeHashTable, or None with word_ids (allocated on first use).
+        counts: An array('l') of occurrences indexed by word ID with word_ids, or None otherwise
+                (allocated on first use).
+        word_ids: Whether occurrences are kept by word ID.
+        dictionary: An instance of Dictionary (loaded on first use).
+        count_frequency: An ArrayList where position c holds the number of words occurring c times.
+        max_count: The highest occurrence of any word.
+        max_key: A word (or word ID) that occurs (or last occurred) max_count times, see max_word.
+        common_threshold: Occurrences needed for a word to be COMMON (1% of the highest occurrence).
+        rare_threshold: Occurrences below which a word is RARE (0.1% of the highest occurrence).
     """
 
-    def __init__(self) -> None:
-        """
-        We create an instance of dictionary and load a dictionary that is used to
-        evaluate an occurrence of a word. Also, hash table is created with an instance of
-        LinearProbeHashTable.
+    DICTIONARY_FILE = "english_large.txt"
+    HASH_BASE = 250726
+    TABLE_SIZE = 1000081
 
+    def __init__(self, word_ids: bool = False, preload: bool = False) -> None:
+        """
+        The dictionary used to evaluate an occurrence of a word, and the hash table (an instance of
+        LinearProbeHashTable, or the counts array if word_ids is set) are only created when first
+        used; see the dictionary, hash_table and counts properties.
+
+        :param word_ids: Whether to count by word ID instead of in a hash table.
+        :type word_ids: bool
+        :param preload: Whether to start loading the dictionary on a background thread now.
+        :type preload: bool
         :complexity: O(1)
-        :pre: it must call the correct name of the file for self.dictionary.load_dictionary()
+        :pre: DICTIONARY_FILE must be the name of a file that exists
+        """
+        with span("frequency.init"):
+            self.__dictionary = None
+            self.__hash_table = None
+            self.__counts = None
+            self.__loader = None
+            self.__load_error = None
+            self.word_ids = word_ids
+            if preload:
+                self.__loader = threading.Thread(target=self.__load_dictionary, daemon=True)
+                self.__loader.start()
+            self.count_frequency = ArrayList(1)
+            self.count_frequency.append(0)
+            self.max_count = 0
+            self.max_key = None
+            self.common_threshold = 0
+            self.rare_threshold = 0
+            self.sorted_arr = list()
+
+    def __load_dictionary(self) -> None:
+        """
+        Loads the dictionary from DICTIONARY_FILE. Run on the loader thread with preload, where an error
+        is kept to be raised on the caller's thread when it next uses the dictionary.
+
+        :return: None
+        :complexity: O(N) where N is the number of words in DICTIONARY_FILE
+        """
+        try:
+            with span("frequency.load_dictionary"):
+                dictionary = Dictionary(self.HASH_BASE, self.TABLE_SIZE)
+                dictionary.load_dictionary(self.DICTIONARY_FILE)
+            self.__dictionary = dictionary
+        except Exception as error:
+            if self.__loader is None:
+                raise
+            self.__load_error = error
+
+    @property
+    def dictionary(self) -> Dictionary:
+        """
+        The dictionary of known words, loaded on first use, or waited for if it is being preloaded.
+
+        :return: Dictionary
+        :complexity: O(1) once loaded, O(N) for the first use where N is the number of words in DICTIONARY_FILE
+        :raises: FileNotFoundError when DICTIONARY_FILE does not exist
+        """
+        if self.__dictionary is None:
+            if self.__loader is not None:
+                with span("frequency.wait_for_dictionary"):
+                    self.__loader.join()
+                self.__loader = None
+                if self.__load_error is not None:
+                    error, self.__load_error = self.__load_error, None
+                    raise error
+            else:
+                self.__load_dictionary()
+        return self.__dictionary
+
+    def __allocate(self) -> None:
+        """
+        Allocates the hash table, or with word_ids the counts array (which needs the dictionary), unless
+        already done.
+
+        :return: None
+        :complexity: O(1) once allocated, O(TABLE_SIZE) or O(N) where N is the number of word IDs otherwise
+        """
+        if self.word_ids:
+            if self.__counts is None:
+                next_id = self.dictionary.next_id
+                with span("frequency.allocate"):
+                    self.__counts = array('l', [0]) * max(1, next_id)
+        elif self.__hash_table is None:
+            with span("frequency.allocate"):
+                self.__hash_table = LinearProbeHashTable(self.HASH_BASE, self.TABLE_SIZE)
+
+    @property
+    def hash_table(self) -> LinearProbeHashTable:
+        """
+        The occurrences keyed by word, allocated on first use, or None with word_ids.
+
+        :return: LinearProbeHashTable
+        :complexity: see __allocate
+        """
+        if not self.word_ids:
+            self.__allocate()
+        return self.__hash_table
+
+    @property
+    def counts(self) -> array:
+        """
+        The occurrences indexed by word ID with word_ids, allocated on first use, or None otherwise.
+
+        :return: array('l')
+        :complexity: see __allocate
+        """
+        if self.word_ids:
+            self.__allocate()
+        return self.__counts
+
+    def __read_key_batches(self, filename: str) -> Iterator[List]:
         """
-        self.hash_table = LinearProbeHashTable(250726, 1000081)
-        self.dictionary = Dictionary(250726, 1000081)
-        self.dictionary.load_dictionary("english_large.txt")
-        self.max_word_arr = list()
-        self.max_word = tuple()
-        self.sorted_arr = list()
+        Yields the words of a file that appear in the dictionary, one list per batch of tokenizer.read_tokens.
+        Each batch of words is looked up in the dictionary at once. With word_ids the word IDs are
+        yielded, otherwise the dictionary's own strings, so that hash_table shares its keys with the
+        dictionary rather than keeping copies.
+
+        :param filename: A name of a file to be read
+        :type filename: String
+        :return: Iterator of lists of words or word IDs
+        :complexity: O(N) where N is the number of words in the file
+        :raises: FileNotFoundError when a file name does not exist
+        """
+        try:
+            file = open(filename, encoding='UTF-8')
+        except FileNotFoundError:
+            raise FileNotFoundError("The file name does not exist.")
+
+        with file:
+            batches = read_tokens(file)
+            while True:
+                with span("frequency.tokenize"):
+                    words = next(batches, None)
+                if words is None:
+                    return
+                with span("frequency.lookup"):
+                    if self.word_ids:
+                        keys = self.dictionary.word_ids(words)
+                    else:
+                        keys = self.dictionary.pooled_words(words)
+                yield keys
+
+    def __read_keys(self, filename: str) -> Iterator:
+        """
+        Yields every word (or word ID with word_ids) of a file that appears in the dictionary.
+
+        :param filename: A name of a file to be read
+        :type filename: String
+        :return: Iterator of words or word IDs
+        :complexity: O(N) where N is the number of words in the file
+        :raises: FileNotFoundError when a file name does not exist
+        """
+        return chain.from_iterable(self.__read_key_batches(filename))
+
+    def __occurrence(self, key) -> int:
+        """
+        Returns the occurrence of a word (or word ID with word_ids), 0 if it isn't counted.
+
+        :complexity: O(1) with word_ids, a single hash table lookup otherwise
+        """
+        if self.word_ids:
+            return self.counts[key] if key < len(self.counts) else 0
+        return self.hash_table.get(key, 0)
+
+    def __count(self, key, amount: int) -> None:
+        """
+        Adds amount (which may be negative) to the occurrence of a word (or word ID with word_ids),
+        removing it from hash_table once it reaches 0, and keeps count_frequency, max_count and the
+        thresholds up to date.
+
+        :param key: A word or word ID to be counted
+        :param amount: The change in its occurrence
+        :type amount: int
+        :return: None
+        :complexity: O(K + |amount|) where K is the size of the word, outside the hash table's own rehashing
+        :pre: the occurrence of key must be at least -amount
+        :pre: the hash table or counts array must be allocated
+        """
+        if self.word_ids:
+            counts = self.__counts
+            if key >= len(counts):  # words added to the dictionary after the array was made
+                counts.extend(array('l', [0]) * (key + 1 - len(counts)))
+            counts[key] += amount
+            new = counts[key]
+        else:
+            new = self.__hash_table.increment(key, amount)
+            if new == 0:
+                del self.__hash_table[key]
+        old = new - amount
+
+        if old > 0:
+            self.count_frequency[old] -= 1
+        if new > 0:
+            while len(self.count_frequency) <= new:
+                self.count_frequency.append(0)
+            self.count_frequency[new] += 1
+
+        if new >= self.max_count:
+            self.max_key = key
+            if new > self.max_count:
+                self.max_count = new
+                self.update_thresholds()
+        elif old == self.max_count and self.count_frequency[old] == 0:
+            while self.max_count > 0 and self.count_frequency[self.max_count] == 0:
+                self.max_count -= 1
+            self.update_thresholds()
 
     def add_file(self, filename: str) -> None:
         """
         It reads every word in a file and insert only a word that appears in english_large.txt
         file. It also keeps a track of how many times the word appears in the file to count its
-        occurrence. These data are also added in max_word_arr array.
+        occurrence. The highest occurrence and the rarity thresholds are kept up to date on every
+        word, so adding a file costs time proportional to that file only.
 
         :param filename: A name of a file to be added
         :type filename: String
         :return: None
-        :complexity: O(N^2) for the worst case and O(N) for the best case
+        :complexity: O(N) where N is the number of words in the file, outside the hash table's own rehashing
         :raises: FileNotFoundError when a file name does not exist
         :pre: filename should be the name of a file that exists.
 
         """
+        with span("frequency.add_file"):
+            self.__allocate()
+            for keys in self.__read_key_batches(filename):
+                with span("frequency.count"):
+                    for key in keys:
+                        self.__count(key, 1)
+
+    def remove_file(self, filename: str) -> None:
+        """
+        Takes the words of a previously added file back out of the counts, e.g. to slide a window over a
+        stream of files. Nothing changes if the file has words that aren't counted often enough, as then
+        it was never added.
 
-        try:
-            file = open(filename, encoding='UTF-8')
-        except FileNotFoundError:
-            raise FileNotFoundError("The file name does not exist.")
+        :param filename: A name of a file to be removed
+        :type filename: String
+        :return: None
+        :complexity: O(N) where N is the number of words in the file
+        :raises: FileNotFoundError when a file name does not exist
+        :raises: ValueError when the file was not added
+        """
+        counts = Counter(self.__read_keys(filename))
+        self.__allocate()
 
-        for line in file:
+        for key, count in counts.items():
+            if self.__occurrence(key) < count:
+                raise ValueError(f"{filename} was not added: '{self.__word(key)}' occurs fewer than {count} times.")
 
-            for word in line.split():
-                word = word.strip(punctuation)
-                word = word.lower()
+        for key, count in counts.items():
+            self.__count(key, -count)
 
-                if self.dictionary.find_word(word) is True:
-                    if word in self.hash_table:
-                        counter = self.hash_table[word]
-                        self.hash_table[word] = counter + 1
+    def __word(self, key) -> str:
+        """
+        Returns the word for a key, which is the word itself unless counting by word ID.
 
-                        for i in range(len(self.max_word_arr)):
-                            if self.max_word_arr[i][0] == word:
-                                list_ver = list(self.max_word_arr[i])
-                                list_ver[1] = counter + 1
-                                self.max_word_arr[i] = tuple(list_ver)
+        :complexity: O(1), after the dictionary's ID array is built
+        """
+        return self.dictionary.get_words()[key] if self.word_ids else key
 
-                        continue
+    @property
+    def max_word(self) -> tuple:
+        """
+        A tuple of a word with the highest occurrence, or an empty tuple if nothing is counted.
+        The word is remembered as the counts change, and only searched for if it has since dropped below
+        the highest occurrence.
 
-                    self.hash_table.insert(word, 1)
-                    tuple_data = (word, 1)
-                    self.max_word_arr.append(tuple_data)
+        :return: tuple
+        :complexity: O(1) for the best case, O(N) for the worst case where N is the table size
+        """
+        if self.max_count == 0:
+            return tuple()
+        if self.__occurrence(self.max_key) != self.max_count:
+            with span("frequency.max_word_scan"):
+                if self.word_ids:
+                    self.max_key = self.counts.index(self.max_count)
+                else:
+                    for word, count in self.hash_table.items():
+                        if count == self.max_count:
+                            self.max_key = word
+                            break
+        return self.__word(self.max_key), self.max_count
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """
+        Yields every counted (word, occurrence) pair, in no particular order.
+
+        :return: Iterator of tuples
+        :complexity: O(N) to exhaust where N is the table size, or the number of word IDs with word_ids
+        """
+        if not self.word_ids:
+            return self.hash_table.items()
+        words = self.dictionary.get_words()
+        counts = self.counts
+        return ((words[key], counts[key]) for key in compress(range(len(counts)), counts))
+
+    def update_thresholds(self) -> None:
+        """
+        Recomputes the rarity thresholds from max_count. Called whenever the highest occurrence changes, so
+        rarity doesn't have to divide on every call.
+
+        :return: None
+        :complexity: O(1)
+        """
+        self.common_threshold = self.max_count / 100
+        self.rare_threshold = self.max_count / 1000
 
-        file.close()
+    def classify(self, count: int) -> Rarity:
+        """
+        Returns the rarity of a word that occurs count times.
 
-        # Reference: https://www.geeksforgeeks.org/python-min-and-max-value-in-list-of-tuples/
-        self.max_word = (max(self.max_word_arr, key=lambda item: item[1]))  # finding a word with the highest occurrence
+        :param count: The occurrence of a word.
+        :type count: int
+        :return: Rarity
+        :complexity: O(1)
+        """
+        if count >= self.common_threshold:
+            return Rarity.COMMON
+        if count < self.rare_threshold:
+            return Rarity.RARE
+        return Rarity.UNCOMMON
 
     def rarity(self, word: str) -> Rarity:
         """
@@ -103,36 +396,105 @@ class Frequency:
         :param word: A word that is read for calculating its rarity score.
         :type word: String
         :return: Rarity
-        :complexity: O(N^2) for the worst case and O(N) for the best case
+        :complexity: O(K) for the best case and O(K + N) for the worst case, a single hash table lookup
         """
+        if profiling.enabled:
+            with span("frequency.rarity"):
+                return self.__rarity(word)
+        return self.__rarity(word)
 
-        word = word.lower()
-        if word in self.hash_table:
-            if self.hash_table[word] >= (self.max_word[1] / 100):
-                return Rarity.COMMON
-
-            if self.hash_table[word] < (self.max_word[1] / 1000):
-                return Rarity.RARE
+    def __rarity(self, word: str) -> Rarity:
+        """
+        The body of rarity, kept apart so that rarity only enters a profiling span when profiling is enabled.
 
-            if (self.max_word[1] / 100) > self.hash_table[word] >= (self.max_word[1] / 1000):
-                return Rarity.UNCOMMON
+        :complexity: same as rarity
+        """
+        if self.word_ids:
+            key = self.dictionary.hash_table.get(word.lower())
+            count = 0 if key is None else self.__occurrence(key)
         else:
+            count = self.hash_table.get(word.lower(), 0)
+        if count == 0:
             return Rarity.MISSPELT
+        return self.classify(count)
+
+    def classify_all(self) -> Dict[Rarity, List[str]]:
+        """
+        Sorts every counted word into its rarity bucket in one pass over the counts. MISSPELT is always
+        empty, as only dictionary words are counted.
+
+        :return: Dictionary from each Rarity to the list of its words
+        :complexity: O(N) where N is the table size
+        """
+        buckets = {rarity: [] for rarity in Rarity}
+        for word, count in self.items():
+            buckets[self.classify(count)].append(word)
+        return buckets
+
+    def rarity_counts(self) -> Dict[Rarity, int]:
+        """
+        Returns the number of counted words in each rarity bucket, for reporting.
+
+        :return: Dictionary from each Rarity to its number of words
+        :complexity: O(N) where N is the table size
+        """
+        return {rarity: len(words) for rarity, words in self.classify_all().items()}
+
+    def suggest(self, word: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Suggests corrections from the dictionary for a word whose rarity is MISSPELT.
+
+        :param word: A misspelt word.
+        :type word: String
+        :param limit: The maximum number of suggestions.
+        :type limit: int
+        :return: List of (word, edit distance) pairs, closest first
+        :complexity: see Dictionary.suggest
+        """
+        return self.dictionary.suggest(word, limit)
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Returns the k most frequent (word, occurrence) pairs, most frequent first, without sorting
+        every counted word.
+
+        :param k: The number of words to return.
+        :type k: int
+        :return: List of tuples
+        :complexity: O(N log k) where N is the number of counted words
+        """
+        if not self.word_ids:
+            return heapq.nlargest(k, self.items(), key=itemgetter(1))
+        words = self.dictionary.get_words()
+        counts = self.counts
+        keys = heapq.nlargest(k, compress(range(len(counts)), counts), key=counts.__getitem__)
+        return [(words[key], counts[key]) for key in keys]
 
     def ranking(self) -> ArrayList[tuple]:
         """
         Creates a list of tuples that contain words associated with its occurrence data
-        that is sorted by QuickSort function in descending order.
+        that is sorted by QuickSort function in descending order. With word_ids the counted
+        word IDs are sorted by the counts array directly instead.
 
         :return: ArrayList[tuple]
-        :complexity: O(N) for best/worst case
+        :complexity: O(N log N) for the average case
         """
-        self.sorted_arr = ArrayList(len(self.max_word_arr))
-        for i in range(len(self.max_word_arr)):
-            self.sorted_arr.insert(i, self.max_word_arr[i])
+        with span("frequency.ranking"):
+            if self.word_ids:
+                words = self.dictionary.get_words()
+                counts = self.counts
+                with span("frequency.sort"):
+                    keys = sorted(compress(range(len(counts)), counts), key=counts.__getitem__, reverse=True)
+                self.sorted_arr = ArrayList(len(keys))
+                self.sorted_arr.extend((words[key], counts[key]) for key in keys)
+                return self.sorted_arr
+
+            self.sorted_arr = ArrayList(len(self.hash_table))
+            self.sorted_arr.extend(self.hash_table.items())
 
-        qsort(self.sorted_arr)
-        return self.sorted_arr
+            with span("frequency.sort"):
+                qsort(self.sorted_arr)
+            return self.sorted_arr
 
 
 def qsort(array: List[int]) -> None:
@@ -150,11 +512,13 @@ def qsort(array: List[int]) -> None:
     _qsort_aux(array, 0, len(array) - 1)
 
 
-def _partition(array: List[int], low: int, high: int) -> int:
+def _partition(array: List[int], low: int, high: int) -> Tuple[int, int]:
     """
     it creates a pivot at random index in the array range and it allocates
-    smaller elements to the left and bigger ones to the right.
-    Then, it returns the pivot.
+    bigger elements to the left, equal ones to the middle and smaller ones to
+    the right, so long runs of equal counts (most words occur once) do not
+    degrade the sort.
+    Then, it returns the first and last index of the middle.
 
     :param array: an array to be processed
     :type array: List[int]
@@ -162,23 +526,28 @@ def _partition(array: List[int], low: int, high: int) -> int:
     :type low: int
     :param high: an end index of the array
     :type high: int
-    :return: pivot
-    :complexity: O(log n) for the best case, O(n) for the worst case
+    :return: the bounds of the elements equal to the pivot
+    :complexity: O(n) for best/worst case
     Reference: Week 11 WorkShop QuickSort Algorithm https://edstem.org/courses/4462/lessons/6356/slides/45584
 
     """
 
     # selecting a pivot randomly
-    pivot = random.choice(range(low, high + 1))
-
-    swap(array, pivot, low)
-    pivot = low
-    for k in range(low + 1, high + 1):
-        if array[k][1] > array[low][1]:  # where the pivot sits
-            pivot += 1
-            swap(array, pivot, k)
-    swap(array, pivot, low)
-    return pivot
+    pivot = array[random.randint(low, high)][1]
+
+    less, k, greater = low, low, high
+    while k <= greater:
+        count = array[k][1]
+        if count > pivot:
+            swap(array, less, k)
+            less += 1
+            k += 1
+        elif count < pivot:
+            swap(array, k, greater)
+            greater -= 1
+        else:
+            k += 1
+    return less, greater
 
 
 def swap(array, i, j):
@@ -200,8 +569,9 @@ def swap(array, i, j):
 
 def _qsort_aux(array: List[int], low: int, high: int) -> None:
     """
-    It uses tail recursive to create two partitions separated by a boundary and
-    sort in descending order.
+    It partitions the range around a pivot and sort in descending order,
+    recursing into the smaller side and looping on the larger one so the
+    recursion depth stays O(log n).
 
     :param array: an array to be processed
     :type array: List[int]
@@ -216,10 +586,14 @@ def _qsort_aux(array: List[int], low: int, high: int) -> None:
     """
 
     # non base case
-    if low < high:
-        boundary = _partition(array, low, high)
-        _qsort_aux(array, low, boundary - 1)
-        _qsort_aux(array, boundary + 1, high)
+    while low < high:
+        less, greater = _partition(array, low, high)
+        if less - low < high - greater:
+            _qsort_aux(array, low, less - 1)
+            low = greater + 1
+        else:
+            _qsort_aux(array, greater + 1, high)
+            high = less - 1
 
 
 def frequency_analysis() -> None:
@@ -232,6 +606,7 @@ def frequency_analysis() -> None:
     :raises: ValueError when num_ranking is not a number
     :pre:num_ranking must be in an integer form
     """
+    frequency_ranking = Frequency(preload=True)  # loads the dictionary while waiting for input
     try:
         num_ranking = int(input("Enter the number of rankings to display\n"))
     except ValueError:
@@ -239,7 +614,6 @@ def frequency_analysis() -> None:
         # -occurred
         raise ValueError("Invalid! PLease make sure the input value is a number") from None
 
-    frequency_ranking = Frequency()
     frequency_ranking.add_file("215-0.txt")
     ranks = frequency_ranking.ranking()[0:num_ranking]
 
@@ -1,26 +1,55 @@
 """ Hash Table ADT
 
-Defines a Hash Table using Linear Probing for conflict resolution.
-It currently rehashes the primary cluster to handle deletion.
+Defines Hash Tables using open addressing for conflict resolution, built on one
+shared core (OpenAddressingHashTable) that differs only in the probe sequence:
+linear probing, quadratic probing and double hashing.
+The linear probing table rehashes the primary cluster to handle deletion; the
+others leave a tombstone behind. When probe chains show that the hash base clusters the keys, the open addressing
+tables re-seed it as they rehash.
+SeparateChainingHashTable instead keeps a bucket array per slot, and SwissHashTable probes a group of slots at a
+time through a byte array of key fingerprints. PackedKeyHashTable keeps every key in one UTF-8 buffer rather than
+as str objects, to hold large word lists in far less memory.
 """
 __author__ = 'Daiki Kubo'
 
+from abc import ABC, abstractmethod
 from referential_array import ArrayR
-from typing import TypeVar, Generic, Tuple
-import unittest
+from list_adt import ArrayList
+from typing import TypeVar, Generic, Tuple, Iterator, Callable, Iterable, List
+from array import array
+import operator
 
 T = TypeVar('T')
 
+# Left in a slot whose item was deleted, so that probe sequences passing through it carry on. Its key never
+# compares equal to a str.
+DELETED = (object(), None)
 
-class LinearProbeHashTable(Generic[T]):
+
+def _prime_at_least(value: int) -> int:
     """
-    Linear Probe Hash Table
+    Returns the smallest prime that is at least value
+    :complexity: O(G * sqrt(P)) where P is the prime returned and G the gap to it
+    """
+    candidate = max(2, value)
+    while any(candidate % divisor == 0 for divisor in range(2, int(candidate ** 0.5) + 1)):
+        candidate += 1
+    return candidate
+
+
+class HashTable(ABC, Generic[T]):
+    """
+    Hash Table
+
+    What every hash table here shares, whatever its conflict resolution: the hash function, the statistics()
+    counters, and everything built on lookups and on iterating items(). Subclasses store the items.
 
     constants:
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
         PRIMES: list of prime numbers to use for resizing
+        PRIME_SIZE: whether the table size is rounded up to a prime
 
     attributes:
         count: number of elements in the hash table
@@ -28,6 +57,10 @@ class LinearProbeHashTable(Generic[T]):
         hash_base: base prime used in hash function
         table_size: current size of the hash table
         next_prime: next prime number to use when resizing
+        adaptive: whether the table may re-seed its hash base when it detects clustering (only open addressing
+                  tables do)
+        version: bumped whenever a key is added or removed, or the table is rehashed,
+                 so that iterators can detect concurrent modification
     """
     MIN_CAPACITY = 1
 
@@ -38,13 +71,18 @@ class LinearProbeHashTable(Generic[T]):
               25229, 30313, 36353, 43627, 52361, 62851, 75521, 90523, 108631, 130363, 156437, 187751, 225307, 270371,
               324449, 389357, 467237, 560689, 672827, 807403, 968897, 1162687, 1395263, 1674319, 2009191, 2411033,
               2893249, 3471899, 4166287, 4999559, 5999471, 7199369]
+    PRIME_SIZE = False
 
-    def __init__(self, hash_base: int = DEFAULT_HASH_BASE, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, hash_base: int = DEFAULT_HASH_BASE, table_size: int = DEFAULT_TABLE_SIZE,
+                 adaptive: bool = True) -> None:
         """
         :complexity: O(N) where N is the table_size
         """
+        size = max(self.MIN_CAPACITY, table_size)
+        if self.PRIME_SIZE:
+            size = _prime_at_least(size)
         self.count = 0
-        self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.table = ArrayR(size)
         self.hash_base = hash_base
         self.table_size = table_size
         self.next_prime = 0
@@ -53,103 +91,81 @@ class LinearProbeHashTable(Generic[T]):
         self.probe_chain_counter = 0
         self.probe_max_counter = 0
         self.probe_max = []
+        self.reseed_counter = 0
+        self.adaptive = adaptive
+        self.version = 0
 
-        while LinearProbeHashTable.PRIMES[self.next_prime] <= table_size:
+        while self.next_prime < len(self.PRIMES) and self.PRIMES[self.next_prime] <= table_size:
             self.next_prime += 1
 
-    def __len__(self) -> int:
+    @abstractmethod
+    def __getitem__(self, key: str) -> T:
         """
-        Returns number of elements in the hash table
-        :complexity: O(1)
+        Get the item at a certain key
+        :raises KeyError: when the item doesn't exist
         """
-        return self.count
+        pass
+
+    @abstractmethod
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        """
+        pass
 
+    @abstractmethod
     def __delitem__(self, key: str) -> None:
         """
-        Deletes an item from our hash table by rehashing the
-        remaining items in the current primary cluster
+        Deletes an item from our hash table
         :raises KeyError: when the key doesn't exist
-        :complexity best: O(K) finds the position straight away and doesn't have to rehash
-                          where K is the size of the key
-        :complexity worst: O(K + N) when it has to rehash all items in the hash table
-                          where N is the table size
         """
-        position = self.__linear_probe(key, False)
-        self.table[position] = None
-        self.count -= 1
-
-        position = (position + 1) % len(self.table)
-        while self.table[position] is not None:
-            item = self.table[position]
-            self.table[position] = None
-            self.count -= 1
-            self[str(item[0])] = item[1]
-            position = (position + 1) % len(self.table)
+        pass
 
-    def __rehash(self) -> None:
+    @abstractmethod
+    def setdefault(self, key: str, default: T) -> T:
         """
-        Need to resize table and reinsert all values
-        :complexity:
+        Returns the data at key, first inserting it with data default if it doesn't exist yet.
         """
-        self.rehashCounterIncrement()
-        new_hash = LinearProbeHashTable(self.hash_base, LinearProbeHashTable.PRIMES[self.next_prime])
-        self.next_prime += 1
-
-        for i in range(len(self.table)):
-            if self.table[i] is not None:
-                new_hash[str(self.table[i][0])] = self.table[i][1]
-
-        self.count = new_hash.count
-        self.table = new_hash.table
+        pass
 
-    def __linear_probe(self, key: str, is_insert: bool) -> int:
+    @abstractmethod
+    def increment(self, key: str, amount: int = 1) -> int:
         """
-        Find the correct position for this key in the hash table using linear probing
-        If there is something but not the key, we increment probeChain and probeMaxChain counters. Once, it
-        successfully, inserts in an empty position, a probeMaxCounter getter that has a length of probe chain per key,
-        will be appended inside the array probe_max. Then, we check if the probe_max_counter is more than 0, and if it
-        is we increment the collision counter by one. Afterwards, we initialize the probe_max_counter to zero and
-        start again.
-
-        :complexity best: O(K) first position is empty
-                          where K is the size of the key
-        :complexity worst: O(K + N) when we've searched the entire table
-                           where N is the table_size
-        :raises KeyError: When a position can't be found
+        Adds amount to the data at key, inserting it with data amount if it doesn't exist yet.
+        :return: the new data at key
         """
-        position = self.hash(key)  # get the position using hash
-
-        if is_insert and self.is_full():
-            raise KeyError(key)
-
-        for _ in range(len(self.table)):  # start traversing
-            if self.table[position] is None:  # found empty slot
-
-                if is_insert:
-                    # append all the keys probe length inside the tuple. To find the max number of probe chain
-                    self.probe_max.append(self.getProbeMaxCounter())
-
-                    # if a key has more than one probe chain then it means a collision must be incremented by one
-                    if self.probe_max_counter > 0:
-                        self.collisionCounterIncrement()
+        pass
 
-                    # This is the probe chain counter for each word used to store inside the tuple. Hence,
-                    # it must be initialized back to 0.
-                    self.probe_max_counter = 0
-
-                    return position
+    @abstractmethod
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table once so that it can hold count items without having to rehash, for callers that know
+        how many keys are coming
+        """
+        pass
 
-                else:
-                    raise KeyError(key)  # so the key is not in
-            elif self.table[position][0] == key:  # found key
-                return position
+    @abstractmethod
+    def lookup_items(self, keys: Iterable[str]) -> List[Tuple[str, T]]:
+        """
+        Returns, for each key in order, the (key, data) pair stored in the Hash Table for it, or None if there is
+        none, leaving the statistics untouched.
+        """
+        pass
 
-            else:  # there is something but not the key, try next
-                position = (position + 1) % len(self.table)
-                self.probeChainIncrement()
-                self.probeMaxCounterIncrement()
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, T]]:
+        """
+        Yields every (key, data) pair in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        """
+        pass
 
-        raise KeyError(key)
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        :complexity: O(1)
+        """
+        return self.count
 
     def __contains__(self, key: str) -> bool:
         """
@@ -163,32 +179,15 @@ class LinearProbeHashTable(Generic[T]):
         else:
             return True
 
-    def __getitem__(self, key: str) -> T:
-        """
-        Get the item at a certain key
-        :see: #self.__linear_probe(key: str, is_insert: bool)
-        :raises KeyError: when the item doesn't exist
-        """
-        position = self.__linear_probe(key, False)
-        return self.table[position][1]
-
-    def __setitem__(self, key: str, data: T) -> None:
+    def get(self, key: str, default: T = None) -> T:
         """
-        Set an (key, data) pair in our hash table
-        :see: #self.__linear_probe(key: str, is_insert: bool)
-        :see: #self.__rehash()
+        Get the item at a certain key, or default when the key doesn't exist
+        :see: #self.__getitem__(self, key: str)
         """
-
-        if (self.count/len(self.table)) > 0.5:
-            self.__rehash()
-
-        # if self.is_full():
-        #     self.__rehash()
-        position = self.__linear_probe(key, True)
-
-        if self.table[position] is None:
-            self.count += 1
-        self.table[position] = (key, data)
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def is_empty(self):
         """
@@ -204,6 +203,20 @@ class LinearProbeHashTable(Generic[T]):
         """
         return self.count == len(self.table)
 
+    def next_table_size(self, min_size: int = 0) -> int:
+        """
+        Returns the size to grow the table to: the next prime in PRIMES, skipping ahead to the first one that is at
+        least min_size, and once PRIMES runs out, the smallest prime that is at least min_size and twice the
+        current size
+        :complexity: O(1) within PRIMES, O(G * sqrt(P)) past them (see _prime_at_least)
+        """
+        while self.next_prime < len(self.PRIMES) and self.PRIMES[self.next_prime] < min_size:
+            self.next_prime += 1
+        if self.next_prime == len(self.PRIMES):
+            return _prime_at_least(max(min_size, 2 * len(self.table)))
+        self.next_prime += 1
+        return self.PRIMES[self.next_prime - 1]
+
     def hash(self, key: str) -> int:
         """
         Universal Hash function
@@ -215,6 +228,38 @@ class LinearProbeHashTable(Generic[T]):
             value = (value * self.hash_base + ord(c)) % len(self.table)
         return value
 
+    def hash_many(self, keys: Iterable[str]) -> List[int]:
+        """
+        Hashes a batch of keys in one pass, with the base and table size looked up once for the whole batch
+        :post: every value is a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the total size of the keys
+        """
+        base = self.hash_base
+        size = len(self.table)
+        values = []
+        for key in keys:
+            value = 0
+            for c in key:
+                value = (value * base + ord(c)) % size
+            values.append(value)
+        return values
+
+    def lookup_keys(self, keys: Iterable[str]) -> List[str]:
+        """
+        Returns, for each key in order, the key object stored in the Hash Table that is equal to it, or None if
+        there is none. Callers can keep the stored object instead of their own equal copy, so that every table
+        holding that word shares one string.
+        :see: #self.lookup_items(keys: Iterable[str])
+        """
+        return [None if item is None else item[0] for item in self.lookup_items(keys)]
+
+    def contains_many(self, keys: Iterable[str]) -> List[bool]:
+        """
+        Returns, for each key in order, whether it is in the Hash Table.
+        :see: #self.lookup_keys(keys: Iterable[str])
+        """
+        return [key is not None for key in self.lookup_keys(keys)]
+
     def insert(self, key: str, data: T) -> None:
         """
         Utility method to call our setitem method
@@ -224,11 +269,12 @@ class LinearProbeHashTable(Generic[T]):
 
     def statistics(self) -> Tuple:
         """
-        It is a method that returns a tuple, containing collision_count, probe_total, probe_max, and rehash_count
+        It is a method that returns a tuple, containing collision_count, probe_total, probe_max, rehash_count and
+        reseed_count
         :return Tuple:
         """
         tuple_stats = (self.getCollisionCounter(), self.getProbeChainCounter(), self.getProbeMax(),
-                       self.getRehashCounter())
+                       self.getRehashCounter(), self.getReseedCounter())
 
         return tuple_stats
 
@@ -280,6 +326,22 @@ class LinearProbeHashTable(Generic[T]):
         """
         return self.rehash_counter
 
+    def reseedCounterIncrement(self):
+        """
+        A method to increment a reseed_counter by one
+        :return None:
+        :complexity: O(1)
+        """
+        self.reseed_counter += 1
+
+    def getReseedCounter(self):
+        """
+        A getter for reseed_counter
+        :return reseed_counter:
+        :complexity: O(1)
+        """
+        return self.reseed_counter
+
     def getProbeMax(self):
         """
         A getter for ProbeMax
@@ -291,6 +353,17 @@ class LinearProbeHashTable(Generic[T]):
         except ValueError:
             return 0
 
+    def probe_histogram(self) -> Tuple:
+        """
+        Returns how many inserts had a probe chain of each length: item i is the number of inserts that probed i
+        times (or, for the separate chaining table, walked a chain of i pairs)
+        :complexity: O(I) where I is the number of inserts recorded
+        """
+        counts = [0] * (self.getProbeMax() + 1) if self.probe_max else []
+        for chain in self.probe_max:
+            counts[chain] += 1
+        return tuple(counts)
+
     def getProbeMaxCounter(self):
         """
         A getter for probe_max_counter
@@ -307,101 +380,1577 @@ class LinearProbeHashTable(Generic[T]):
         """
         self.probe_max_counter += 1
 
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the hash table (no particular order)
+        :see: #self.keys()
+        """
+        return self.keys()
+
+    def keys(self) -> Iterator[str]:
+        """
+        Yields every key in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[T]:
+        """
+        Yields every data value in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        for _, data in self.items():
+            yield data
+
+    def update(self, other: 'HashTable[T]') -> None:
+        """
+        Inserts every (key, data) pair of other, overwriting the data of keys already present.
+        The table is grown once up front rather than rehashing repeatedly.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        self.reserve(self.count + len(other))
+        for key, data in other.items():
+            self[key] = data
+
+    def merge_counts(self, other: 'HashTable[T]', combine: Callable[[T, T], T] = operator.add) -> None:
+        """
+        Merges other into this table, replacing the data of keys present in both with combine(mine, theirs).
+        The keys of other are looked up in one batch before any is inserted, as they are all distinct.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        self.reserve(self.count + len(other))
+        pairs = list(other.items())
+        for (key, data), stored in zip(pairs, self.lookup_items([key for key, _ in pairs])):
+            self[key] = data if stored is None else combine(stored[1], data)
+
+    def union(self, other: 'HashTable[T]') -> 'HashTable[T]':
+        """
+        Returns a new table of this table's class with the keys of both tables. Data for keys in both comes from
+        other.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        result = type(self)(self.hash_base, len(self.table))
+        result.update(self)
+        result.update(other)
+        return result
+
+    def intersection(self, other: 'HashTable[T]') -> 'HashTable[T]':
+        """
+        Returns a new table of this table's class with the keys present in both tables, keeping the data from this
+        table. Only the smaller of the two tables is scanned.
+        :complexity: O(min(N, M)) lookups where N and M are the sizes of the two tables, plus O(min(N, M)) to scan
+        """
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        result = type(self)(self.hash_base, len(self.table))
+        result.reserve(len(small))
+        for key in small.keys():
+            if key in large:
+                result[key] = self[key]
+        return result
+
     def __str__(self) -> str:
         """
         Returns all they key/value pairs in our hash table (no particular order)
         :complexity: O(N) where N is the table size
         """
-        result = ""
-        for item in self.table:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+        return "".join("(" + str(key) + "," + str(value) + ")\n" for key, value in self.items())
+
+
+class OpenAddressingHashTable(HashTable[T]):
+    """
+    Open Addressing Hash Table
+
+    Every item is kept in the table itself. A key that collides follows a probe sequence from its hash
+    position until it finds itself or an empty slot: it starts with a step of probe_step(key) slots, and the
+    step grows by STEP_GROWTH after every probe. Subclasses only choose the sequence, so every table here
+    keeps the same statistics() counters and can be swapped for one another.
+
+    Deleting leaves a tombstone (DELETED) in the slot, so that sequences passing through it are not cut short,
+    unless REINSERT_CLUSTER is set, in which case the rest of the cluster is reinserted instead (only valid for
+    linear probing). Inserts reuse tombstones and rehashing drops them.
+
+    An adaptive table watches the probe chains of its inserts. Growing doesn't help a hash base that sends many
+    keys to the same positions (a base of 1 hashes every anagram alike), so when the average chain over the last
+    RESEED_WINDOW inserts, or a single chain, gets too long, the next insert rehashes with the next base from
+    RESEED_BASES instead, keeping the table size if the load allows. This happens at most MAX_RESEEDS times, and
+    statistics() reports how often it did.
+
+    Given max_entries, the table is a bounded cache: once it holds max_entries items, inserting a new key evicts
+    one chosen by the CLOCK policy, an approximation of least recently used. A byte per slot, beside the table,
+    records whether the item there was referenced (inserted or found) since the clock hand last passed; the hand
+    sweeps the slots, clearing these bytes, and evicts the first item whose byte is already clear. Evictions and
+    deletions leave tombstones, even with REINSERT_CLUSTER, so that items never move between rehashes, and a
+    rehash forgets which items were referenced. cache_statistics() reports the hits, misses and evictions.
+
+    constants:
+        MAX_LOAD: the table is rehashed once items and tombstones fill more than this fraction of it
+        STEP_GROWTH: how much the probe step grows after every probe
+        REINSERT_CLUSTER: whether deletion reinserts the rest of the cluster rather than leaving a tombstone
+        PRIME_SIZE (from HashTable): set when the probe sequence needs a prime table size to reach enough of it
+        RESEED_WINDOW: number of inserts the average probe chain is taken over
+        RESEED_AVERAGE_PROBE: average probe chain over a window beyond which the hash base is re-seeded
+        RESEED_MAX_PROBE: probe chain of a single insert beyond which the hash base is re-seeded
+        RESEED_BASES: the hash bases re-seeding picks from, in order
+        MAX_RESEEDS: how many times the hash base may be re-seeded
+
+    attributes (besides those of HashTable):
+        deleted: number of tombstones in the hash table
+        reseed_pending: set when clustering was detected, so that the next insert re-seeds
+        window_inserts: number of inserts in the current window
+        window_probes: total probe chain of the inserts in the current window
+        max_entries: the most items the table holds as a cache, or None if it is unbounded
+        referenced: with max_entries, the CLOCK reference byte of each slot
+        clock_hand: with max_entries, the slot the CLOCK sweep looks at next
+        hit_counter, miss_counter: with max_entries, lookups through [] (and in and get) that found their key and
+                                   that didn't
+        eviction_counter: number of items evicted
+    """
+    MAX_LOAD = 0.5
+    STEP_GROWTH = 0
+    REINSERT_CLUSTER = False
+    RESEED_WINDOW = 256
+    RESEED_AVERAGE_PROBE = 4.0
+    RESEED_MAX_PROBE = 256
+    RESEED_BASES = (31, 257, 7919, 65537)
+    MAX_RESEEDS = 3
+
+    def __init__(self, hash_base: int = HashTable.DEFAULT_HASH_BASE,
+                 table_size: int = HashTable.DEFAULT_TABLE_SIZE, adaptive: bool = True,
+                 max_entries: int = None) -> None:
+        """
+        :param max_entries: makes the table a cache holding at most this many items
+        :raises ValueError: when max_entries is less than 1
+        :complexity: O(N) where N is the table_size
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        HashTable.__init__(self, hash_base, table_size, adaptive)
+        self.deleted = 0
+        self.reseed_pending = False
+        self.window_inserts = 0
+        self.window_probes = 0
+        self.max_entries = max_entries
+        self.referenced = None if max_entries is None else bytearray(len(self.table))
+        self.clock_hand = 0
+        self.hit_counter = 0
+        self.miss_counter = 0
+        self.eviction_counter = 0
+
+    @abstractmethod
+    def probe_step(self, key: str) -> int:
+        """
+        Returns the first step of the probe sequence of key
+        :complexity: O(K) at most, where K is the size of the key
+        """
+        pass
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes an item from our hash table, by leaving a tombstone in its place or, with REINSERT_CLUSTER, by
+        rehashing the remaining items in the current primary cluster
+        :raises KeyError: when the key doesn't exist
+        :complexity best: O(K) finds the position straight away and doesn't have to rehash
+                          where K is the size of the key
+        :complexity worst: O(K + N) when it has to rehash all items in the hash table
+                          where N is the table size
+        """
+        position = self.__probe(key, False)
+        self.count -= 1
+        self.version += 1
+        if not self.REINSERT_CLUSTER or self.max_entries is not None:
+            self.table[position] = DELETED
+            self.deleted += 1
+            return
+
+        self.table[position] = None
+        position = (position + 1) % len(self.table)
+        while self.table[position] is not None:
+            item = self.table[position]
+            self.table[position] = None
+            # probed directly rather than through __setitem__, which could rehash under this loop
+            self.table[self.__probe(item[0], True)] = item
+            position = (position + 1) % len(self.table)
+
+    def __rehash(self, min_size: int = 0) -> None:
+        """
+        Need to resize table and reinsert all values
+        The new size is next_table_size(min_size), or larger if the items wouldn't fit within MAX_LOAD.
+        If tombstones rather than items fill the table, it is rebuilt at its current size instead.
+        A pending re-seed switches to the next hash base, and keeps the current size unless the table is loaded
+        beyond MAX_LOAD without its tombstones.
+        :complexity: O(N) where N is the table size
+        """
+        self.rehashCounterIncrement()
+        max_load = self.MAX_LOAD / 2
+        if self.reseed_pending:
+            self.reseed_pending = False
+            self.reseedCounterIncrement()
+            self.hash_base = self.__next_hash_base()
+            max_load = self.MAX_LOAD
+        if self.count < len(self.table) * max_load and min_size <= len(self.table):
+            new_size = len(self.table)
+        else:
+            # the next prime alone can leave a small table loaded beyond MAX_LOAD, where a quadratic sequence may
+            # miss the slots left
+            new_size = self.next_table_size(max(min_size, int(self.count / self.MAX_LOAD) + 1))
+        new_hash = type(self)(self.hash_base, new_size, False)
+
+        for key, data in self.__iter_items():
+            new_hash[str(key)] = data
+
+        self.count = new_hash.count
+        self.deleted = 0
+        self.table = new_hash.table
+        self.window_inserts = 0
+        self.window_probes = 0
+        if self.max_entries is not None:
+            self.referenced = bytearray(len(self.table))
+            self.clock_hand = 0
+        self.version += 1
+
+    def __next_hash_base(self) -> int:
+        """
+        Returns the hash base for the reseed_counter-th re-seed: the next one in RESEED_BASES, skipping the
+        current base
+        :complexity: O(1)
+        """
+        index = (self.reseed_counter - 1) % len(self.RESEED_BASES)
+        if self.RESEED_BASES[index] == self.hash_base:
+            index = (index + 1) % len(self.RESEED_BASES)
+        return self.RESEED_BASES[index]
+
+    def __watch_probe_chains(self, chain: int) -> None:
+        """
+        Called at the end of a window or after a long probe chain: flags a re-seed if the window's average chain
+        or the last chain is beyond its threshold, and starts a new window
+        :complexity: O(1)
+        """
+        if self.reseed_counter < self.MAX_RESEEDS and \
+                (chain > self.RESEED_MAX_PROBE
+                 or self.window_probes > self.RESEED_AVERAGE_PROBE * self.window_inserts):
+            self.reseed_pending = True
+        self.window_inserts = 0
+        self.window_probes = 0
+
+    def __fill(self, position: int) -> None:
+        """
+        Accounts for a new item about to be stored at an empty or deleted position, first evicting another item
+        if the table is a full cache
+        :complexity: O(1), or O(N) amortised O(1) where N is the table size when it evicts
+        """
+        if self.max_entries is not None:
+            if self.count >= self.max_entries:
+                self.__evict()
+            self.referenced[position] = 1
+        if self.table[position] is DELETED:
+            self.deleted -= 1
+        self.count += 1
+        self.version += 1
+
+    def __evict(self) -> None:
+        """
+        Evicts the item the CLOCK sweep comes to first that wasn't referenced since the hand last passed it,
+        leaving a tombstone
+        :pre: the table is a cache holding at least one item
+        :complexity: O(N) where N is the table size, O(1) amortised over the inserts
+        """
+        table = self.table
+        referenced = self.referenced
+        size = len(table)
+        hand = self.clock_hand
+        while True:
+            item = table[hand]
+            if item is not None and item is not DELETED:
+                if not referenced[hand]:
+                    break
+                referenced[hand] = 0
+            hand = (hand + 1) % size
+        table[hand] = DELETED
+        self.deleted += 1
+        self.count -= 1
+        self.eviction_counter += 1
+        self.clock_hand = (hand + 1) % size
 
+    def __probe(self, key: str, is_insert: bool) -> int:
+        """
+        Find the correct position for this key in the hash table by following its probe sequence.
+        If there is something but not the key, we increment probeChain and probeMaxChain counters. Once, it
+        successfully, inserts in an empty position, a probeMaxCounter getter that has a length of probe chain per key,
+        will be appended inside the array probe_max. Then, we check if the probe_max_counter is more than 0, and if it
+        is we increment the collision counter by one. Afterwards, we initialize the probe_max_counter to zero and
+        start again. An insert goes into the first tombstone on the way, if any, rather than the empty slot.
 
-class TestLinearProbeHashTable(unittest.TestCase):
-    def test_init(self):
-        """ Basic test to ensure the table is initialised """
-        dictionary = LinearProbeHashTable()
-        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+        :complexity best: O(K) first position is empty
+                          where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table
+                           where N is the table_size
+        :raises KeyError: When a position can't be found
+        """
+        position = self.hash(key)  # get the position using hash
 
-    def test_is_empty(self):
-        """ Testing when the table is empty and non-empty """
-        dictionary = LinearProbeHashTable()
-        self.assertTrue(dictionary.is_empty())
+        if is_insert and self.is_full():
+            raise KeyError(key)
 
-        dictionary["test"] = "test"
-        self.assertFalse(dictionary.is_empty())
+        # the chain counted is this probe's alone: lookups, and inserts that find their key, leave it behind
+        self.probe_max_counter = 0
 
-    def test_is_full(self):
-        """ Testing when the hash table is full and empty """
-        dictionary = LinearProbeHashTable(31, 10)
-        self.assertFalse(dictionary.is_full())
+        table = self.table
+        size = len(table)
+        step = self.probe_step(key)
+        growth = self.STEP_GROWTH
+        free = None
+        for _ in range(size):  # start traversing
+            item = table[position]
+            if item is None:  # found empty slot
 
-        for i in range(10):
-            dictionary[str(i)] = i
-        self.assertTrue(len(dictionary) == 10)
+                if is_insert:
+                    self.__end_probe_chain()
+                    return position if free is None else free
 
-    def test_hash(self):
-        """ Testing the get item and contains """
-        dictionary = LinearProbeHashTable(31, 5)
-        for i in range(10):
-            dictionary[str(i)] = i
+                else:
+                    raise KeyError(key)  # so the key is not in
+            elif item[0] == key:  # found key
+                return position
 
-        for i in range(10):
-            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
-            self.assertTrue(str(i) in dictionary, "Could not find item: " + str(i))
+            else:  # there is something but not the key, try next
+                if item is DELETED and free is None:
+                    free = position
+                position = (position + step) % size
+                step += growth
+                self.probeChainIncrement()
+                self.probeMaxCounterIncrement()
 
-    def test_len(self):
-        """ Testing an empty Hash Table and non-empty Hash Table """
-        dictionary = LinearProbeHashTable(5)
-        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+        if is_insert and free is not None:  # no empty slot on the sequence, but a tombstone
+            self.__end_probe_chain()
+            return free
+        raise KeyError(key)
 
-        for i in range(3):
-            dictionary[str(i)] = i
+    def __end_probe_chain(self) -> None:
+        """
+        Records the probe chain of a key being inserted
+        :complexity: O(1)
+        """
+        # append all the keys probe length inside the tuple. To find the max number of probe chain
+        chain = self.getProbeMaxCounter()
+        self.probe_max.append(chain)
 
-        self.assertEqual(len(dictionary), 3, "Dictionary should contain 3 items")
+        # if a key has more than one probe chain then it means a collision must be incremented by one
+        if chain > 0:
+            self.collisionCounterIncrement()
 
-    def test_del(self):
-        """ Adding 10 items, removing the first 5 and ensuring the state of the Hash Table is correct afterwards """
-        dictionary = LinearProbeHashTable(5)
-        for i in range(10):
-            dictionary[str(i)] = i
+        # This is the probe chain counter for each word used to store inside the tuple. Hence,
+        # it must be initialized back to 0.
+        self.probe_max_counter = 0
 
-        for i in range(5):
-            del dictionary[str(i)]
+        if self.adaptive:
+            self.window_inserts += 1
+            self.window_probes += chain
+            if self.window_inserts >= self.RESEED_WINDOW or chain > self.RESEED_MAX_PROBE:
+                self.__watch_probe_chains(chain)
 
-        for i in range(10):
-            if i < 5:
-                with self.assertRaises(KeyError):
-                    _ = dictionary[str(i)]
-            else:
-                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :see: #self.__probe(key: str, is_insert: bool)
+        :raises KeyError: when the item doesn't exist
+        """
+        if self.max_entries is None:
+            return self.table[self.__probe(key, False)][1]
+        try:
+            position = self.__probe(key, False)
+        except KeyError:
+            self.miss_counter += 1
+            raise
+        self.hit_counter += 1
+        self.referenced[position] = 1
+        return self.table[position][1]
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :see: #self.__probe(key: str, is_insert: bool)
+        :see: #self.__rehash()
+        """
+        if self.reseed_pending or (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
+
+        position = self.__probe(key, True)
 
-    def test_statistics(self):
-        # TODO create more complicated test cases!!!
+        item = self.table[position]
+        if item is None or item is DELETED:
+            self.__fill(position)
+        self.table[position] = (key, data)
+
+    def setdefault(self, key: str, default: T) -> T:
+        """
+        Returns the data at key, first inserting it with data default if it doesn't exist yet.
+        The key is probed once.
+        :see: #self.__setitem__(self, key: str, data: T)
+        """
+        if self.reseed_pending or (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
 
-        # TEST CASE 1
-        dictionary = LinearProbeHashTable(31, 5)
-        tuple_test = (0, 0, 0, 0)
-        self.assertTrue(dictionary.statistics(), tuple_test)
+        position = self.__probe(key, True)
+        item = self.table[position]
+        if item is None or item is DELETED:
+            self.__fill(position)
+            self.table[position] = (key, default)
+            return default
+        return item[1]
 
-        # TEST CASE 2
-        dictionary = LinearProbeHashTable(0, 0)
-        tuple_test = (0, 0, 0, 0)
-        self.assertTrue(dictionary.statistics(), tuple_test)
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the data at key, inserting it with data amount if it doesn't exist yet.
+        The key is probed once, rather than once to read the old data and once more to store the new data.
+        :see: #self.__setitem__(self, key: str, data: T)
+        :return: the new data at key
+        """
+        if self.reseed_pending or (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
 
-    def test_str(self):
-        """ Testing an empty table and one with 5 elements """
-        dictionary = LinearProbeHashTable(31, 5)
-        self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+        position = self.__probe(key, True)
+        item = self.table[position]
+        if item is None or item is DELETED:
+            self.__fill(position)
+            value = amount
+        else:
+            value = item[1] + amount
+        self.table[position] = (key, value)
+        return value
 
-        for i in range(5):
-            dictionary[str(i)] = i
-        for i in range(5):
-            self.assertIn("(" + str(i) + "," + str(i) + ")", str(dictionary))
+    def lookup_items(self, keys: Iterable[str]) -> List[Tuple[str, T]]:
+        """
+        Returns, for each key in order, the (key, data) pair stored in the Hash Table for it, or None if there is
+        none. Unlike __contains__, a miss doesn't go through a KeyError, and the probe statistics are left
+        untouched.
+        :complexity best: O(K) every key is found in its first position
+                          where K is the total size of the keys
+        :complexity worst: O(K + B * N) where B is the number of keys and N is the table size
+        """
+        keys = list(keys)
+        table = self.table
+        size = len(table)
+        growth = self.STEP_GROWTH
+        stored = []
+        for key, position in zip(keys, self.hash_many(keys)):
+            step = self.probe_step(key)
+            for _ in range(size):
+                item = table[position]
+                if item is None:
+                    stored.append(None)
+                    break
+                if item[0] == key:
+                    stored.append(item)
+                    break
+                position = (position + step) % size
+                step += growth
+            else:
+                stored.append(None)
+        return stored
 
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table once so that it can hold count items (or max_entries, if fewer) without __setitem__
+        having to rehash
+        :complexity: O(N) where N is the table size if it has to grow, O(1) otherwise
+        """
+        if self.max_entries is not None:
+            count = min(count, self.max_entries)
+        if count > len(self.table) * self.MAX_LOAD:
+            self.__rehash(int(count / self.MAX_LOAD))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    def update(self, other: HashTable[T]) -> None:
+        """
+        Inserts every (key, data) pair of other, overwriting the data of keys already present. When this table is
+        empty and other hashes the same way (same class and hash base, and other's table is at least as large),
+        other's slots are copied across as one block instead of being re-hashed key by key, unless this table is a
+        cache.
+        :see: #HashTable.update(self, other: HashTable[T])
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        if self.count == 0 and type(other) is type(self) and other.hash_base == self.hash_base \
+                and len(other.table) >= len(self.table) and self.max_entries is None:
+            self.table = ArrayR(len(other.table))
+            self.table.copy_from(other.table, 0, 0, len(other.table))
+            self.count = other.count
+            self.deleted = other.deleted
+            self.next_prime = other.next_prime
+            self.version += 1
+            return
+        super().update(other)
+
+    def merge_counts(self, other: HashTable[T], combine: Callable[[T, T], T] = operator.add) -> None:
+        """
+        Merges other into this table, replacing the data of keys present in both with combine(mine, theirs).
+        Each key is probed once: the probe either lands on the key or on the empty slot it belongs in. As in
+        __setitem__, a pending re-seed, or tombstones (which a cache leaves as it evicts) filling the table beyond
+        MAX_LOAD, rehash it before the next key.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        self.reserve(self.count + len(other))
+        for key, data in other.items():
+            if self.reseed_pending or (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+                self.__rehash()
+            position = self.__probe(key, True)
+            item = self.table[position]
+            if item is None or item is DELETED:
+                self.__fill(position)
+                self.table[position] = (key, data)
+            else:
+                self.table[position] = (key, combine(item[1], data))
+
+    def cache_statistics(self) -> Tuple:
+        """
+        Returns a tuple containing hit_count, miss_count and eviction_count
+        :complexity: O(1)
+        """
+        return self.getHitCounter(), self.getMissCounter(), self.getEvictionCounter()
+
+    def getHitCounter(self):
+        """
+        A getter for hit_counter
+        :return hit_counter:
+        :complexity: O(1)
+        """
+        return self.hit_counter
+
+    def getMissCounter(self):
+        """
+        A getter for miss_counter
+        :return miss_counter:
+        :complexity: O(1)
+        """
+        return self.miss_counter
+
+    def getEvictionCounter(self):
+        """
+        A getter for eviction_counter
+        :return eviction_counter:
+        :complexity: O(1)
+        """
+        return self.eviction_counter
+
+    def __iter_items(self) -> Iterator[Tuple[str, T]]:
+        """
+        Yields the stored (key, data) tuples, skipping empty slots
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        version = self.version
+        for _, item in self.table.iter_nonempty():
+            if self.version != version:
+                raise RuntimeError("Hash table changed during iteration")
+            if item is not DELETED:
+                yield item
+        if self.version != version:
+            raise RuntimeError("Hash table changed during iteration")
+
+    def items(self) -> Iterator[Tuple[str, T]]:
+        """
+        Yields every (key, data) pair in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        return self.__iter_items()
+
+
+class LinearProbeHashTable(OpenAddressingHashTable[T]):
+    """
+    Linear Probe Hash Table
+
+    Probes the slots after the hash position one at a time. Deletion rehashes the rest of the primary cluster,
+    so the table never holds tombstones.
+    """
+    REINSERT_CLUSTER = True
+
+    def probe_step(self, key: str) -> int:
+        """
+        Every probe moves one slot on
+        :complexity: O(1)
+        """
+        return 1
+
+
+class QuadraticProbeHashTable(OpenAddressingHashTable[T]):
+    """
+    Quadratic Probe Hash Table
+
+    The i-th probe is i * i slots past the hash position, so keys hashing near each other spread out rather than
+    forming one primary cluster. In a table of prime size the first (size + 1) / 2 probes land in distinct slots,
+    which, as the table is never more than half full, always reaches an empty slot.
+    """
+    STEP_GROWTH = 2
+    PRIME_SIZE = True
+
+    def probe_step(self, key: str) -> int:
+        """
+        Steps of 1, 3, 5, ... put the i-th probe i * i slots on
+        :complexity: O(1)
+        """
+        return 1
+
+
+class DoubleHashingHashTable(OpenAddressingHashTable[T]):
+    """
+    Double Hashing Hash Table
+
+    Probes with a fixed step taken from a second hash of the key, so keys with the same hash position (anagrams,
+    with a hash base of 1) still follow different sequences. In a table of prime size every step visits every
+    slot.
+
+    constants:
+        SECOND_HASH_BASE: base used in the second hash function
+    """
+    SECOND_HASH_BASE = 257
+    PRIME_SIZE = True
+
+    def probe_step(self, key: str) -> int:
+        """
+        Second hash function, giving a step between 1 and table_size - 1
+        :complexity: O(K) where K is the size of the key
+        """
+        modulus = len(self.table) - 1
+        value = 0
+        for c in key:
+            value = (value * self.SECOND_HASH_BASE + ord(c)) % modulus
+        return value + 1
+
+
+class SeparateChainingHashTable(HashTable[T]):
+    """
+    Separate Chaining Hash Table
+
+    Each slot of the table holds a bucket: an ArrayList of the (key, data) pairs hashing there, created by the
+    first insert into the slot and dropped when it empties, so a chain is one compact array rather than a linked
+    list of nodes. Deleting moves the last pair of the bucket into the gap, which is O(1) once the key is found,
+    and leaves nothing behind for later lookups to step over. As buckets absorb collisions, the table runs fuller
+    than an open addressing one before it is rehashed.
+
+    The statistics() counters keep their meaning: a collision is an insert into a non-empty bucket, the probe
+    total counts the pairs compared on the way along the chains, and the probe max is the longest chain an
+    insert walked.
+
+    constants:
+        MAX_LOAD: the table is rehashed once it holds more than this many items per slot
+        BUCKET_CAPACITY: initial capacity of a bucket
+    """
+    MAX_LOAD = 1.0
+    BUCKET_CAPACITY = 1
+
+    def __index(self, bucket: ArrayList[Tuple[str, T]], key: str) -> int:
+        """
+        Returns the index of key in bucket, or -1 if it isn't there (or bucket is None), adding the pairs compared
+        on the way to the probe chain counter
+        :complexity: O(K * L) where K is the size of the key and L the length of the bucket
+        """
+        if bucket is None:
+            return -1
+        for i in range(len(bucket)):
+            if bucket[i][0] == key:
+                self.probe_chain_counter += i
+                return i
+        self.probe_chain_counter += len(bucket)
+        return -1
+
+    def __bucket(self, key: str) -> ArrayList[Tuple[str, T]]:
+        """
+        Returns the bucket key belongs in, creating it if the slot is empty
+        :complexity: O(K) where K is the size of the key
+        """
+        position = self.hash(key)
+        bucket = self.table[position]
+        if bucket is None:
+            bucket = ArrayList(self.BUCKET_CAPACITY)
+            self.table[position] = bucket
+        return bucket
+
+    def __add(self, bucket: ArrayList[Tuple[str, T]], key: str, data: T) -> None:
+        """
+        Appends a new (key, data) pair to the bucket it belongs in, recording the chain walked, and rehashes
+        if the table is loaded beyond MAX_LOAD
+        :complexity: O(1) amortised, or O(N) where N is the table size when it rehashes
+        """
+        walked = len(bucket)
+        self.probe_max.append(walked)
+        if walked > 0:
+            self.collisionCounterIncrement()
+        bucket.append((key, data))
+        self.count += 1
+        self.version += 1
+        if self.count > len(self.table) * self.MAX_LOAD:
+            self.__rehash()
+
+    def __rehash(self, min_size: int = 0) -> None:
+        """
+        Need to resize table and move every pair to its new bucket
+        The new size is next_table_size(min_size)
+        :complexity: O(N) where N is the table size
+        """
+        self.rehashCounterIncrement()
+        old_table = self.table
+        self.table = ArrayR(self.next_table_size(min_size))
+
+        for _, bucket in old_table.iter_nonempty():
+            for item in bucket:
+                self.__bucket(item[0]).append(item)
+        self.version += 1
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table once so that it can hold count items without having to rehash
+        :complexity: O(N) where N is the table size if it has to grow, O(1) otherwise
+        """
+        if count > len(self.table) * self.MAX_LOAD:
+            self.__rehash(int(count / self.MAX_LOAD) + 1)
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :raises KeyError: when the item doesn't exist
+        :complexity: O(K * L) where K is the size of the key and L the length of its bucket
+        """
+        bucket = self.table[self.hash(key)]
+        index = self.__index(bucket, key)
+        if index < 0:
+            raise KeyError(key)
+        return bucket[index][1]
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :complexity: O(K * L) where K is the size of the key and L the length of its bucket, outside rehashing
+        """
+        bucket = self.__bucket(key)
+        index = self.__index(bucket, key)
+        if index < 0:
+            self.__add(bucket, key, data)
+        else:
+            bucket[index] = (key, data)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes an item from our hash table by moving the last pair of its bucket into its place
+        :raises KeyError: when the key doesn't exist
+        :complexity: O(K * L) where K is the size of the key and L the length of its bucket
+        """
+        position = self.hash(key)
+        bucket = self.table[position]
+        index = self.__index(bucket, key)
+        if index < 0:
+            raise KeyError(key)
+        last = len(bucket) - 1
+        bucket[index] = bucket[last]
+        bucket.delete_at_index(last)
+        if bucket.is_empty():
+            self.table[position] = None
+        self.count -= 1
+        self.version += 1
+
+    def setdefault(self, key: str, default: T) -> T:
+        """
+        Returns the data at key, first inserting it with data default if it doesn't exist yet.
+        The bucket is searched once.
+        :see: #self.__setitem__(self, key: str, data: T)
+        """
+        bucket = self.__bucket(key)
+        index = self.__index(bucket, key)
+        if index < 0:
+            self.__add(bucket, key, default)
+            return default
+        return bucket[index][1]
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the data at key, inserting it with data amount if it doesn't exist yet.
+        The bucket is searched once.
+        :see: #self.__setitem__(self, key: str, data: T)
+        :return: the new data at key
+        """
+        bucket = self.__bucket(key)
+        index = self.__index(bucket, key)
+        if index < 0:
+            self.__add(bucket, key, amount)
+            return amount
+        value = bucket[index][1] + amount
+        bucket[index] = (key, value)
+        return value
+
+    def is_full(self):
+        """
+        Returns False, as buckets grow to hold any number of items
+        :complexity: O(1)
+        """
+        return False
+
+    def lookup_items(self, keys: Iterable[str]) -> List[Tuple[str, T]]:
+        """
+        Returns, for each key in order, the (key, data) pair stored in the Hash Table for it, or None if there is
+        none, leaving the statistics untouched.
+        :complexity: O(K + B * L) where K is the total size of the keys, B the number of keys and L the longest
+                     bucket
+        """
+        keys = list(keys)
+        table = self.table
+        stored = []
+        for key, position in zip(keys, self.hash_many(keys)):
+            found = None
+            bucket = table[position]
+            if bucket is not None:
+                for item in bucket:
+                    if item[0] == key:
+                        found = item
+                        break
+            stored.append(found)
+        return stored
+
+    def merge_counts(self, other: HashTable[T], combine: Callable[[T, T], T] = operator.add) -> None:
+        """
+        Merges other into this table, replacing the data of keys present in both with combine(mine, theirs).
+        Each bucket is searched once per key.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        self.reserve(self.count + len(other))
+        for key, data in other.items():
+            bucket = self.__bucket(key)
+            index = self.__index(bucket, key)
+            if index < 0:
+                self.__add(bucket, key, data)
+            else:
+                bucket[index] = (key, combine(bucket[index][1], data))
+
+    def chain_statistics(self) -> Tuple:
+        """
+        Returns the length of the longest bucket and the number of non-empty buckets, from which the mean chain
+        length is len(self) divided by the latter
+        :complexity: O(N) where N is the table size
+        """
+        longest = 0
+        used = 0
+        for _, bucket in self.table.iter_nonempty():
+            longest = max(longest, len(bucket))
+            used += 1
+        return longest, used
+
+    def items(self) -> Iterator[Tuple[str, T]]:
+        """
+        Yields every (key, data) pair in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        version = self.version
+        for _, bucket in self.table.iter_nonempty():
+            for item in bucket:
+                if self.version != version:
+                    raise RuntimeError("Hash table changed during iteration")
+                yield item
+        if self.version != version:
+            raise RuntimeError("Hash table changed during iteration")
+
+
+class SwissHashTable(HashTable[T]):
+    """
+    Swiss Table Hash Table
+
+    Open addressing over groups of GROUP_SIZE slots, with one control byte per slot kept in a bytearray beside the
+    table: EMPTY_BYTE, DELETED_BYTE, or the 7-bit fingerprint of the key stored in the slot. The hash value picks
+    the first group of a key and its fingerprint. A lookup scans the control bytes of a group for the fingerprint
+    with bytearray.find, which runs in C, and only compares the keys of the slots that match; a group with an
+    EMPTY_BYTE ends the probe sequence. A lookup for a missing key therefore rarely compares a key at all, and as
+    keys probe a whole group at a time, the table runs far fuller than the other open addressing tables before it
+    is rehashed.
+
+    The number of groups is a power of two and groups are visited 1, 2, 3, ... groups on from the first, which
+    reaches every group. The hash value is taken modulo a prime at least 128 times the number of groups, so that
+    both the group and the fingerprint come from it. The statistics() counters count each group moved past and
+    each fingerprint that matched another key as a probe. The hash base is never re-seeded.
+
+    constants:
+        GROUP_SIZE: number of slots whose control bytes are scanned together
+        MAX_LOAD: the table is rehashed once items and deleted slots fill more than this fraction of it
+        EMPTY_BYTE: control byte of a slot that was never used since the last rehash
+        DELETED_BYTE: control byte of a slot whose item was deleted from a full group
+
+    attributes (besides those of HashTable):
+        control: the control byte of each slot
+        deleted: number of DELETED_BYTE control bytes
+        group_mask: number of groups - 1
+        group_bits: log2 of the number of groups
+        modulus: the prime the hash value is taken modulo
+    """
+    GROUP_SIZE = 16
+    MAX_LOAD = 0.875
+    EMPTY_BYTE = 0x80
+    DELETED_BYTE = 0xFE
+
+    def __init__(self, hash_base: int = HashTable.DEFAULT_HASH_BASE,
+                 table_size: int = HashTable.DEFAULT_TABLE_SIZE, adaptive: bool = True) -> None:
+        """
+        The table holds at least table_size slots, rounded up to a power of two number of groups
+        :complexity: O(N) where N is the table_size
+        """
+        groups = 1
+        while groups * self.GROUP_SIZE < table_size:
+            groups *= 2
+        HashTable.__init__(self, hash_base, groups * self.GROUP_SIZE, adaptive)
+        self.control = bytearray([self.EMPTY_BYTE]) * len(self.table)
+        self.deleted = 0
+        self.group_mask = groups - 1
+        self.group_bits = groups.bit_length() - 1
+        self.modulus = _prime_at_least(groups * 128)
+
+    def hash(self, key: str) -> int:
+        """
+        Universal Hash function, taken modulo modulus rather than the table size: the low group_bits bits give
+        the first group of key and the 7 bits above them its fingerprint
+        :post: returns a value 0 <= value < modulus
+        :complexity: O(K) where K is the size of the key
+        """
+        value = 0
+        for c in key:
+            value = (value * self.hash_base + ord(c)) % self.modulus
+        return value
+
+    def hash_many(self, keys: Iterable[str]) -> List[int]:
+        """
+        Hashes a batch of keys in one pass, with the base and modulus looked up once for the whole batch
+        :post: every value is 0 <= value < modulus
+        :complexity: O(K) where K is the total size of the keys
+        """
+        base = self.hash_base
+        modulus = self.modulus
+        values = []
+        for key in keys:
+            value = 0
+            for c in key:
+                value = (value * base + ord(c)) % modulus
+            values.append(value)
+        return values
+
+    def __probe(self, key: str, is_insert: bool) -> int:
+        """
+        Finds the slot of key by scanning the control bytes of its groups for its fingerprint. An insert of a new
+        key claims the first deleted or empty slot on the way, setting its control byte and counting the item,
+        and leaves the slot itself holding None for the caller to fill.
+        :raises KeyError: when the key isn't found and it isn't an insert, or the table is full
+        :complexity best: O(K) the key's fingerprint only matches in its first group, where K is the size of the key
+        :complexity worst: O(K + N) when every group is scanned, where N is the table size
+        """
+        value = self.hash(key)
+        fingerprint = (value >> self.group_bits) & 0x7F
+        group = value & self.group_mask
+        control = self.control
+        table = self.table
+        size = self.GROUP_SIZE
+        probes = 0
+        free = -1
+        for step in range(1, self.group_mask + 2):
+            start = group * size
+            end = start + size
+            position = control.find(fingerprint, start, end)
+            while position >= 0:
+                if table[position][0] == key:
+                    self.probe_chain_counter += probes
+                    return position
+                probes += 1
+                position = control.find(fingerprint, position + 1, end)
+            empty = control.find(self.EMPTY_BYTE, start, end)
+            if is_insert and free < 0 and self.deleted > 0:
+                free = control.find(self.DELETED_BYTE, start, end)
+            if empty >= 0:
+                if free < 0:
+                    free = empty
+                break
+            group = (group + step) & self.group_mask
+            probes += 1
+
+        self.probe_chain_counter += probes
+        if not is_insert or free < 0:
+            raise KeyError(key)
+        self.probe_max.append(probes)
+        if probes > 0:
+            self.collisionCounterIncrement()
+        if control[free] == self.DELETED_BYTE:
+            self.deleted -= 1
+        control[free] = fingerprint
+        self.count += 1
+        self.version += 1
+        return free
+
+    def __rehash(self, min_size: int = 0) -> None:
+        """
+        Need to resize table and reinsert all values
+        The number of groups doubles until the table holds at least min_size slots. If deleted slots rather than
+        items fill the table, it is rebuilt at its current size instead.
+        :complexity: O(N) where N is the table size
+        """
+        self.rehashCounterIncrement()
+        new_size = len(self.table)
+        if self.count >= new_size * self.MAX_LOAD / 2 or min_size > new_size:
+            new_size *= 2
+            while new_size < min_size:
+                new_size *= 2
+        new_hash = SwissHashTable(self.hash_base, new_size, False)
+
+        for key, data in self.items():
+            new_hash[key] = data
+
+        self.count = new_hash.count
+        self.deleted = 0
+        self.table = new_hash.table
+        self.control = new_hash.control
+        self.group_mask = new_hash.group_mask
+        self.group_bits = new_hash.group_bits
+        self.modulus = new_hash.modulus
+        self.version += 1
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table once so that it can hold count items without having to rehash
+        :complexity: O(N) where N is the table size if it has to grow, O(1) otherwise
+        """
+        if count > len(self.table) * self.MAX_LOAD:
+            self.__rehash(int(count / self.MAX_LOAD) + 1)
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Get the item at a certain key
+        :see: #self.__probe(key: str, is_insert: bool)
+        :raises KeyError: when the item doesn't exist
+        """
+        return self.table[self.__probe(key, False)][1]
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :see: #self.__probe(key: str, is_insert: bool)
+        :see: #self.__rehash()
+        """
+        if self.count + self.deleted >= len(self.table) * self.MAX_LOAD:
+            self.__rehash()
+        self.table[self.__probe(key, True)] = (key, data)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes an item from our hash table. Its control byte goes back to EMPTY_BYTE if its group has an empty
+        slot, as no probe sequence moves past such a group, and becomes DELETED_BYTE otherwise.
+        :raises KeyError: when the key doesn't exist
+        :see: #self.__probe(key: str, is_insert: bool)
+        """
+        position = self.__probe(key, False)
+        start = position - position % self.GROUP_SIZE
+        self.table[position] = None
+        if self.control.find(self.EMPTY_BYTE, start, start + self.GROUP_SIZE) >= 0:
+            self.control[position] = self.EMPTY_BYTE
+        else:
+            self.control[position] = self.DELETED_BYTE
+            self.deleted += 1
+        self.count -= 1
+        self.version += 1
+
+    def setdefault(self, key: str, default: T) -> T:
+        """
+        Returns the data at key, first inserting it with data default if it doesn't exist yet.
+        The key is probed once.
+        :see: #self.__setitem__(self, key: str, data: T)
+        """
+        if self.count + self.deleted >= len(self.table) * self.MAX_LOAD:
+            self.__rehash()
+        position = self.__probe(key, True)
+        item = self.table[position]
+        if item is None:
+            self.table[position] = (key, default)
+            return default
+        return item[1]
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the data at key, inserting it with data amount if it doesn't exist yet.
+        The key is probed once.
+        :see: #self.__setitem__(self, key: str, data: T)
+        :return: the new data at key
+        """
+        if self.count + self.deleted >= len(self.table) * self.MAX_LOAD:
+            self.__rehash()
+        position = self.__probe(key, True)
+        item = self.table[position]
+        value = amount if item is None else item[1] + amount
+        self.table[position] = (key, value)
+        return value
+
+    def is_full(self):
+        """
+        Returns whether the hash table is full
+        :complexity: O(1)
+        """
+        return self.count + self.deleted == len(self.table)
+
+    def lookup_items(self, keys: Iterable[str]) -> List[Tuple[str, T]]:
+        """
+        Returns, for each key in order, the (key, data) pair stored in the Hash Table for it, or None if there is
+        none, leaving the statistics untouched.
+        :complexity best: O(K) every key is decided in its first group, where K is the total size of the keys
+        :complexity worst: O(K + B * N) where B is the number of keys and N is the table size
+        """
+        keys = list(keys)
+        control = self.control
+        table = self.table
+        size = self.GROUP_SIZE
+        mask = self.group_mask
+        bits = self.group_bits
+        empty_byte = self.EMPTY_BYTE
+        stored = []
+        for key, value in zip(keys, self.hash_many(keys)):
+            fingerprint = (value >> bits) & 0x7F
+            group = value & mask
+            found = None
+            for step in range(1, mask + 2):
+                start = group * size
+                end = start + size
+                position = control.find(fingerprint, start, end)
+                while position >= 0:
+                    item = table[position]
+                    if item[0] == key:
+                        found = item
+                        break
+                    position = control.find(fingerprint, position + 1, end)
+                if found is not None or control.find(empty_byte, start, end) >= 0:
+                    break
+                group = (group + step) & mask
+            stored.append(found)
+        return stored
+
+    def merge_counts(self, other: HashTable[T], combine: Callable[[T, T], T] = operator.add) -> None:
+        """
+        Merges other into this table, replacing the data of keys present in both with combine(mine, theirs).
+        Each key is probed once. As in __setitem__, deleted slots filling the table beyond MAX_LOAD rehash it
+        before the next key.
+        :complexity: O(N + M) where N and M are the sizes of the two tables
+        """
+        self.reserve(self.count + len(other))
+        for key, data in other.items():
+            if self.count + self.deleted >= len(self.table) * self.MAX_LOAD:
+                self.__rehash()
+            position = self.__probe(key, True)
+            item = self.table[position]
+            self.table[position] = (key, data if item is None else combine(item[1], data))
+
+    def items(self) -> Iterator[Tuple[str, T]]:
+        """
+        Yields every (key, data) pair in the hash table (no particular order)
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N) to exhaust where N is the table size
+        """
+        version = self.version
+        for _, item in self.table.iter_nonempty():
+            if self.version != version:
+                raise RuntimeError("Hash table changed during iteration")
+            yield item
+        if self.version != version:
+            raise RuntimeError("Hash table changed during iteration")
+
+
+class PackedKeyHashTable(HashTable[int]):
+    """
+    Packed Key Hash Table
+
+    A linear probing table for int data that keeps no Python object per item. The keys are encoded as UTF-8 and
+    appended to one bytearray, buffer; item i is the bytes from offsets[i] to offsets[i + 1], with its data in
+    data[i], and each slot of the table holds the number of its item (or EMPTY_SLOT or DELETED_SLOT) in an array
+    of machine ints. Keys are hashed over their UTF-8 bytes, which for ASCII keys gives the same positions as
+    HashTable.hash, and a lookup compares the bytes of the key against the buffer without building a str.
+
+    compact() sorts the items and can front-code them: in every block of FRONT_CODING_BLOCK items, the first is
+    kept whole and each other one only as the number of leading bytes it shares with the one before it (one byte)
+    followed by the rest of it. Comparing a key against a front-coded item decodes the block up to it, so this
+    trades lookup time for memory, and suits a dictionary that is loaded once. Items added after compact() are
+    kept whole, and a rehash drops the front coding.
+
+    Deleting leaves a tombstone in the slot; the item's bytes stay in the buffer until the next rehash or
+    compact(), which rebuild it from the items left. Keys are strs and data ints, and the buffer is limited to 4 GB
+    as offsets are unsigned 32-bit ints.
+
+    constants:
+        MAX_LOAD: the table is rehashed once items and tombstones fill more than this fraction of it
+        EMPTY_SLOT, DELETED_SLOT: what a slot holds when it is empty or its item was deleted
+        FRONT_CODING_BLOCK: number of items in a front-coded block
+
+    attributes (besides those of HashTable):
+        buffer: the UTF-8 bytes of every item's key
+        offsets: where the key of each item starts in buffer, followed by the end of the buffer
+        data: the data of each item
+        coded: number of leading items that are front-coded
+        deleted: number of tombstones in the hash table
+    """
+    MAX_LOAD = 0.5
+    EMPTY_SLOT = -1
+    DELETED_SLOT = -2
+    FRONT_CODING_BLOCK = 8
+
+    def __init__(self, hash_base: int = HashTable.DEFAULT_HASH_BASE,
+                 table_size: int = HashTable.DEFAULT_TABLE_SIZE, adaptive: bool = True) -> None:
+        """
+        :complexity: O(N) where N is the table_size
+        """
+        HashTable.__init__(self, hash_base, table_size, adaptive)
+        self.table = array('i', [self.EMPTY_SLOT]) * len(self.table)
+        self.buffer = bytearray()
+        self.offsets = array('I', [0])
+        self.data = array('q')
+        self.coded = 0
+        self.deleted = 0
+
+    def __hash_bytes(self, encoded: bytes) -> int:
+        """
+        Universal Hash function over the UTF-8 bytes of a key
+        :post: returns a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the size of the key
+        """
+        value = 0
+        base = self.hash_base
+        size = len(self.table)
+        for byte in encoded:
+            value = (value * base + byte) % size
+        return value
+
+    def hash(self, key: str) -> int:
+        """
+        Universal Hash function over the UTF-8 bytes of key
+        :post: returns a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the size of the key
+        """
+        return self.__hash_bytes(key.encode())
+
+    def hash_many(self, keys: Iterable[str]) -> List[int]:
+        """
+        Hashes a batch of keys
+        :post: every value is a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the total size of the keys
+        """
+        return [self.__hash_bytes(key.encode()) for key in keys]
+
+    def __key_bytes(self, item: int) -> bytes:
+        """
+        Returns the UTF-8 bytes of the key of item, decoding its block up to it if it is front-coded
+        :complexity: O(K) where K is the size of the key, or O(B * K) for a front-coded item where B is
+                     FRONT_CODING_BLOCK
+        """
+        buffer = self.buffer
+        offsets = self.offsets
+        if item >= self.coded:
+            return bytes(buffer[offsets[item]:offsets[item + 1]])
+        first = item - item % self.FRONT_CODING_BLOCK
+        key = bytes(buffer[offsets[first] + 1:offsets[first + 1]])
+        for i in range(first + 1, item + 1):
+            key = key[:buffer[offsets[i]]] + buffer[offsets[i] + 1:offsets[i + 1]]
+        return bytes(key)
+
+    def __matches(self, item: int, encoded: bytes) -> bool:
+        """
+        Returns whether the key of item is encoded, comparing in place unless it is front-coded
+        :complexity: O(K) where K is the size of the key, or O(B * K) for a front-coded item
+        """
+        if item < self.coded:
+            return self.__key_bytes(item) == encoded
+        start = self.offsets[item]
+        return self.offsets[item + 1] - start == len(encoded) and self.buffer.startswith(encoded, start)
+
+    def __probe(self, encoded: bytes, is_insert: bool) -> int:
+        """
+        Find the correct position for this key in the hash table by probing linearly, recording the probe chain
+        of inserts as the other tables do. An insert goes into the first tombstone on the way, if any.
+        :raises KeyError: When a position can't be found
+        :complexity best: O(K) first position is empty, where K is the size of the key
+        :complexity worst: O(K + N) when we've searched the entire table, where N is the table_size
+        """
+        position = self.__hash_bytes(encoded)
+        table = self.table
+        size = len(table)
+        free = -1
+        # the chain counted is this probe's alone: lookups, and inserts that find their key, leave it behind
+        self.probe_max_counter = 0
+        for _ in range(size):
+            item = table[position]
+            if item == self.EMPTY_SLOT:
+                if is_insert:
+                    self.__end_probe_chain()
+                    return position if free < 0 else free
+                raise KeyError(encoded.decode())
+            if item == self.DELETED_SLOT:
+                if free < 0:
+                    free = position
+            elif self.__matches(item, encoded):
+                return position
+            position = (position + 1) % size
+            self.probeChainIncrement()
+            self.probeMaxCounterIncrement()
+
+        if is_insert and free >= 0:
+            self.__end_probe_chain()
+            return free
+        raise KeyError(encoded.decode())
+
+    def __end_probe_chain(self) -> None:
+        """
+        Records the probe chain of a key being inserted, counting a collision if it probed at all
+        :complexity: O(1)
+        """
+        self.probe_max.append(self.probe_max_counter)
+        if self.probe_max_counter > 0:
+            self.collisionCounterIncrement()
+        self.probe_max_counter = 0
+
+    def __add(self, position: int, encoded: bytes, data: int) -> None:
+        """
+        Appends a new item to the buffer and stores its number at an empty or deleted position. The data is
+        appended first, so that data that doesn't fit it leaves the table as it was.
+        :complexity: O(K) amortised where K is the size of the key
+        :raises TypeError: when data is not an int
+        :raises OverflowError: when data doesn't fit in 64 bits
+        """
+        self.data.append(data)
+        if self.table[position] == self.DELETED_SLOT:
+            self.deleted -= 1
+        self.table[position] = len(self.data) - 1
+        self.buffer += encoded
+        self.offsets.append(len(self.buffer))
+        self.count += 1
+        self.version += 1
+
+    def __place(self, item: int) -> None:
+        """
+        Stores item at the first empty position from the hash of its key, which is known not to be in the table
+        yet, without comparing keys
+        :complexity: O(K + N) worst case where K is the size of the key and N the table size
+        """
+        table = self.table
+        size = len(table)
+        position = self.__hash_bytes(self.__key_bytes(item))
+        while table[position] != self.EMPTY_SLOT:
+            position = (position + 1) % size
+        table[position] = item
+
+    def __items(self) -> Iterator[Tuple[bytes, int]]:
+        """
+        Yields the UTF-8 key and the data of every item left in the table, in the order they were added (sorted
+        if compacted), decoding front-coded blocks as it goes
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N + B) to exhaust where N is the table size and B the size of the buffer
+        """
+        version = self.version
+        live = bytearray(len(self.data))
+        for item in self.table:
+            if item >= 0:
+                live[item] = 1
+        buffer = self.buffer
+        offsets = self.offsets
+        key = b""
+        for item in range(len(self.data)):
+            if item < self.coded and item % self.FRONT_CODING_BLOCK != 0:
+                key = key[:buffer[offsets[item]]] + buffer[offsets[item] + 1:offsets[item + 1]]
+            elif item < self.coded:
+                key = bytes(buffer[offsets[item] + 1:offsets[item + 1]])
+            else:
+                key = bytes(buffer[offsets[item]:offsets[item + 1]])
+            if live[item]:
+                if self.version != version:
+                    raise RuntimeError("Hash table changed during iteration")
+                yield bytes(key), self.data[item]
+        if self.version != version:
+            raise RuntimeError("Hash table changed during iteration")
+
+    def __rebuild(self, items: List[Tuple[bytes, int]], size: int, front_coding: bool) -> None:
+        """
+        Replaces the table, buffer, offsets and data with the given (UTF-8 key, data) items, front-coding them if
+        asked, in a table of the given size
+        :complexity: O(N + B) where N is the table size and B the size of the buffer
+        """
+        buffer = bytearray()
+        offsets = array('I', [0])
+        previous = b""
+        for i, (key, _) in enumerate(items):
+            if front_coding:
+                shared = 0
+                if i % self.FRONT_CODING_BLOCK != 0:
+                    limit = min(len(key), len(previous), 255)
+                    while shared < limit and key[shared] == previous[shared]:
+                        shared += 1
+                buffer.append(shared)
+                buffer += key[shared:]
+                previous = key
+            else:
+                buffer += key
+            offsets.append(len(buffer))
+        self.buffer = buffer
+        self.offsets = offsets
+        self.data = array('q', [data for _, data in items])
+        self.coded = len(items) if front_coding else 0
+        self.table = array('i', [self.EMPTY_SLOT]) * size
+        for item in range(len(items)):
+            self.__place(item)
+        self.count = len(items)
+        self.deleted = 0
+        self.version += 1
+
+    def __rehash(self, min_size: int = 0) -> None:
+        """
+        Need to resize table and reinsert all items, rebuilding the buffer without front coding
+        The new size is next_table_size(min_size).
+        If tombstones rather than items fill the table, it is rebuilt at its current size instead.
+        :complexity: O(N + B) where N is the table size and B the size of the buffer
+        """
+        self.rehashCounterIncrement()
+        if self.count < len(self.table) * self.MAX_LOAD / 2 and min_size <= len(self.table):
+            new_size = len(self.table)
+        else:
+            new_size = self.next_table_size(min_size)
+        self.__rebuild(list(self.__items()), new_size, False)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table once so that it can hold count items without __setitem__ having to rehash
+        :complexity: O(N + B) where N is the table size and B the size of the buffer if it has to grow, O(1)
+                     otherwise
+        """
+        if count > len(self.table) * self.MAX_LOAD:
+            self.__rehash(int(count / self.MAX_LOAD) + 1)
+
+    def compact(self, front_coding: bool = True) -> None:
+        """
+        Rebuilds the buffer with the items sorted by key, front-coded if asked, dropping the bytes of deleted
+        items, in a table just large enough to hold them within MAX_LOAD. Item numbers change, the data doesn't.
+        :complexity: O(N log N + B) where N is the number of items and B the size of the buffer
+        """
+        items = sorted(self.__items())
+        size = len(self.table)
+        for prime in self.PRIMES:
+            if len(items) <= prime * self.MAX_LOAD:
+                size = prime
+                break
+        # growing goes on from the primes after the new size, as it does after __init__
+        self.next_prime = 0
+        while self.next_prime < len(self.PRIMES) and self.PRIMES[self.next_prime] <= size:
+            self.next_prime += 1
+        self.__rebuild(items, size, front_coding)
+
+    def __getitem__(self, key: str) -> int:
+        """
+        Get the item at a certain key
+        :see: #self.__probe(encoded: bytes, is_insert: bool)
+        :raises KeyError: when the item doesn't exist
+        """
+        return self.data[self.table[self.__probe(key.encode(), False)]]
+
+    def __setitem__(self, key: str, data: int) -> None:
+        """
+        Set an (key, data) pair in our hash table
+        :see: #self.__probe(encoded: bytes, is_insert: bool)
+        :see: #self.__rehash()
+        """
+        if (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
+        encoded = key.encode()
+        position = self.__probe(encoded, True)
+        item = self.table[position]
+        if item < 0:
+            self.__add(position, encoded, data)
+        else:
+            self.data[item] = data
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes an item from our hash table by leaving a tombstone in its slot
+        :raises KeyError: when the key doesn't exist
+        :see: #self.__probe(encoded: bytes, is_insert: bool)
+        """
+        position = self.__probe(key.encode(), False)
+        self.table[position] = self.DELETED_SLOT
+        self.deleted += 1
+        self.count -= 1
+        self.version += 1
+
+    def setdefault(self, key: str, default: int) -> int:
+        """
+        Returns the data at key, first inserting it with data default if it doesn't exist yet.
+        The key is probed once.
+        :see: #self.__setitem__(self, key: str, data: int)
+        """
+        if (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
+        encoded = key.encode()
+        position = self.__probe(encoded, True)
+        item = self.table[position]
+        if item < 0:
+            self.__add(position, encoded, default)
+            return default
+        return self.data[item]
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the data at key, inserting it with data amount if it doesn't exist yet.
+        The key is probed once.
+        :see: #self.__setitem__(self, key: str, data: int)
+        :return: the new data at key
+        """
+        if (self.count + self.deleted) / len(self.table) > self.MAX_LOAD:
+            self.__rehash()
+        encoded = key.encode()
+        position = self.__probe(encoded, True)
+        item = self.table[position]
+        if item < 0:
+            self.__add(position, encoded, amount)
+            return amount
+        self.data[item] += amount
+        return self.data[item]
+
+    def is_full(self):
+        """
+        Returns whether the hash table is full
+        :complexity: O(1)
+        """
+        return self.count + self.deleted == len(self.table)
+
+    def lookup_items(self, keys: Iterable[str]) -> List[Tuple[str, int]]:
+        """
+        Returns, for each key in order, the (key, data) pair for it, or None if there is none, leaving the
+        statistics untouched. As the table holds no key objects, the pair holds the key passed in.
+        :complexity best: O(K) every key is found in its first position, where K is the total size of the keys
+        :complexity worst: O(K + B * N) where B is the number of keys and N is the table size
+        """
+        table = self.table
+        size = len(table)
+        stored = []
+        for key in keys:
+            encoded = key.encode()
+            position = self.__hash_bytes(encoded)
+            found = None
+            for _ in range(size):
+                item = table[position]
+                if item == self.EMPTY_SLOT:
+                    break
+                if item >= 0 and self.__matches(item, encoded):
+                    found = (key, self.data[item])
+                    break
+                position = (position + 1) % size
+            stored.append(found)
+        return stored
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """
+        Yields every (key, data) pair in the hash table (in the order they were added, or sorted by key since
+        the last compact())
+        :raises RuntimeError: when the table is modified during iteration
+        :complexity: O(N + B) to exhaust where N is the table size and B the size of the buffer
+        """
+        for key, data in self.__items():
+            yield key.decode(), data
+
+    def memory_usage(self) -> Tuple:
+        """
+        Returns the bytes allocated for the buffer, the offsets and data arrays, and the table of slots
+        :complexity: O(1)
+        """
+        return (self.buffer.__sizeof__(), self.offsets.__sizeof__() + self.data.__sizeof__(),
+                self.table.__sizeof__())
@@ -2,15 +2,13 @@
 
 Defines a generic abstract list with the usual methods, and implements
 a list using arrays and linked nodes. It also includes a linked list iterator.
-Also defines UnitTests for the class.
+The UnitTests for the classes are in test_list_adt.py.
 """
 __author__ = "Maria Garcia de la Banda, modified by Brendon Taylor"
 __docformat__ = 'reStructuredText'
 
-import unittest
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Generic
+from typing import Generic, Iterable, Iterator, Union
 from referential_array import ArrayR, T
 
 
@@ -115,24 +113,56 @@ class ArrayList(ListADT[T]):
          array (ArrayR[T]): array storing the elements of the list
 
     ArrayR cannot create empty arrays. So MIN_CAPCITY used to avoid this.
+    The array is replaced by one GROWTH_FACTOR times larger whenever it
+    runs out of room, so appending is amortised O(1).
     """
     MIN_CAPACITY = 1
+    GROWTH_FACTOR = 2
 
     def __init__(self, max_capacity: int) -> None:
         """ Initialises self.length by calling its parent and
-        self.array as an ArrayList of appropriate capacity
+        self.array as an ArrayList of appropriate capacity.
+        max_capacity is only the initial capacity, the list grows past it.
         :complexity: O(len(self)) always due to the ArrarR call
         """
         ListADT.__init__(self)
         self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the value of the element at position index
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, 'ArrayListView[T]']:
+        """ Returns the value of the element at position index, or a view
+        of the selected elements if index is a slice (see ArrayListView)
         :pre: index is 0 <= index < len(self) checked by ArrayR's method
         :complexity: O(1)
         """
+        if isinstance(index, slice):
+            return ArrayListView(self, range(*index.indices(len(self))))
         return self.array[index]
 
+    def __iter__(self) -> Iterator[T]:
+        """ Returns an iterator over the items of the list, first to last
+        :complexity: O(1)
+        """
+        return (self.array[i] for i in range(len(self)))
+
+    def __resize(self, capacity: int) -> None:
+        """ Moves the items into a new array of the given capacity
+        :complexity: O(capacity)
+        :pre: capacity >= len(self)
+        """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, len(self))
+        self.array = new_array
+
+    def __ensure_capacity(self, needed: int) -> None:
+        """ Grows the array geometrically until it can hold needed items
+        :complexity: O(needed) if it has to grow, O(1) otherwise
+        """
+        capacity = len(self.array)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= self.GROWTH_FACTOR
+            self.__resize(capacity)
+
     def __setitem__(self, index: int, value: T) -> None:
         """ Sets the value of the element at position index to be item
         :pre: index is 0 <= index < len(self) checked by ArrayR's method
@@ -146,8 +176,7 @@ class ArrayList(ListADT[T]):
         :complexity worst: O(N) shuffle from the start of the list
         where N is the number of items in the list
         """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array.copy_from(self.array, index, index + 1, len(self) - index)
 
     def __shuffle_left(self, index: int) -> None:
         """ Shuffles all the items to the left from index
@@ -155,14 +184,13 @@ class ArrayList(ListADT[T]):
         :complexity worst: O(N) shuffle from the end of the list
         where N is the number of items in the list
         """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array.copy_from(self.array, index + 1, index, len(self) - index)
 
     def is_full(self):
-        """ Returns true if the list is full
+        """ Returns False, as the array grows whenever it runs out of room
         :complexity: O(1)
         """
-        return len(self) >= len(self.array)
+        return False
 
     def index(self, item: T) -> int:
         """ Returns the position of the first occurrence of item
@@ -192,12 +220,82 @@ class ArrayList(ListADT[T]):
         :pre: index is 0 <= index <= len(self) checked by self.array[_]
         :complexity: O(len(self)-index) if no resizing needed, O(len(self)) otherwise
         """
-        if self.is_full():
-            raise Exception("List is full")
+        self.__ensure_capacity(len(self) + 1)
         self.__shuffle_right(index)
         self.array[index] = item
         self.length += 1
 
+    def extend(self, items: Iterable[T]) -> None:
+        """ Appends all the items, growing the array at most once and
+        copying them in as a single block
+        :complexity: O(len(items)) if no resizing needed, O(len(self) + len(items)) otherwise
+        """
+        if isinstance(items, ArrayList):
+            count = len(items)
+            self.__ensure_capacity(len(self) + count)
+            self.array.copy_from(items.array, 0, len(self), count)
+        else:
+            items = list(items)
+            count = len(items)
+            self.__ensure_capacity(len(self) + count)
+            self.array[len(self):len(self) + count] = items
+        self.length += count
+
+
+class ArrayListView(Generic[T]):
+    """ A zero-copy view of some of the positions of an ArrayList, as
+    returned by slicing it. Reading or writing through the view reads or
+    writes the underlying list, and slicing a view gives another view.
+    Inserting into or deleting from the list shifts what the view sees.
+
+    Attributes:
+         source (ArrayList[T]): the list being viewed
+         indices (range): the positions of source covered by the view
+    """
+
+    def __init__(self, source: ArrayList[T], indices: range) -> None:
+        """ Initialises the view of the given positions of source
+        :complexity: O(1)
+        """
+        self.source = source
+        self.indices = indices
+
+    def __len__(self) -> int:
+        """ Returns the number of positions in the view
+        :complexity: O(1)
+        """
+        return len(self.indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, 'ArrayListView[T]']:
+        """ Returns the item at position index of the view, or a narrower
+        view if index is a slice
+        :raises IndexError: if index is out of the view's range
+        :complexity: O(1)
+        """
+        if isinstance(index, slice):
+            return ArrayListView(self.source, self.indices[index])
+        return self.source.array[self.indices[index]]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Sets the item at position index of the view
+        :raises IndexError: if index is out of the view's range
+        :complexity: O(1)
+        """
+        self.source.array[self.indices[index]] = item
+
+    def __iter__(self) -> Iterator[T]:
+        """ Returns an iterator over the items in the view
+        :complexity: O(1)
+        """
+        array = self.source.array
+        return (array[i] for i in self.indices)
+
+    def __str__(self) -> str:
+        """ Converts the view into a string, first to last
+        :complexity: O(len(self) * M), M is the size of biggest item
+        """
+        return "[" + ", ".join(str(item) for item in self) + "]"
+
 
 class Node(Generic[T]):
     """ Implementation of a generic Node class
@@ -250,18 +348,36 @@ class LinkListIterator(Generic[T]):
 class LinkList(ListADT[T]):
     """ Implementation of a generic list with linked nodes.
 
+    Indexed access resumes from the last node it reached (the cursor)
+    whenever the requested index is at or after it, so a loop over
+    self[0], self[1], ... walks the list once instead of once per index.
+    The last node is kept in tail, making append O(1). If skip_interval is
+    given, a skip array holding every skip_interval-th node is built on
+    the first indexed access after a change, so a random access walks at
+    most skip_interval - 1 links from the nearest skip.
+
     Attributes:
          length (int): number of elements in the list (inherited)
          head (Node[T]): node at the head of the list
+         tail (Node[T]): node at the end of the list
+         cursor (Node[T]): node most recently reached by an indexed access
+         cursor_index (int): position of cursor, or -1 if there is none
+         skip_interval (int): distance between skips, 0 if they are disabled
+         skips (ArrayR[Node[T]]): every skip_interval-th node, or None if stale
     """
 
-    def __init__(self) -> None:
+    def __init__(self, skip_interval: int = 0) -> None:
         """ Initialises self.length by calling its parent and
         self.head as None, since the list is initially empty
         :complexity: O(1)
         """
         ListADT.__init__(self)
         self.head = None
+        self.tail = None
+        self.cursor = None
+        self.cursor_index = -1
+        self.skip_interval = skip_interval
+        self.skips = None
 
     def __iter__(self) -> LinkListIterator[T]:
         """ Computes and returns an iterator for the current list
@@ -289,15 +405,50 @@ class LinkList(ListADT[T]):
         """
         return False
 
+    def __build_skips(self) -> None:
+        """ Rebuilds the skip array from the current nodes
+        :complexity: O(len(self))
+        """
+        self.skips = ArrayR((len(self) - 1) // self.skip_interval + 1)
+        current = self.head
+        for i in range(len(self)):
+            if i % self.skip_interval == 0:
+                self.skips[i // self.skip_interval] = current
+            current = current.link
+
+    def __changed(self, index: int) -> None:
+        """ Drops the skip array if the change at position index moved any
+        of the nodes it points to. Changes past the last skip are left to
+        __get_node_at_index, which walks on from the last skip
+        :complexity: O(1)
+        """
+        if self.skips is not None and index < len(self.skips) * self.skip_interval:
+            self.skips = None
+
     def __get_node_at_index(self, index: int) -> Node[T]:
-        """ Returns the node in the list at position index
-        :complexity: O(index)
+        """ Returns the node in the list at position index, walking from the
+        closest of head, the nearest skip and the cursor that is not past it
+        :complexity: O(1) for the last node or the cursor's successor,
+                     O(min(index, skip_interval)) with skips (plus the nodes
+                     appended since they were built),
+                     O(index - cursor_index) from the cursor, O(index) otherwise
         :pre: index is 0 <= index < len(self)
         """
         if 0 <= index and index < len(self):
-            current = self.head
-            for i in range(index):
+            if index == len(self) - 1:
+                return self.tail
+            current, position = self.head, 0
+            if self.skip_interval > 0:
+                if self.skips is None:
+                    self.__build_skips()
+                # nodes appended since the skips were built are past the last skip
+                skip = min(index // self.skip_interval, len(self.skips) - 1)
+                current, position = self.skips[skip], skip * self.skip_interval
+            if position < self.cursor_index <= index:
+                current, position = self.cursor, self.cursor_index
+            for _ in range(index - position):
                 current = current.link
+            self.cursor, self.cursor_index = current, index
             return current
         else:
             raise ValueError("Index out of bounds")
@@ -305,16 +456,24 @@ class LinkList(ListADT[T]):
     def insert(self, index: int, item: T) -> None:
         """ Moves self[j] to self[j+1] if j>=index & sets self[index]=item
         :pre: index is 0 <= index <= len(self), checked by __get_node_at_index
-        :complexity: O(index)
+        :complexity: O(1) at either end, otherwise as __get_node_at_index(index - 1)
         """
         new_node = Node(item)
         if index == 0:
             new_node.link = self.head
             self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
+            if self.cursor_index >= 0:
+                self.cursor_index += 1
+        elif index == len(self):
+            self.tail.link = new_node
+            self.tail = new_node
         else:
             previous_node = self.__get_node_at_index(index - 1)
             new_node.link = previous_node.link
             previous_node.link = new_node
+        self.__changed(index)
         self.length += 1
 
     def index(self, item: T) -> int:
@@ -336,7 +495,7 @@ class LinkList(ListADT[T]):
     def delete_at_index(self, index: int) -> T:
         """ Moves self[j+1] to self[j] if j>index & returns old self[index]
         :pre: index is 0 <= index < len(self), checked by __get_node_at_index
-        :complexity: O(index)
+        :complexity: O(1) at the head, otherwise as __get_node_at_index(index - 1)
         """
         try:
             previous_node = self.__get_node_at_index(index - 1)
@@ -346,11 +505,20 @@ class LinkList(ListADT[T]):
             elif index == 0:
                 item = self.head.item
                 self.head = self.head.link
+                if self.head is None:
+                    self.tail = None
+                if self.cursor_index == 0:
+                    self.cursor, self.cursor_index = None, -1
+                elif self.cursor_index > 0:
+                    self.cursor_index -= 1
             else:
                 raise e
         else:
             item = previous_node.link.item
+            if previous_node.link is self.tail:
+                self.tail = previous_node
             previous_node.link = previous_node.link.link
+        self.__changed(index)
         self.length -= 1
         return item
 
@@ -366,10 +534,15 @@ class LinkList(ListADT[T]):
                 self.length -= 1
             else:
                 previous = current  # move previous along
+        self.tail = previous
 
         if self.length > 0 and self.head.item < 0:  # check node at index 0
             self.head = self.head.link  # move the head
             self.length -= 1
+            if self.length == 0:
+                self.tail = None
+        self.cursor, self.cursor_index = None, -1
+        self.skips = None
 
     def clear(self):
         """ Overrides the parent to set the head to None
@@ -377,108 +550,6 @@ class LinkList(ListADT[T]):
         """
         ListADT.clear(self)
         self.head = None
-
-
-class DataStructure(Enum):
-    ARRAY = 1
-    LINK = 2
-
-
-class TestList(unittest.TestCase):
-    """ Tests for the above class."""
-    EMPTY = 0
-    ROOMY = 5
-    LARGE = 10
-
-    def setUp(self):
-        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
-        if test_list == DataStructure.ARRAY:
-            self.lists = [ArrayList(self.LARGE) for i in range(len(self.lengths))]
-        else:
-            self.lists = [LinkList() for i in range(len(self.lengths))]
-        for list, length in zip(self.lists, self.lengths):
-            for i in range(length):
-                list.append(i)
-        self.empty_list = self.lists[0]
-        self.roomy_list = self.lists[1]
-        self.large_list = self.lists[2]
-        # we build empty lists from clear.
-        # this is an indirect way of testing if clear works!
-        # (perhaps not the best)
-        self.clear_list = self.lists[3]
-        self.clear_list.clear()
-        self.lengths[3] = 0
-        self.lists[4].clear()
-        self.lengths[4] = 0
-
-    def tearDown(self):
-        for s in self.lists:
-            s.clear()
-
-    def test_init(self) -> None:
-        self.assertTrue(self.empty_list.is_empty())
-        self.assertEqual(len(self.empty_list), 0)
-
-    def test_len(self):
-        """ Tests the length of all lists created during setup."""
-        for list, length in zip(self.lists, self.lengths):
-            self.assertEqual(len(list), length)
-
-    def test_is_empty_add(self):
-        """ Tests lists that have been created empty/non-empty."""
-        self.assertTrue(self.empty_list.is_empty())
-        self.assertFalse(self.roomy_list.is_empty())
-        self.assertFalse(self.large_list.is_empty())
-
-    def test_is_empty_clear(self):
-        """ Tests lists that have been cleared."""
-        for list in self.lists:
-            list.clear()
-            self.assertTrue(list.is_empty())
-
-    def test_is_empty_delete_at_index(self):
-        """ Tests lists that have been created and then deleted completely."""
-        for list in self.lists:
-            # we empty the list
-            for i in range(len(list)):
-                self.assertEqual(list.delete_at_index(0), i)
-            try:
-                list.delete_at_index(-1)
-            except:
-                self.assertTrue(list.is_empty())
-
-    def test_append_and_remove_item(self):
-        for list in self.lists:
-            nitems = self.ROOMY
-            list.clear()
-            for i in range(nitems):
-                list.append(i)
-            for i in range(nitems - 1):
-                list.remove(i)
-                self.assertEqual(list[0], i + 1)
-            list.remove(nitems - 1)
-            self.assertTrue(list.is_empty())
-            for i in range(nitems):
-                list.append(i)
-            for i in range(nitems - 1, 0, -1):
-                list.remove(i)
-                self.assertEqual(list[len(list) - 1], i - 1)
-            list.remove(0)
-            self.assertTrue(list.is_empty())
-
-    def test_clear(self):
-        for list in self.lists:
-            list.clear()
-            self.assertTrue(list.is_empty())
-
-
-if __name__ == '__main__':
-    test_list = DataStructure.ARRAY
-    testtorun = TestList()
-    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
-    unittest.TextTestRunner().run(suite)
-
-    test_list = DataStructure.LINK
-    testtorun = TestList()
-    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
-    unittest.TextTestRunner().run(suite)
\ No newline at end of file
+        self.tail = None
+        self.cursor, self.cursor_index = None, -1
+        self.skips = None
@@ -0,0 +1,65 @@
+""" Prefix Index
+
+A secondary index over the words of a Dictionary for prefix queries. The
+words are kept sorted in an ArrayR, so every word starting with a prefix
+sits in one contiguous run that is found by binary search.
+"""
+__author__ = 'Daiki Kubo'
+
+import sys
+from bisect import bisect_left
+from referential_array import ArrayR
+from typing import Iterable, List, Tuple
+
+
+class PrefixIndex:
+    """
+    Sorted array of words answering words_with_prefix queries
+
+    attributes:
+        words: an ArrayR holding the words in sorted order
+        count: number of words in the index
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Builds the index by sorting the given words
+        :complexity: O(N log N * K) where N is the number of words and K the size of the longest word
+        """
+        ordered = sorted(words)
+        self.count = len(ordered)
+        self.words = ArrayR(max(1, self.count))
+        if self.count > 0:
+            self.words[0:self.count] = ordered
+
+    def __len__(self) -> int:
+        """
+        Returns the number of words in the index
+        :complexity: O(1)
+        """
+        return self.count
+
+    def words_with_prefix(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Returns the words starting with prefix in sorted order, at most limit of them if a limit is given
+        :complexity: O(K log N + M * K) where M is the number of words returned and K the size of the prefix
+        """
+        words = self.words
+        position = bisect_left(words, prefix, 0, self.count)
+        end = self.count if limit is None else min(self.count, position + limit)
+        result = []
+        while position < end and words[position].startswith(prefix):
+            result.append(words[position])
+            position += 1
+        return result
+
+    def memory_report(self) -> Tuple:
+        """
+        Returns a tuple containing word_count, index_bytes and word_bytes. index_bytes is what the index adds on
+        top of the hash table (the sorted array of references), while word_bytes is the size of the strings it
+        refers to, which are the same objects the hash table already holds.
+        :complexity: O(N) where N is the number of words
+        """
+        index_bytes = sys.getsizeof(self.words) + sys.getsizeof(self.words.array)
+        word_bytes = sum(sys.getsizeof(self.words[i]) for i in range(self.count))
+        return self.count, index_bytes, word_bytes
@@ -0,0 +1,164 @@
+""" Opt-in timing spans for the Dictionary and Frequency pipelines.
+
+The slow stages of the pipelines are wrapped in named spans:
+
+    with span("frequency.count"):
+        ...
+
+While profiling is disabled (the default) span returns one shared object
+whose __enter__ and __exit__ do nothing, so a span costs a few hundred
+nanoseconds and nothing is recorded. Code called once per word checks the
+module's enabled flag (read it as profiling.enabled, never set it) and
+only enters a span when it is set. enable() starts recording, for every span name,
+the number of calls, the time spent inside and optionally the memory
+allocated (net, through tracemalloc); breakdown() and print_breakdown()
+report them per stage. Times are inclusive: a span nested inside another
+is counted in both.
+
+enable() can also attach cProfile to chosen stages; each gets its own
+profiler, accumulated over every call, and profile_stats() returns its
+pstats.Stats. Only one profiler runs at a time, so a profiled span nested
+inside another profiled span is covered by the outer one.
+
+cProfile, pstats and tracemalloc are only imported once they are asked
+for, so importing this module (and through it the pipelines) stays cheap.
+"""
+__docformat__ = 'reStructuredText'
+
+import sys
+from time import perf_counter
+from typing import Iterable, List, TextIO, Tuple
+
+enabled = False  # whether spans are being recorded, set through enable and disable
+_allocations = False
+_started_tracing = False
+_profiled = frozenset()
+_active_profiler = None
+_totals = {}  # name -> [calls, seconds, bytes]
+_profilers = {}  # name -> cProfile.Profile
+_tracemalloc = None  # the tracemalloc module, imported by enable the first time allocations are asked for
+
+
+class _NoSpan:
+    """ The span handed out while profiling is disabled """
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    """ Records one call of a stage into the module totals """
+    __slots__ = ("name", "totals", "start", "memory", "profiler")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.profiler = None
+
+    def __enter__(self) -> None:
+        global _active_profiler
+        if self.name in _profiled and _active_profiler is None:
+            self.profiler = _profilers.get(self.name)
+            if self.profiler is None:
+                import cProfile
+                self.profiler = _profilers[self.name] = cProfile.Profile()
+            _active_profiler = self.profiler
+            self.profiler.enable()
+        self.totals = _totals.setdefault(self.name, [0, 0.0, 0])
+        self.memory = _tracemalloc.get_traced_memory()[0] if _allocations else 0
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        global _active_profiler
+        elapsed = perf_counter() - self.start
+        allocated = _tracemalloc.get_traced_memory()[0] - self.memory if _allocations else 0
+        if self.profiler is not None:
+            self.profiler.disable()
+            _active_profiler = None
+        totals = self.totals
+        totals[0] += 1
+        totals[1] += elapsed
+        totals[2] += allocated
+
+
+def span(name: str):
+    """ Returns a context manager timing the enclosed block under name
+    :complexity: O(1)
+    """
+    if not enabled:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def enable(allocations: bool = False, profile: Iterable[str] = ()) -> None:
+    """ Starts recording spans, adding to anything recorded before
+    :param allocations: whether to also record the memory allocated in each span, starting tracemalloc
+    if it isn't running. This slows everything down considerably.
+    :param profile: the names of the spans to attach cProfile to
+    :complexity: O(1)
+    """
+    global enabled, _allocations, _started_tracing, _profiled, _tracemalloc
+    enabled = True
+    _allocations = allocations
+    _profiled = frozenset(profile)
+    if not allocations:
+        return
+    if _tracemalloc is None:
+        import tracemalloc
+        _tracemalloc = tracemalloc
+    if not _tracemalloc.is_tracing():
+        _tracemalloc.start()
+        _started_tracing = True
+
+
+def disable() -> None:
+    """ Stops recording spans, keeping what was recorded, and stops tracemalloc if enable started it
+    :complexity: O(1)
+    """
+    global enabled, _allocations, _started_tracing
+    if _started_tracing:
+        _tracemalloc.stop()
+        _started_tracing = False
+    enabled = False
+    _allocations = False
+
+
+def reset() -> None:
+    """ Forgets every recorded span and profile
+    :complexity: O(1)
+    """
+    _totals.clear()
+    _profilers.clear()
+
+
+def breakdown() -> List[Tuple[str, int, float, int]]:
+    """ Returns (name, calls, seconds, allocated bytes) for every recorded span, in the order they
+    were first entered. Allocated bytes are 0 unless enabled with allocations.
+    :complexity: O(S) where S is the number of span names
+    """
+    return [(name, calls, seconds, allocated) for name, (calls, seconds, allocated) in _totals.items()]
+
+
+def print_breakdown(file: TextIO = None) -> None:
+    """ Prints breakdown() as a table
+    :complexity: O(S) where S is the number of span names
+    """
+    file = sys.stdout if file is None else file
+    print(f"{'stage':<28}{'calls':>9}{'total (s)':>12}{'mean (us)':>12}{'allocated (KB)':>16}", file=file)
+    for name, calls, seconds, allocated in breakdown():
+        print(f"{name:<28}{calls:>9}{seconds:>12.4f}{1e6 * seconds / calls:>12.2f}{allocated / 1024:>16.0f}",
+              file=file)
+
+
+def profile_stats(name: str) -> 'pstats.Stats':
+    """ Returns the cProfile statistics gathered in the named span
+    :raises KeyError: if the span was not profiled
+    :complexity: O(F) where F is the number of functions profiled
+    """
+    import pstats
+    return pstats.Stats(_profilers[name])
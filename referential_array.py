@@ -1,23 +1,18 @@
 """ Basic class implementation of an array of references for FIT units
 
-The code for the init function is a bit cryptic, so I explain it here in
-detail. The instance variables holding the physical array is constructed
-using the ctypes library to create a py_object (an object that can hold
-a reference to any python object). Note that for each value of length we
-have that (length * ctypes.py_object) is a type (e.g., if length=5, it
-would be a type called py_object_Array_5). Then (length *
-ctypes.py_object)() is equivalent to the initialisation in MIPS of the
-space to hold the references.
+The references are held in a Python list created with [None] * length, so
+the array is allocated and initialised to None in one step. The length is
+set on creation and never changes; the bulk operations (fill, slices,
+copy_from and iter_nonempty) never grow or shrink it.
 
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
 """
-__author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
+__author__ = "Maria Garcia de la Banda"
 __docformat__ = 'reStructuredText'
 
-from ctypes import py_object
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator, List, Tuple, Union
 
 T = TypeVar('T')
 
@@ -30,8 +25,7 @@ class ArrayR(Generic[T]):
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array = [None] * length  # initialises the space
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -39,16 +33,57 @@ class ArrayR(Generic[T]):
         """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index.
-        :complexity: O(1)
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        """ Returns the object in position index, or a list with the objects
+        in the positions selected by a slice.
+        :complexity: O(1) for an index, O(M) for a slice of M positions
         :pre: index in between 0 and length - self.array[] checks it
         """
         return self.array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
-        :complexity: O(1)
+    def __setitem__(self, index: Union[int, slice], value: T) -> None:
+        """ Sets the object in position index to value. If index is a slice,
+        value must be a sequence with exactly one item per selected position.
+        :complexity: O(1) for an index, O(M) for a slice of M positions
         :pre: index in between 0 and length - self.array[] checks it
+        :raises ValueError: if a slice and value differ in length
+        """
+        if isinstance(index, slice):
+            if len(range(*index.indices(len(self.array)))) != len(value):
+                raise ValueError("Can only assign sequence of same size.")
+        self.array[index] = value
+
+    def __iter__(self) -> Iterator[T]:
+        """ Returns an iterator over every position, empty ones included
+        :complexity: O(1)
+        """
+        return iter(self.array)
+
+    def fill(self, value: T, start: int = 0, stop: int = None) -> None:
+        """ Sets every position in [start, stop) to value
+        :complexity: O(stop - start)
+        :pre: 0 <= start <= stop <= length
+        """
+        if stop is None:
+            stop = len(self.array)
+        if not 0 <= start <= stop <= len(self.array):
+            raise IndexError("Fill range out of bounds")
+        self.array[start:stop] = [value] * (stop - start)
+
+    def copy_from(self, source: 'ArrayR[T]', src_start: int, dst_start: int, length: int) -> None:
+        """ Copies length references from source[src_start:] into
+        self[dst_start:] as a single block move. source may be self, and the
+        two ranges may overlap, as the block is read before it is written.
+        :complexity: O(length)
+        :pre: both ranges lie within their arrays
+        """
+        if length < 0 or src_start < 0 or dst_start < 0 \
+                or src_start + length > len(source.array) or dst_start + length > len(self.array):
+            raise IndexError("Copy range out of bounds")
+        self.array[dst_start:dst_start + length] = source.array[src_start:src_start + length]
+
+    def iter_nonempty(self) -> Iterator[Tuple[int, T]]:
+        """ Yields (index, item) for every position not holding None
+        :complexity: O(length) to exhaust the iterator
         """
-        self.array[index] = value
\ No newline at end of file
+        return ((i, item) for i, item in enumerate(self.array) if item is not None)
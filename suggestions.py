@@ -0,0 +1,191 @@
+""" Spelling Suggestions
+
+Suggests dictionary words for a misspelt word using a symmetric delete
+index. Every dictionary word is indexed under each string obtained by
+deleting up to max_distance characters from its first prefix_length
+characters. A misspelt word only needs the same deletes of its own prefix
+looked up, and the few words found that way are the only ones whose edit
+distance is computed. Results are kept in a bounded least recently used
+cache, as the same misspellings tend to come up again.
+"""
+__author__ = 'Daiki Kubo'
+
+from collections import OrderedDict
+from referential_array import ArrayR
+from typing import Iterable, List, Tuple
+
+
+def edit_distance(first: str, second: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions and swaps of adjacent characters)
+    between first and second, giving up as soon as it must be over max_distance.
+    :return: the distance, or max_distance + 1 if it is larger than max_distance
+    :complexity: O(N * M) where N and M are the sizes of the two strings
+    """
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+    # the common prefix and suffix don't change the distance
+    start = 0
+    while start < len(first) and start < len(second) and first[start] == second[start]:
+        start += 1
+    end_first, end_second = len(first), len(second)
+    while end_first > start and end_second > start and first[end_first - 1] == second[end_second - 1]:
+        end_first -= 1
+        end_second -= 1
+    first, second = first[start:end_first], second[start:end_second]
+    if not first or not second:
+        distance = max(len(first), len(second))
+        return distance if distance <= max_distance else max_distance + 1
+
+    # only cells within max_distance of the diagonal can stay within max_distance, the rest are left at limit
+    limit = max_distance + 1
+    columns = len(second)
+    previous_previous = None
+    previous = [j if j < limit else limit for j in range(columns + 1)]
+    for i in range(1, len(first) + 1):
+        current = [limit] * (columns + 1)
+        if i < limit:
+            current[0] = i
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(columns, i + max_distance) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value if value < limit else limit
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return limit
+        previous_previous, previous = previous, current
+    return previous[columns]
+
+
+def deletes_by_level(word: str, max_distance: int) -> List[List[str]]:
+    """
+    Returns the distinct strings obtained by deleting characters from word, grouped by how many were deleted:
+    level 0 holds word itself and level k the strings with k characters deleted, for k up to max_distance
+    :complexity: O(K^max_distance) strings where K is the size of word
+    """
+    seen = {word}
+    levels = [[word]]
+    for _ in range(max_distance):
+        level = []
+        for current in levels[-1]:
+            for i in range(len(current)):
+                deleted = current[:i] + current[i + 1:]
+                if deleted not in seen:
+                    seen.add(deleted)
+                    level.append(deleted)
+        levels.append(level)
+    return levels
+
+
+def deletes(word: str, max_distance: int) -> List[str]:
+    """
+    Returns word together with every distinct string obtained by deleting up to max_distance of its characters
+    :see: #deletes_by_level(word: str, max_distance: int)
+    """
+    return [deleted for level in deletes_by_level(word, max_distance) for deleted in level]
+
+
+class SpellingSuggester:
+    """
+    Symmetric delete index answering suggest queries
+
+    constants:
+        DEFAULT_MAX_DISTANCE: largest edit distance suggested
+        DEFAULT_PREFIX_LENGTH: number of leading characters of each word that the deletes are taken from
+        DEFAULT_CACHE_SIZE: number of misspelt words whose suggestions are cached
+
+    attributes:
+        words: an ArrayR of the indexed words; the index refers to them by position
+        index: maps each delete to the position of the single word it came from, or a list of positions
+        cache: the most recently requested suggestions (as tuples), least recently used first
+        cache_hits: number of suggest calls answered from the cache
+        cache_misses: number of suggest calls that had to search the index
+    """
+    DEFAULT_MAX_DISTANCE = 2
+    DEFAULT_PREFIX_LENGTH = 7
+    DEFAULT_CACHE_SIZE = 1024
+
+    def __init__(self, words: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE,
+                 prefix_length: int = DEFAULT_PREFIX_LENGTH, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Builds the delete index over the given words
+        :complexity: O(N * P^max_distance) where N is the number of words and P is prefix_length
+        """
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be larger than max_distance")
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        words = list(words)
+        self.words = ArrayR(max(1, len(words)))
+        self.index = {}
+        index = self.index
+        for position, word in enumerate(words):
+            self.words[position] = word
+            for deleted in deletes(word[:prefix_length], max_distance):
+                positions = index.get(deleted)
+                if positions is None:
+                    index[deleted] = position
+                elif type(positions) is int:
+                    index[deleted] = [positions, position]
+                else:
+                    positions.append(position)
+
+    def suggest(self, word: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Returns up to limit (word, distance) pairs for the dictionary words within max_distance of word,
+        closest first and in alphabetical order among equally close words.
+        Candidates are looked up one delete level at a time, and once limit suggestions at distance d or closer
+        are known, candidates further than d away are rejected without computing their full distance.
+        :complexity: O(1) if cached, otherwise O(P^max_distance + C * K^2) where P is prefix_length,
+                     C is the number of candidates and K the size of the word
+        """
+        key = (word, limit)
+        suggestions = self.cache.get(key)
+        if suggestions is not None:
+            self.cache_hits += 1
+            self.cache.move_to_end(key)
+            return list(suggestions)
+
+        self.cache_misses += 1
+        bound = self.max_distance
+        index = self.index
+        words = self.words
+        seen = set()
+        found = []
+        for level in deletes_by_level(word[:self.prefix_length], self.max_distance):
+            for deleted in level:
+                positions = index.get(deleted)
+                if positions is None:
+                    continue
+                for position in ((positions,) if type(positions) is int else positions):
+                    if position in seen:
+                        continue
+                    seen.add(position)
+                    candidate = words[position]
+                    if abs(len(candidate) - len(word)) > bound:
+                        continue
+                    distance = edit_distance(word, candidate, bound)
+                    if distance <= bound:
+                        found.append((distance, candidate))
+                        if len(found) >= limit:
+                            found.sort()
+                            bound = found[limit - 1][0]
+                            del found[limit:]
+        found.sort()
+        suggestions = [(candidate, distance) for distance, candidate in found[:limit]]
+
+        if self.cache_size > 0:
+            # kept as a tuple, so that callers changing the list they get back don't change later answers
+            self.cache[key] = tuple(suggestions)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return suggestions
@@ -4,9 +4,15 @@ __docformat__ = 'reStructuredText'
 __modified__ = '20/05/2020'
 __since__ = '22/05/2020'
 
+import csv
+import json
+import os
+import tempfile
 import unittest
-from hash_table import LinearProbeHashTable
-from dictionary import Statistics, Dictionary
+from hash_table import LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable, \
+    SeparateChainingHashTable, SwissHashTable, PackedKeyHashTable
+from dictionary import Statistics, Dictionary, MultiDictionary
+from tokenizer import read_lines, tokenize
 
 
 def file_len(filename: str) -> int:
@@ -26,7 +32,7 @@ class TestDictionary(unittest.TestCase):
 
     def setUp(self) -> None:
         """ Used by our test cases """
-        self.dictionary = Dictionary(TestDictionary.DE  FAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE)
+        self.dictionary = Dictionary(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE)
 
     def test_init(self) -> None:
         """ Testing type of our table and the length is 0 """
@@ -37,11 +43,66 @@ class TestDictionary(unittest.TestCase):
         """ For each file, doing some basic testing on the statistics generated """
         statistics = Statistics()
         for filename in TestDictionary.FILENAMES:
-            words, time, collision_count, probe_total, probe_max, rehash_count = statistics.load_statistics(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE * 2, filename, TestDictionary.DEFAULT_TIMEOUT)
+            words, time, collision_count, probe_total, probe_max, rehash_count, reseed_count = statistics.load_statistics(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE * 2, filename, TestDictionary.DEFAULT_TIMEOUT)
             self.assertGreater(words, 0)
             self.assertLess(time, TestDictionary.DEFAULT_TIMEOUT)
             # TODO: Add your own test cases here
 
+    def test_table_type(self) -> None:
+        """ The dictionary and the statistics work with every hash table """
+        statistics = Statistics()
+        for table_type in [QuadraticProbeHashTable, DoubleHashingHashTable, SeparateChainingHashTable,
+                           SwissHashTable, PackedKeyHashTable]:
+            self.dictionary = Dictionary(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE,
+                                         table_type)
+            self.assertEqual(type(self.dictionary.hash_table), table_type)
+            self.assertEqual(self.dictionary.load_dictionary('english_small.txt'), file_len('english_small.txt'))
+            self.assertTrue(self.dictionary.find_word('aardvark'))
+            self.dictionary.delete_word('aardvark')
+            self.assertFalse(self.dictionary.find_word('aardvark'))
+
+            words, time, collision_count, probe_total, probe_max, rehash_count, reseed_count = statistics.load_statistics(
+                TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE, 'english_small.txt',
+                TestDictionary.DEFAULT_TIMEOUT, table_type)
+            self.assertEqual(words, file_len('english_small.txt'))
+
+    def test_table_load_statistics(self) -> None:
+        """ The sweep writes a csv row and a histogram line per combination, and resuming skips those written """
+        statistics = Statistics()
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "statistics.csv")
+            histogram_output = os.path.join(directory, "statistics.jsonl")
+            sweep = {"output": output, "histogram_output": histogram_output,
+                     "table_sizes": [TestDictionary.DEFAULT_TABLE_SIZE], "filenames": ["english_small.txt"]}
+            statistics.table_load_statistics(TestDictionary.DEFAULT_TIMEOUT, hash_bases=[31], **sweep)
+            statistics.table_load_statistics(TestDictionary.DEFAULT_TIMEOUT, [LinearProbeHashTable, SwissHashTable],
+                                             hash_bases=[31, 27183], **sweep)
+
+            with open(output, newline='') as file:
+                rows = list(csv.reader(file))
+            self.assertEqual(rows[0], Statistics.CSV_HEADER)
+            self.assertEqual([(row[2], row[-1]) for row in rows[1:]],
+                             [("31", "LinearProbeHashTable"), ("27183", "LinearProbeHashTable"),
+                              ("31", "SwissHashTable"), ("27183", "SwissHashTable")])
+            with open(histogram_output) as file:
+                lines = [json.loads(line) for line in file]
+            self.assertEqual(len(lines), 4)
+            for row, line in zip(rows[1:], lines):
+                self.assertEqual(int(row[3]), file_len("english_small.txt"))
+                self.assertEqual(sum(line["probe_histogram"]), line["words"])
+                self.assertEqual(len(line["probe_histogram"]) - 1, int(row[6]))
+                self.assertEqual(int(row[9]), line["final_hash_base"])
+                self.assertEqual(row[9] == row[2], row[8] == "0")
+
+            # a base of 1 clusters, so the table re-seeds and is measured with another base
+            statistics.table_load_statistics(TestDictionary.DEFAULT_TIMEOUT, hash_bases=[1], resume=False, **sweep)
+            with open(output, newline='') as file:
+                rows = list(csv.reader(file))
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[1][2], "1")
+            self.assertNotEqual(rows[1][8], "0")
+            self.assertNotEqual(rows[1][9], "1")
+
     def test_load_dictionary(self) -> None:
         """ Reading a dictionary and ensuring the number of lines matches the number of words
             Also testing the various exceptions are raised correctly """
@@ -61,6 +122,65 @@ class TestDictionary(unittest.TestCase):
         """ Ensuring both valid and invalid words """
         # TODO: Add your own test cases
 
+    def test_find_words(self) -> None:
+        """ Batch lookups agree with find_word, keep order and handle duplicates """
+        self.dictionary.load_dictionary('english_small.txt')
+        words = ['test', TestDictionary.RANDOM_STR, 'aardvark', 'test', 'zzzzqx', '']
+        self.assertEqual(self.dictionary.find_words(words), [self.dictionary.find_word(word) for word in words])
+        self.assertEqual(self.dictionary.find_words(iter(words)), [True, False, True, True, False, False])
+        self.assertEqual(self.dictionary.filter_known(words), ['test', 'aardvark', 'test'])
+        self.assertEqual(self.dictionary.find_words([]), [])
+        pooled = self.dictionary.pooled_words(["".join(["te", "st"]), TestDictionary.RANDOM_STR])
+        self.assertEqual(pooled, ['test'])
+        self.assertIs(pooled[0], self.dictionary.hash_table.lookup_keys(['test'])[0])
+
+    def test_check_file(self) -> None:
+        """ Checking a whole file reports every word and the distinct unknown ones """
+        self.dictionary.load_dictionary('english_large.txt')
+        total, unknown = self.dictionary.check_file('215-0.txt')
+        self.assertGreater(total, 0)
+        self.assertEqual(len(unknown), len(set(unknown)))
+        self.assertNotIn('the', unknown)
+        self.assertFalse(any(self.dictionary.find_words(unknown)))
+        with self.assertRaises(FileNotFoundError):
+            self.dictionary.check_file('no_such_file.txt')
+
+    def test_words_with_prefix(self) -> None:
+        """ Prefix queries match a scan of the table, respect the limit and see added/deleted words """
+        self.dictionary.load_dictionary('english_small.txt')
+        for prefix in ['aard', 'test', 'zzzzqx', '']:
+            expected = sorted(word for word in self.dictionary.hash_table.keys() if word.startswith(prefix))
+            self.assertEqual(self.dictionary.words_with_prefix(prefix), expected)
+        self.assertEqual(self.dictionary.words_with_prefix('aa', 2), ['aa', 'aaa'])
+        self.assertEqual(self.dictionary.words_with_prefix('aa', 0), [])
+
+        self.dictionary.add_word('Aardvarkian')
+        self.assertIn('aardvarkian', self.dictionary.words_with_prefix('aardvark'))
+        self.dictionary.delete_word('aardvark')
+        self.assertNotIn('aardvark', self.dictionary.words_with_prefix('aardvark'))
+
+        words, index_bytes, word_bytes = self.dictionary.get_prefix_index().memory_report()
+        self.assertEqual(words, len(self.dictionary.hash_table))
+        self.assertGreater(index_bytes, 0)
+        self.assertGreater(word_bytes, 0)
+
+    def test_suggest(self) -> None:
+        """ Suggestions are within two edits, closest first, cached and rebuilt after the words change """
+        for word in ['spelling', 'spewing', 'selling', 'receive', 'relieve', 'test']:
+            self.dictionary.add_word(word)
+        self.assertEqual(self.dictionary.suggest('speling'), [('spelling', 1), ('spewing', 1), ('selling', 2)])
+        self.assertEqual(self.dictionary.suggest('Recieve', 1), [('receive', 1)])
+        self.assertEqual(self.dictionary.suggest('tset'), [('test', 1)])
+        self.assertEqual(self.dictionary.suggest('xyzzy'), [])
+
+        suggester = self.dictionary.get_suggester()
+        self.dictionary.suggest('speling').clear()
+        self.assertEqual(suggester.cache_hits, 1)
+        self.assertEqual(self.dictionary.suggest('speling'), [('spelling', 1), ('spewing', 1), ('selling', 2)])
+
+        self.dictionary.delete_word('spelling')
+        self.assertEqual(self.dictionary.suggest('speling'), [('spewing', 1), ('selling', 2)])
+
     def test_delete_word(self) -> None:
         """ Deleting valid words and ensuring we can't delete invalid words """
         self.dictionary.load_dictionary('english_small.txt')
@@ -73,5 +193,64 @@ class TestDictionary(unittest.TestCase):
         self.assertEqual(len(self.dictionary.hash_table), table_size - 1)
 
 
+class TestMultiDictionary(unittest.TestCase):
+    """ Tests for loading several languages into one table and looking them up together """
+    LANGUAGES = {'english': 'english_small.txt', 'french': 'french.txt'}
+
+    def setUp(self) -> None:
+        """ Used by our test cases """
+        self.dictionary = MultiDictionary(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE)
+
+    def test_load_dictionaries(self) -> None:
+        """ Every word of every list is loaded once, with the languages of the lists it appears in """
+        count = self.dictionary.load_dictionaries(TestMultiDictionary.LANGUAGES)
+        words = {}
+        for bit, filename in enumerate(TestMultiDictionary.LANGUAGES.values()):
+            with open(filename, encoding='UTF-8') as file:
+                for word in read_lines(file):
+                    words[word] = words.get(word, 0) | 1 << bit
+        self.assertEqual(count, len(words))
+        self.assertEqual(self.dictionary.languages, ['english', 'french'])
+        self.assertEqual(dict(self.dictionary.hash_table.items()), words)
+
+        self.assertEqual(self.dictionary.find_languages('aardvark'), ['english'])
+        self.assertEqual(self.dictionary.find_languages('abandon'), ['english', 'french'])
+        self.assertEqual(self.dictionary.find_languages(TestDictionary.RANDOM_STR), [])
+        self.assertEqual(self.dictionary.language_masks(['aardvark', 'abandon', 'aardvark', 'zzzz']), [1, 3, 1, 0])
+
+    def test_load_more(self) -> None:
+        """ Loading another list adds a language, or adds words to a language already loaded """
+        self.dictionary.load_dictionaries({'english': 'english_small.txt'})
+        self.dictionary.load_dictionaries({'french': 'french.txt', 'english': 'english_large.txt'})
+        self.assertEqual(self.dictionary.languages, ['english', 'french'])
+        self.assertEqual(self.dictionary.find_languages('aardvark'), ['english'])
+        self.assertEqual(self.dictionary.find_languages('abandon'), ['english', 'french'])
+
+        with self.assertRaises(FileNotFoundError):
+            self.dictionary.load_dictionaries({'german': 'german.txt'})
+        self.assertEqual(self.dictionary.languages, ['english', 'french'])
+        with self.assertRaises(ValueError):
+            self.dictionary.load_dictionaries({str(i): 'french.txt' for i in range(MultiDictionary.MAX_LANGUAGES)})
+
+    def test_coverage(self) -> None:
+        """ The coverage of each language agrees with a Dictionary of that language """
+        self.dictionary.load_dictionaries(TestMultiDictionary.LANGUAGES)
+        total, known, unknown = self.dictionary.coverage('215-0.txt')
+        with open('215-0.txt', encoding='UTF-8') as file:
+            words = tokenize(file.read())
+        self.assertEqual(total, len(words))
+        for count, filename in zip(known, TestMultiDictionary.LANGUAGES.values()):
+            dictionary = Dictionary(TestDictionary.DEFAULT_HASH_BASE, TestDictionary.DEFAULT_TABLE_SIZE)
+            dictionary.load_dictionary(filename)
+            self.assertEqual(count, sum(dictionary.find_words(words)))
+        self.assertGreater(known[0], known[1])
+        self.assertEqual(unknown, self.dictionary.language_masks(words).count(0))
+
+        report = self.dictionary.coverage_report('215-0.txt').splitlines()
+        self.assertEqual(report[0], f'215-0.txt: {total} words')
+        self.assertEqual(len(report), 5)
+        self.assertTrue(report[2].startswith('english') and report[4].startswith('(none)'))
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
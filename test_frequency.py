@@ -0,0 +1,111 @@
+"""Unit Testing for Task 3 and 4"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from frequency import Frequency, Rarity
+
+
+class TestFrequency(unittest.TestCase):
+    FILENAME = '215-0.txt'
+
+    def setUp(self) -> None:
+        """ Used by our test cases """
+        self.frequency = Frequency()
+        self.frequency.add_file(TestFrequency.FILENAME)
+
+    def test_rarity(self) -> None:
+        """ Rarity follows the 1% and 0.1% thresholds of the most frequent word """
+        most = self.frequency.max_word[1]
+        for word, count in self.frequency.hash_table.items():
+            if count >= most / 100:
+                expected = Rarity.COMMON
+            elif count < most / 1000:
+                expected = Rarity.RARE
+            else:
+                expected = Rarity.UNCOMMON
+            self.assertEqual(self.frequency.rarity(word), expected)
+        self.assertEqual(self.frequency.rarity('The'), Rarity.COMMON)
+        self.assertEqual(self.frequency.rarity('qwertyuiop'), Rarity.MISSPELT)
+
+    def test_classify_all(self) -> None:
+        """ Every counted word lands in the bucket rarity gives it """
+        buckets = self.frequency.classify_all()
+        counts = self.frequency.rarity_counts()
+        self.assertEqual(sum(counts.values()), len(self.frequency.hash_table))
+        self.assertEqual(counts[Rarity.MISSPELT], 0)
+        for rarity, words in buckets.items():
+            self.assertEqual(len(words), counts[rarity])
+            for word in words:
+                self.assertEqual(self.frequency.rarity(word), rarity)
+
+    def test_shared_keys(self) -> None:
+        """ Counted words are the dictionary's own strings """
+        pool = self.frequency.dictionary.hash_table
+        for word, _ in self.frequency.hash_table.items():
+            self.assertIs(pool.lookup_keys([word])[0], word)
+
+    def test_max_word(self) -> None:
+        """ The highest occurrence matches a scan of the table after every file is added """
+        most = max(count for _, count in self.frequency.hash_table.items())
+        self.assertEqual(self.frequency.max_word[1], most)
+        self.assertEqual(self.frequency.hash_table[self.frequency.max_word[0]], most)
+        self.frequency.add_file(TestFrequency.FILENAME)
+        self.assertEqual(self.frequency.max_word[1], 2 * most)
+        self.assertEqual(self.frequency.common_threshold, 2 * most / 100)
+
+    def test_remove_file(self) -> None:
+        """ Removing an added file restores the counts, the maximum and the thresholds """
+        counts = sorted(self.frequency.hash_table.items())
+        max_word = self.frequency.max_word
+        self.frequency.add_file(TestFrequency.FILENAME)
+        self.frequency.remove_file(TestFrequency.FILENAME)
+        self.assertEqual(sorted(self.frequency.hash_table.items()), counts)
+        self.assertEqual(self.frequency.max_word, max_word)
+        self.assertEqual(self.frequency.common_threshold, max_word[1] / 100)
+
+        self.frequency.remove_file(TestFrequency.FILENAME)
+        self.assertEqual(len(self.frequency.hash_table), 0)
+        self.assertEqual(self.frequency.max_word, tuple())
+        self.assertEqual(self.frequency.rarity('the'), Rarity.MISSPELT)
+        with self.assertRaises(ValueError):
+            self.frequency.remove_file(TestFrequency.FILENAME)
+
+    def test_word_ids(self) -> None:
+        """ Counting by word ID gives the same counts, maximum, rarity and ranking as the hash table """
+        by_id = Frequency(word_ids=True)
+        by_id.add_file(TestFrequency.FILENAME)
+        self.assertIsNone(by_id.hash_table)
+        self.assertEqual(sorted(by_id.items()), sorted(self.frequency.items()))
+        self.assertEqual(by_id.max_word, self.frequency.max_word)
+        self.assertEqual(by_id.rarity_counts(), self.frequency.rarity_counts())
+        for word in ['the', 'The', 'buck', 'qwertyuiop']:
+            self.assertEqual(by_id.rarity(word), self.frequency.rarity(word))
+
+        ranking = by_id.ranking()
+        self.assertEqual(len(ranking), len(self.frequency.hash_table))
+        self.assertEqual([count for _, count in ranking], [count for _, count in self.frequency.ranking()])
+        self.assertEqual([count for _, count in by_id.top(10)], [count for _, count in ranking[0:10]])
+        self.assertEqual([count for _, count in self.frequency.top(3)], [count for _, count in ranking[0:3]])
+
+        by_id.remove_file(TestFrequency.FILENAME)
+        self.assertEqual(by_id.max_word, tuple())
+        self.assertEqual(by_id.rarity('the'), Rarity.MISSPELT)
+
+    def test_lazy_loading(self) -> None:
+        """ The dictionary is only loaded on first use, on the caller's thread or a preloading one """
+        class Missing(Frequency):
+            DICTIONARY_FILE = 'no_such_dictionary.txt'
+
+        for preload in [False, True]:
+            frequency = Missing(preload=preload)
+            with self.assertRaises(FileNotFoundError):
+                frequency.add_file(TestFrequency.FILENAME)
+
+        frequency = Frequency(preload=True)
+        self.assertEqual(frequency.rarity('the'), Rarity.MISSPELT)
+        frequency.add_file(TestFrequency.FILENAME)
+        self.assertEqual(frequency.max_word, self.frequency.max_word)
+
+
+if __name__ == '__main__':
+    unittest.main()
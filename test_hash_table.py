@@ -0,0 +1,552 @@
+"""Unit Testing for the hash tables"""
+__docformat__ = 'reStructuredText'
+
+import itertools
+import unittest
+from hash_table import LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable, \
+    SeparateChainingHashTable, SwissHashTable, PackedKeyHashTable
+
+
+class TestLinearProbeHashTable(unittest.TestCase):
+    def test_init(self):
+        """ Basic test to ensure the table is initialised """
+        dictionary = LinearProbeHashTable()
+        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+
+    def test_is_empty(self):
+        """ Testing when the table is empty and non-empty """
+        dictionary = LinearProbeHashTable()
+        self.assertTrue(dictionary.is_empty())
+
+        dictionary["test"] = "test"
+        self.assertFalse(dictionary.is_empty())
+
+    def test_is_full(self):
+        """ Testing when the hash table is full and empty """
+        dictionary = LinearProbeHashTable(31, 10)
+        self.assertFalse(dictionary.is_full())
+
+        for i in range(10):
+            dictionary[str(i)] = i
+        self.assertTrue(len(dictionary) == 10)
+
+    def test_hash(self):
+        """ Testing the get item and contains """
+        dictionary = LinearProbeHashTable(31, 5)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(10):
+            self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+            self.assertTrue(str(i) in dictionary, "Could not find item: " + str(i))
+
+    def test_get(self):
+        """ Testing get returns the data or the default """
+        dictionary = LinearProbeHashTable(31, 5)
+        dictionary["a"] = 1
+        self.assertEqual(dictionary.get("a"), 1)
+        self.assertIsNone(dictionary.get("b"))
+        self.assertEqual(dictionary.get("b", 0), 0)
+
+    def test_setdefault(self):
+        """ Testing setdefault only inserts missing keys """
+        dictionary = LinearProbeHashTable(31, 5)
+        for i in range(10):
+            self.assertEqual(dictionary.setdefault(str(i), i), i)
+        for i in range(10):
+            self.assertEqual(dictionary.setdefault(str(i), -1), i)
+        self.assertEqual(len(dictionary), 10)
+        self.assertEqual(dictionary.lookup_items(["3", "x"]), [("3", 3), None])
+
+    def test_increment(self):
+        """ Testing increment inserts missing keys and adds to existing ones """
+        dictionary = LinearProbeHashTable(31, 5)
+        for i in range(20):
+            self.assertEqual(dictionary.increment(str(i % 10)), i // 10 + 1)
+        self.assertEqual(dictionary.increment("0", 5), 7)
+        self.assertEqual(len(dictionary), 10)
+        self.assertEqual(dictionary["9"], 2)
+
+    def test_len(self):
+        """ Testing an empty Hash Table and non-empty Hash Table """
+        dictionary = LinearProbeHashTable(5)
+        self.assertEqual(len(dictionary), 0, "Dictionary should be empty")
+
+        for i in range(3):
+            dictionary[str(i)] = i
+
+        self.assertEqual(len(dictionary), 3, "Dictionary should contain 3 items")
+
+    def test_del(self):
+        """ Adding 10 items, removing the first 5 and ensuring the state of the Hash Table is correct afterwards """
+        dictionary = LinearProbeHashTable(5)
+        for i in range(10):
+            dictionary[str(i)] = i
+
+        for i in range(5):
+            del dictionary[str(i)]
+
+        for i in range(10):
+            if i < 5:
+                with self.assertRaises(KeyError):
+                    _ = dictionary[str(i)]
+            else:
+                self.assertEqual(dictionary[str(i)], i, "Could not find item: " + str(i))
+
+    def test_statistics(self):
+        # TODO create more complicated test cases!!!
+
+        # TEST CASE 1
+        dictionary = LinearProbeHashTable(31, 5)
+        tuple_test = (0, 0, 0, 0, 0)
+        self.assertTrue(dictionary.statistics(), tuple_test)
+
+        # TEST CASE 2
+        dictionary = LinearProbeHashTable(0, 0)
+        tuple_test = (0, 0, 0, 0, 0)
+        self.assertTrue(dictionary.statistics(), tuple_test)
+
+    def test_str(self):
+        """ Testing an empty table and one with 5 elements """
+        dictionary = LinearProbeHashTable(31, 5)
+        self.assertEqual(str(dictionary), "", "Dictionary should be empty")
+
+        for i in range(5):
+            dictionary[str(i)] = i
+        for i in range(5):
+            self.assertIn("(" + str(i) + "," + str(i) + ")", str(dictionary))
+
+    def test_iter(self):
+        """ Testing keys, values and items across a rehash and after deletion """
+        dictionary = LinearProbeHashTable(31, 5)
+        self.assertEqual(list(dictionary), [])
+
+        for i in range(10):
+            dictionary[str(i)] = i
+        del dictionary["3"]
+
+        expected = [(str(i), i) for i in range(10) if i != 3]
+        self.assertEqual(sorted(dictionary.items()), expected)
+        self.assertEqual(sorted(dictionary.keys()), [key for key, _ in expected])
+        self.assertEqual(sorted(dictionary.values()), [value for _, value in expected])
+        self.assertEqual(sorted(dictionary), [key for key, _ in expected])
+
+    def test_contains_many(self):
+        """ Testing batch membership matches __contains__ and leaves the statistics alone """
+        dictionary = LinearProbeHashTable(1, 17)
+        for i in range(0, 20, 2):
+            dictionary[str(i)] = i
+        statistics = dictionary.statistics()
+
+        keys = [str(i) for i in range(20)] + ["", "0"]
+        found = dictionary.contains_many(keys)
+        self.assertEqual(dictionary.statistics(), statistics)
+        self.assertEqual(found, [key in dictionary for key in keys])
+        self.assertEqual(dictionary.hash_many(keys), [dictionary.hash(key) for key in keys])
+
+    def test_lookup_keys(self):
+        """ Testing the stored key objects are returned, not the ones looked up """
+        dictionary = LinearProbeHashTable(31, 5)
+        stored = "".join(["wo", "rd"])
+        dictionary[stored] = 1
+        lookup = "".join(["w", "ord"])
+        self.assertIsNot(lookup, stored)
+        keys = dictionary.lookup_keys([lookup, "other"])
+        self.assertIs(keys[0], stored)
+        self.assertIsNone(keys[1])
+
+    def test_update(self):
+        """ Testing update into an empty table (block copy) and a non-empty one (presized) """
+        first = LinearProbeHashTable(31, 5)
+        for i in range(10):
+            first[str(i)] = i
+
+        copy = LinearProbeHashTable(31, 5)
+        copy.update(first)
+        self.assertEqual(sorted(copy.items()), sorted(first.items()))
+        copy["extra"] = 100
+        self.assertNotIn("extra", first)
+
+        second = LinearProbeHashTable(27183, 5)
+        for i in range(5, 50):
+            second[str(i)] = -i
+        rehash_count = second.getRehashCounter()
+        second.update(first)
+        self.assertEqual(len(second), 50)
+        for i in range(50):
+            self.assertEqual(second[str(i)], i if i < 10 else -i)
+        self.assertLessEqual(second.getRehashCounter() - rehash_count, 1)
+
+    def test_merge_counts(self):
+        """ Testing counts are added for shared keys and copied for new ones """
+        first = LinearProbeHashTable(31, 5)
+        second = LinearProbeHashTable(31, 5)
+        for i in range(10):
+            first[str(i)] = i
+        for i in range(5, 15):
+            second[str(i)] = 10
+        first.merge_counts(second)
+        self.assertEqual(len(first), 15)
+        for i in range(15):
+            self.assertEqual(first[str(i)], i + 10 if 5 <= i < 10 else (i if i < 5 else 10))
+
+        first.merge_counts(second, max)
+        self.assertEqual(first["5"], 15)
+        self.assertEqual(first["14"], 10)
+
+    def test_union_intersection(self):
+        """ Testing the union and intersection leave both operands untouched """
+        first = LinearProbeHashTable(31, 5)
+        second = LinearProbeHashTable(31, 5)
+        for i in range(10):
+            first[str(i)] = "first"
+        for i in range(5, 15):
+            second[str(i)] = "second"
+
+        union = first.union(second)
+        self.assertEqual(len(union), 15)
+        self.assertEqual(union["0"], "first")
+        self.assertEqual(union["7"], "second")
+
+        intersection = first.intersection(second)
+        self.assertEqual(sorted(intersection.keys()), [str(i) for i in range(5, 10)])
+        self.assertEqual(set(intersection.values()), {"first"})
+        self.assertEqual((len(first), len(second)), (10, 10))
+
+    def test_iter_modified(self):
+        """ Testing that adding or removing keys while iterating fails fast, but updating values does not """
+        dictionary = LinearProbeHashTable(31, 17)
+        for i in range(5):
+            dictionary[str(i)] = i
+
+        for key in dictionary:
+            dictionary[key] = 0
+        self.assertEqual(list(dictionary.values()), [0] * 5)
+
+        with self.assertRaises(RuntimeError):
+            for key in dictionary:
+                dictionary[key + "x"] = 1
+
+        with self.assertRaises(RuntimeError):
+            for key in dictionary.keys():
+                del dictionary[key]
+
+
+class TestHashTables(unittest.TestCase):
+    TABLE_TYPES = [LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable, SeparateChainingHashTable,
+                   SwissHashTable, PackedKeyHashTable]
+
+    def test_operations(self):
+        """ Testing every table agrees on inserts, lookups and deletes, interleaved across rehashes """
+        for table_type in TestHashTables.TABLE_TYPES:
+            dictionary = table_type(1, 5)
+            for i in range(100):
+                dictionary[str(i)] = i
+            for i in range(0, 100, 3):
+                del dictionary[str(i)]
+            for i in range(0, 100, 6):
+                self.assertEqual(dictionary.setdefault(str(i), -i), -i)
+
+            expected = {str(i): (-i if i % 6 == 0 else i) for i in range(100) if i % 3 != 0 or i % 6 == 0}
+            self.assertEqual(dict(dictionary.items()), expected, table_type.__name__)
+            self.assertEqual(len(dictionary), len(expected))
+            self.assertEqual(dictionary.contains_many(["3", "6"]), [False, True])
+            with self.assertRaises(KeyError):
+                _ = dictionary["3"]
+
+    def test_reserve(self):
+        """ Testing reserve grows every table once, after which inserting that many keys doesn't rehash """
+        for table_type in TestHashTables.TABLE_TYPES:
+            dictionary = table_type(31, 5)
+            dictionary["kept"] = -1
+            dictionary.reserve(1000)
+            rehash_count = dictionary.getRehashCounter()
+            self.assertLessEqual(rehash_count, 1, table_type.__name__)
+            for i in range(999):
+                dictionary[str(i)] = i
+            self.assertEqual(dictionary.getRehashCounter(), rehash_count, table_type.__name__)
+            self.assertEqual(dictionary["kept"], -1)
+            dictionary.reserve(10)
+            self.assertEqual(dictionary.getRehashCounter(), rehash_count, table_type.__name__)
+
+    def test_set_operations(self):
+        """ Testing update, merge_counts, union and intersection agree on every table, across table types """
+        for table_type in TestHashTables.TABLE_TYPES:
+            first = table_type(31, 5)
+            second = LinearProbeHashTable(27183, 5)
+            for i in range(10):
+                first[str(i)] = i
+            for i in range(5, 15):
+                second[str(i)] = 10
+
+            union = first.union(second)
+            self.assertIs(type(union), table_type)
+            self.assertEqual(dict(union.items()), {str(i): i if i < 5 else 10 for i in range(15)})
+            intersection = first.intersection(second)
+            self.assertIs(type(intersection), table_type)
+            self.assertEqual(dict(intersection.items()), {str(i): i for i in range(5, 10)})
+
+            first.merge_counts(second)
+            self.assertEqual(dict(first.items()), {str(i): i + 10 if 5 <= i < 10 else (i if i < 5 else 10)
+                                                   for i in range(15)}, table_type.__name__)
+            copy = table_type(31, 5)
+            copy.update(first)
+            self.assertEqual(dict(copy.items()), dict(first.items()))
+
+    def test_grow_past_primes(self):
+        """ Testing tables keep growing to primes once PRIMES runs out """
+        dictionary = SeparateChainingHashTable(31, 17)
+        dictionary["kept"] = 1
+        dictionary.reserve(8 * 10 ** 6)
+        self.assertGreaterEqual(len(dictionary.table), 8 * 10 ** 6)
+        self.assertEqual(dictionary["kept"], 1)
+
+        dictionary = LinearProbeHashTable(31, LinearProbeHashTable.PRIMES[-1] + 1)
+        size = dictionary.next_table_size()
+        self.assertGreaterEqual(size, 2 * len(dictionary.table))
+        self.assertTrue(all(size % divisor for divisor in range(2, int(size ** 0.5) + 1)))
+
+    def test_tombstones(self):
+        """ Testing deleted slots are reused by inserts and dropped by rehashing """
+        dictionary = QuadraticProbeHashTable(31, 50)
+        self.assertEqual(len(dictionary.table), 53)
+        for i in range(20):
+            dictionary[str(i)] = i
+        for i in range(20):
+            del dictionary[str(i)]
+        self.assertEqual((len(dictionary), dictionary.deleted), (0, 20))
+
+        dictionary["5"] = 5
+        self.assertEqual((len(dictionary), dictionary.deleted), (1, 19))
+
+        for i in range(20, 30):
+            dictionary[str(i)] = i
+        self.assertEqual(dictionary.deleted, 0)
+        self.assertEqual(len(dictionary.table), 53)
+        self.assertEqual(sorted(dictionary.values()), [5] + list(range(20, 30)))
+
+    def test_statistics(self):
+        """ Testing quadratic probing and double hashing probe less than linear probing when keys cluster """
+        with open("english_small.txt", encoding="UTF-8") as file:
+            keys = [file.readline().rstrip() for _ in range(500)]
+        probe_totals = []
+        for table_type in TestHashTables.TABLE_TYPES:
+            dictionary = table_type(1, 17, adaptive=False)
+            for key in keys:
+                dictionary[key] = 1
+            collision_count, probe_total, probe_max, rehash_count, reseed_count = dictionary.statistics()
+            self.assertEqual(reseed_count, 0)
+            probe_totals.append(probe_total)
+        self.assertLess(probe_totals[1], probe_totals[0])
+        self.assertLess(probe_totals[2], probe_totals[0])
+        self.assertLess(probe_totals[3], probe_totals[0])
+        self.assertLess(probe_totals[4], probe_totals[0])
+
+    def test_reseed(self):
+        """ Testing anagrams, which all hash alike with a base of 1, re-seed the hash base of the linear and quadratic
+        probing tables without growing them. Double hashing already sends them along different sequences. """
+        keys = ["".join(letters) for letters in itertools.islice(itertools.permutations("abcdefg"), 2000)]
+        for table_type in [LinearProbeHashTable, QuadraticProbeHashTable]:
+            dictionary = table_type(1, 10007)
+            for i, key in enumerate(keys):
+                dictionary[key] = i
+            self.assertEqual(dictionary.getReseedCounter(), 1, table_type.__name__)
+            self.assertEqual(dictionary.statistics()[4], 1)
+            self.assertNotEqual(dictionary.hash_base, 1)
+            self.assertEqual(len(dictionary.table), 10007)
+            self.assertEqual(sorted(dictionary.values()), list(range(len(keys))))
+
+            fixed = table_type(1, 10007, adaptive=False)
+            for key in keys[:500]:
+                fixed[key] = 0
+            self.assertEqual((fixed.getReseedCounter(), fixed.hash_base), (0, 1))
+
+    def test_small_tables(self):
+        """ Testing tables starting tiny take every key while they grow, which the quadratic sequence can only do
+        while they stay within MAX_LOAD """
+        keys = ["c", "ca", ""] + ["".join(letters) for letters in itertools.product("abc", repeat=3)]
+        for table_type in [LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable]:
+            for hash_base in range(1, 40):
+                for table_size in range(1, 8):
+                    dictionary = table_type(hash_base, table_size)
+                    for i, key in enumerate(keys):
+                        dictionary[key] = i
+                    self.assertEqual(dict(dictionary.items()), {key: i for i, key in enumerate(keys)})
+                    self.assertLessEqual(len(dictionary), len(dictionary.table) * table_type.MAX_LOAD + 1)
+
+    def test_lookups_before_insert(self):
+        """ Testing the probes of lookups aren't counted in the next insert's chain, so they can't re-seed it """
+        for table_type in [LinearProbeHashTable, QuadraticProbeHashTable, DoubleHashingHashTable]:
+            dictionary = table_type(31, 20011)
+            for i in range(5000):
+                dictionary[str(i)] = i
+            dictionary["0"] = -1
+            for _ in range(20):
+                for i in range(-2000, 2000):
+                    _ = str(i) in dictionary
+            rehash_count, histogram = dictionary.getRehashCounter(), dictionary.probe_histogram()
+            dictionary["new"] = 1
+            self.assertEqual(dictionary.getReseedCounter(), 0, table_type.__name__)
+            self.assertEqual(dictionary.getRehashCounter(), rehash_count)
+            self.assertEqual(dictionary.hash_base, 31)
+            self.assertLessEqual(dictionary.getProbeMax(), max(len(histogram) - 1, 10))
+
+    def test_cache(self):
+        """ Testing a bounded table evicts items that weren't referenced since the clock hand last passed """
+        with self.assertRaises(ValueError):
+            LinearProbeHashTable(31, 17, max_entries=0)
+        for table_type in TestHashTables.TABLE_TYPES[:3]:
+            dictionary = table_type(31, 17, max_entries=100)
+            for i in range(101):
+                dictionary[str(i)] = i
+            self.assertEqual((len(dictionary), dictionary.getEvictionCounter()), (100, 1))
+
+            survivors = [str(i) for i in range(50) if str(i) in dictionary]
+            self.assertGreaterEqual(len(survivors), 49)
+            for i in range(101, 141):
+                dictionary[str(i)] = i
+            self.assertEqual(len(dictionary), 100)
+            self.assertEqual([key for key in survivors if key not in dictionary], [], table_type.__name__)
+            self.assertEqual(dictionary.cache_statistics(), (2 * len(survivors), 50 - len(survivors), 41))
+
+            for i in range(1000, 3000):
+                dictionary[str(i)] = i
+            self.assertEqual(len(dictionary), 100)
+            self.assertLessEqual(len(dictionary.table), 4 * 100 / dictionary.MAX_LOAD)
+            del dictionary["2999"]
+            self.assertEqual((len(dictionary), dictionary.get("2999")), (99, None))
+
+    def test_cache_merge_counts(self):
+        """ Testing merging into a cache rehashes away the tombstones its evictions leave, as inserting does """
+        other = LinearProbeHashTable(31, 17)
+        for i in range(200):
+            other[str(i)] = i
+        for table_type in TestHashTables.TABLE_TYPES[:3]:
+            dictionary = table_type(31, 17, max_entries=10)
+            dictionary.merge_counts(other)
+            self.assertEqual(len(dictionary), 10)
+            self.assertLessEqual((dictionary.count + dictionary.deleted) / len(dictionary.table),
+                                 dictionary.MAX_LOAD + 1 / len(dictionary.table), table_type.__name__)
+            self.assertIsNone(dictionary.get("-1"))
+
+    def test_swiss(self):
+        """ Testing groups of control bytes fill past the open addressing load limit, and deletion only leaves a
+        deleted byte in a full group """
+        dictionary = SwissHashTable(31, 100)
+        self.assertEqual((len(dictionary.table), dictionary.control.count(SwissHashTable.EMPTY_BYTE)), (128, 128))
+        for i in range(110):
+            dictionary[str(i)] = i
+        self.assertEqual((len(dictionary.table), dictionary.getRehashCounter()), (128, 0))
+        self.assertEqual(sum(byte < 0x80 for byte in dictionary.control), 110)
+
+        full = [start for start in range(0, 128, 16)
+                if SwissHashTable.EMPTY_BYTE not in dictionary.control[start:start + 16]]
+        self.assertGreater(len(full), 0)
+        for i in range(110):
+            del dictionary[str(i)]
+        self.assertEqual(len(dictionary), 0)
+        self.assertEqual(dictionary.deleted, 16 * len(full))
+        self.assertEqual(dictionary.control.count(SwissHashTable.DELETED_BYTE), dictionary.deleted)
+
+        for i in range(100, 150):
+            dictionary[str(i)] = i
+        self.assertEqual(sorted(dictionary.values()), list(range(100, 150)))
+        self.assertEqual(dictionary.lookup_keys(["120", "1"]), ["120", None])
+
+    def test_packed(self):
+        """ Testing keys, including ones outside ASCII, survive compacting with and without front coding """
+        with open("french.txt", encoding="UTF-8") as file:
+            keys = [file.readline().rstrip() for _ in range(300)] + ["élève", "éléphant", "ça"]
+        dictionary = PackedKeyHashTable(31, 17)
+        for i, key in enumerate(keys):
+            dictionary[key] = i
+        del dictionary[keys[0]]
+        expected = {key: i for i, key in enumerate(keys) if i > 0}
+        self.assertEqual(dictionary.hash("abc"), LinearProbeHashTable(31, len(dictionary.table)).hash("abc"))
+
+        buffer_sizes = []
+        for front_coding in [False, True]:
+            dictionary.compact(front_coding)
+            self.assertEqual(list(dictionary.items()), sorted(expected.items()))
+            self.assertEqual([dictionary[key] for key in expected], list(expected.values()))
+            self.assertFalse(keys[0] in dictionary or "élèves" in dictionary or "" in dictionary)
+            buffer_sizes.append(len(dictionary.buffer))
+        self.assertLess(buffer_sizes[1], buffer_sizes[0])
+
+        dictionary["ça va"] = -1
+        self.assertEqual(dictionary.increment("éléphant", 10), expected["éléphant"] + 10)
+        self.assertEqual(dictionary.lookup_items(["ça va", "ça", "zz"]), [("ça va", -1), ("ça", expected["ça"]), None])
+        self.assertEqual(dictionary.coded, len(expected))
+
+    def test_packed_compact_growth(self):
+        """ Testing a table shrunk by compact() grows through the primes after its new size, and that lookups
+        aren't counted in the probe chain of the next insert """
+        dictionary = PackedKeyHashTable(31, 1000)
+        for i in range(20):
+            dictionary[str(i)] = i
+        dictionary.compact()
+        size = len(dictionary.table)
+        self.assertLess(size, 1000)
+        for i in range(20, int(size * dictionary.MAX_LOAD) + 2):
+            dictionary[str(i)] = i
+        self.assertEqual(len(dictionary.table), PackedKeyHashTable.PRIMES[PackedKeyHashTable.PRIMES.index(size) + 1])
+
+        chains = len(dictionary.probe_max)
+        for _ in range(100):
+            _ = "missing" in dictionary
+        dictionary["new"] = 1
+        self.assertEqual(len(dictionary.probe_max), chains + 1)
+        self.assertLess(dictionary.probe_max[-1], len(dictionary.table))
+
+    def test_packed_bad_data(self):
+        """ Testing data that isn't an int64 is rejected with the table left as it was """
+        dictionary = PackedKeyHashTable(31, 17)
+        dictionary["a"] = 1
+        for data, error in [("x", TypeError), (2 ** 63, OverflowError)]:
+            with self.assertRaises(error):
+                dictionary["b"] = data
+            with self.assertRaises(error):
+                dictionary["a"] = data
+            with self.assertRaises(error):
+                dictionary.setdefault("b", data)
+        with self.assertRaises(OverflowError):
+            dictionary.increment("a", 2 ** 63 - 1)
+        dictionary["b"] = 2
+        self.assertEqual(dict(dictionary.items()), {"a": 1, "b": 2})
+        self.assertEqual((dictionary["a"], dictionary["b"], len(dictionary)), (1, 2, 2))
+
+    def test_packed_tombstone_insert(self):
+        """ Testing an insert into a tombstone found by scanning the whole table records its probe chain """
+        dictionary = PackedKeyHashTable(31, 17)
+        # tombstones the load check doesn't know about, so that the insert scans the table without an empty slot
+        for position in range(len(dictionary.table)):
+            dictionary.table[position] = dictionary.DELETED_SLOT
+        dictionary["a"] = 1
+        self.assertEqual(dictionary["a"], 1)
+        self.assertEqual(dictionary.probe_histogram()[-1], 1)
+        self.assertEqual(sum(dictionary.probe_histogram()), 1)
+        self.assertEqual(dictionary.statistics()[0], 1)
+
+    def test_chaining(self):
+        """ Testing buckets fill past half the table, and are emptied and dropped by deletion """
+        dictionary = SeparateChainingHashTable(1, 17)
+        for i in range(17):
+            dictionary[str(i)] = i
+        self.assertEqual((len(dictionary.table), dictionary.getRehashCounter()), (17, 0))
+        longest, used = dictionary.chain_statistics()
+        self.assertGreater(longest, 1)
+        self.assertEqual(dictionary.getProbeMax(), longest - 1)
+        self.assertEqual(dictionary.getCollisionCounter(), 17 - used)
+
+        dictionary["17"] = 17
+        self.assertEqual(dictionary.getRehashCounter(), 1)
+        for i in range(18):
+            del dictionary[str(i)]
+        self.assertEqual(len(dictionary), 0)
+        self.assertEqual(dictionary.chain_statistics(), (0, 0))
+        with self.assertRaises(KeyError):
+            del dictionary["0"]
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""Unit Testing for the List ADT implementations"""
+__author__ = "Maria Garcia de la Banda, modified by Brendon Taylor"
+__docformat__ = 'reStructuredText'
+
+import unittest
+from enum import Enum
+from list_adt import ArrayList, LinkList
+
+
+class TestLinkList(unittest.TestCase):
+    """ Tests for the cursor, tail and skip pointers of LinkList."""
+
+    def check(self, list, expected):
+        """ Compares list against expected by iteration, forwards indexing
+        and backwards indexing."""
+        self.assertEqual(len(list), len(expected))
+        self.assertEqual([item for item in list], expected)
+        self.assertEqual([list[i] for i in range(len(list))], expected)
+        self.assertEqual([list[i] for i in range(len(list) - 1, -1, -1)], expected[::-1])
+
+    def test_mixed_operations(self):
+        """ Inserting and deleting around the cursor keeps indexing right."""
+        for skip_interval in [0, 1, 3]:
+            list = LinkList(skip_interval)
+            expected = []
+            for i in range(20):
+                list.append(i)
+                expected.append(i)
+            self.check(list, expected)
+            for index, item in [(0, -1), (5, -2), (None, -3), (10, -4), (1, -5)]:
+                index = len(expected) if index is None else index
+                _ = list[7]
+                list.insert(index, item)
+                expected.insert(index, item)
+                self.check(list, expected)
+            for index in [0, 4, None, 10, 0]:
+                index = len(expected) - 1 if index is None else index
+                _ = list[6]
+                self.assertEqual(list.delete_at_index(index), expected.pop(index))
+                self.check(list, expected)
+            list.append(100)
+            expected.append(100)
+            self.check(list, expected)
+
+    def test_append_past_skips(self):
+        """ Indexing nodes appended after the skips were built walks on
+        from the last skip."""
+        list = LinkList(3)
+        for i in range(3):
+            list.append(i)
+        _ = list[0]
+        list.append(3)
+        list.append(4)
+        self.assertEqual(list[3], 3)
+        self.check(list, [0, 1, 2, 3, 4])
+        list.insert(4, -1)
+        self.check(list, [0, 1, 2, 3, -1, 4])
+
+    def test_delete_negative(self):
+        """ Tail and cursor stay valid after deleting negative items."""
+        list = LinkList(2)
+        for item in [-1, 2, -3, 4, -5]:
+            list.append(item)
+        _ = list[3]
+        list.delete_negative()
+        self.check(list, [2, 4])
+        list.append(6)
+        self.check(list, [2, 4, 6])
+        while not list.is_empty():
+            list.delete_at_index(len(list) - 1)
+        list.append(7)
+        self.check(list, [7])
+
+
+class TestArrayList(unittest.TestCase):
+    """ Tests for the growable ArrayList and its slice views."""
+
+    def test_grow(self):
+        """ Appending and inserting past the initial capacity grows the array."""
+        list = ArrayList(1)
+        for i in range(100):
+            list.append(i)
+        list.insert(0, -1)
+        self.assertEqual(len(list), 101)
+        self.assertFalse(list.is_full())
+        self.assertEqual([list[i] for i in range(len(list))], [-1] + [i for i in range(100)])
+        self.assertLessEqual(len(list.array), 256)
+
+    def test_extend(self):
+        """ Extending from an iterable, another ArrayList and itself."""
+        list = ArrayList(2)
+        list.extend(i for i in range(5))
+        other = ArrayList(1)
+        other.extend([5, 6])
+        list.extend(other)
+        list.extend(list)
+        self.assertEqual([item for item in list], [i for i in range(7)] * 2)
+        list.extend([])
+        self.assertEqual(len(list), 14)
+
+    def test_slice_view(self):
+        """ Slices are views over the list and don't copy the items."""
+        list = ArrayList(4)
+        list.extend(range(10))
+        view = list[2:8]
+        self.assertEqual(len(view), 6)
+        self.assertEqual([item for item in view], [2, 3, 4, 5, 6, 7])
+        self.assertEqual(view[-1], 7)
+        self.assertEqual([item for item in view[::2]], [2, 4, 6])
+        self.assertEqual(str(list[0:3]), "[0, 1, 2]")
+        self.assertEqual(len(list[5:100]), 5)
+
+        view[0] = "two"
+        self.assertEqual(list[2], "two")
+        list[3] = "three"
+        self.assertEqual(view[1], "three")
+        with self.assertRaises(IndexError):
+            _ = view[6]
+
+
+class DataStructure(Enum):
+    ARRAY = 1
+    LINK = 2
+
+
+class TestList(unittest.TestCase):
+    """ Tests for the above class, run on an ArrayList (see TestLinkListADT for LinkList)."""
+    EMPTY = 0
+    ROOMY = 5
+    LARGE = 10
+    DATA_STRUCTURE = DataStructure.ARRAY
+
+    def setUp(self):
+        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
+        if self.DATA_STRUCTURE == DataStructure.ARRAY:
+            self.lists = [ArrayList(self.LARGE) for i in range(len(self.lengths))]
+        else:
+            self.lists = [LinkList() for i in range(len(self.lengths))]
+        for list, length in zip(self.lists, self.lengths):
+            for i in range(length):
+                list.append(i)
+        self.empty_list = self.lists[0]
+        self.roomy_list = self.lists[1]
+        self.large_list = self.lists[2]
+        # we build empty lists from clear.
+        # this is an indirect way of testing if clear works!
+        # (perhaps not the best)
+        self.clear_list = self.lists[3]
+        self.clear_list.clear()
+        self.lengths[3] = 0
+        self.lists[4].clear()
+        self.lengths[4] = 0
+
+    def tearDown(self):
+        for s in self.lists:
+            s.clear()
+
+    def test_init(self) -> None:
+        self.assertTrue(self.empty_list.is_empty())
+        self.assertEqual(len(self.empty_list), 0)
+
+    def test_len(self):
+        """ Tests the length of all lists created during setup."""
+        for list, length in zip(self.lists, self.lengths):
+            self.assertEqual(len(list), length)
+
+    def test_is_empty_add(self):
+        """ Tests lists that have been created empty/non-empty."""
+        self.assertTrue(self.empty_list.is_empty())
+        self.assertFalse(self.roomy_list.is_empty())
+        self.assertFalse(self.large_list.is_empty())
+
+    def test_is_empty_clear(self):
+        """ Tests lists that have been cleared."""
+        for list in self.lists:
+            list.clear()
+            self.assertTrue(list.is_empty())
+
+    def test_is_empty_delete_at_index(self):
+        """ Tests lists that have been created and then deleted completely."""
+        for list in self.lists:
+            # we empty the list
+            for i in range(len(list)):
+                self.assertEqual(list.delete_at_index(0), i)
+            try:
+                list.delete_at_index(-1)
+            except:
+                self.assertTrue(list.is_empty())
+
+    def test_append_and_remove_item(self):
+        for list in self.lists:
+            nitems = self.ROOMY
+            list.clear()
+            for i in range(nitems):
+                list.append(i)
+            for i in range(nitems - 1):
+                list.remove(i)
+                self.assertEqual(list[0], i + 1)
+            list.remove(nitems - 1)
+            self.assertTrue(list.is_empty())
+            for i in range(nitems):
+                list.append(i)
+            for i in range(nitems - 1, 0, -1):
+                list.remove(i)
+                self.assertEqual(list[len(list) - 1], i - 1)
+            list.remove(0)
+            self.assertTrue(list.is_empty())
+
+    def test_clear(self):
+        for list in self.lists:
+            list.clear()
+            self.assertTrue(list.is_empty())
+
+
+class TestLinkListADT(TestList):
+    """ The TestList tests, run on a LinkList."""
+    DATA_STRUCTURE = DataStructure.LINK
+
+
+if __name__ == '__main__':
+    unittest.main()
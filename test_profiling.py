@@ -0,0 +1,49 @@
+"""Unit Testing for the profiling spans"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+import profiling
+from dictionary import Dictionary
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self) -> None:
+        profiling.reset()
+
+    def tearDown(self) -> None:
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled(self) -> None:
+        """ Nothing is recorded unless enabled """
+        with profiling.span("stage"):
+            pass
+        self.assertEqual(profiling.breakdown(), [])
+
+    def test_spans(self) -> None:
+        """ Calls accumulate, nested spans are listed in entry order, and profiles are kept per span """
+        profiling.enable(allocations=True, profile=["inner"])
+        for _ in range(2):
+            with profiling.span("outer"):
+                with profiling.span("inner"):
+                    data = [0] * 10000
+        profiling.disable()
+        del data
+        stages = profiling.breakdown()
+        self.assertEqual([(name, calls) for name, calls, _, _ in stages], [("outer", 2), ("inner", 2)])
+        self.assertGreaterEqual(stages[0][2], stages[1][2])
+        self.assertGreater(stages[1][3], 0)
+        self.assertIsNotNone(profiling.profile_stats("inner"))
+        with self.assertRaises(KeyError):
+            profiling.profile_stats("outer")
+
+    def test_load_dictionary(self) -> None:
+        """ The dictionary load is broken down into reading and inserting """
+        profiling.enable()
+        Dictionary(31, 250727).load_dictionary("english_small.txt")
+        names = [name for name, _, _, _ in profiling.breakdown()]
+        self.assertEqual(names, ["dictionary.load", "dictionary.read", "dictionary.insert"])
+
+
+if __name__ == '__main__':
+    unittest.main()
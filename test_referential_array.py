@@ -0,0 +1,72 @@
+"""Unit Testing for the referential array"""
+__docformat__ = 'reStructuredText'
+
+import unittest
+from referential_array import ArrayR
+
+
+class TestArrayR(unittest.TestCase):
+    def setUp(self) -> None:
+        """ An array holding 0 to 7 """
+        self.array = ArrayR(8)
+        for i in range(8):
+            self.array[i] = i
+
+    def test_init(self) -> None:
+        """ A new array is all None, and must have a positive length """
+        self.assertEqual(list(ArrayR(3)), [None] * 3)
+        with self.assertRaises(ValueError):
+            ArrayR(0)
+
+    def test_fill(self) -> None:
+        """ Filling a range, the whole array, and out of bounds """
+        self.array.fill(-1, 2, 5)
+        self.assertEqual(list(self.array), [0, 1, -1, -1, -1, 5, 6, 7])
+        self.array.fill(None)
+        self.assertEqual(list(self.array), [None] * 8)
+        with self.assertRaises(IndexError):
+            self.array.fill(0, 4, 9)
+        with self.assertRaises(IndexError):
+            self.array.fill(0, 5, 4)
+
+    def test_slices(self) -> None:
+        """ Slices read and write in place, and assigning a sequence of the wrong length raises """
+        self.assertEqual(self.array[2:5], [2, 3, 4])
+        self.assertEqual(self.array[::3], [0, 3, 6])
+        self.array[1:3] = ["a", "b"]
+        self.array[::4] = ["x", "y"]
+        self.assertEqual(list(self.array), ["x", "a", "b", 3, "y", 5, 6, 7])
+        with self.assertRaises(ValueError):
+            self.array[0:2] = [1, 2, 3]
+        with self.assertRaises(ValueError):
+            self.array[::2] = [1]
+        self.assertEqual(len(self.array), 8)
+
+    def test_copy_from(self) -> None:
+        """ Copying between arrays, and within one array with overlapping ranges in both directions """
+        other = ArrayR(4)
+        other.copy_from(self.array, 5, 1, 3)
+        self.assertEqual(list(other), [None, 5, 6, 7])
+
+        self.array.copy_from(self.array, 0, 2, 5)
+        self.assertEqual(list(self.array), [0, 1, 0, 1, 2, 3, 4, 7])
+        self.array.copy_from(self.array, 2, 0, 5)
+        self.assertEqual(list(self.array), [0, 1, 2, 3, 4, 3, 4, 7])
+
+        with self.assertRaises(IndexError):
+            other.copy_from(self.array, 0, 2, 3)
+        with self.assertRaises(IndexError):
+            other.copy_from(self.array, 6, 0, 3)
+        self.assertEqual(list(other), [None, 5, 6, 7])
+
+    def test_iter_nonempty(self) -> None:
+        """ Only positions holding something other than None are yielded, with their indices """
+        self.array[0] = None
+        self.array[3] = None
+        self.array[5] = False
+        self.assertEqual(list(self.array.iter_nonempty()), [(1, 1), (2, 2), (4, 4), (5, False), (6, 6), (7, 7)])
+        self.assertEqual(list(ArrayR(5).iter_nonempty()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Unit Testing for the tokenizer"""
+__docformat__ = 'reStructuredText'
+
+import io
+import unittest
+from tokenizer import tokenize, read_tokens, read_lines
+
+
+class TestTokenizer(unittest.TestCase):
+    def test_tokenize(self) -> None:
+        """ Unicode punctuation, inner punctuation and apostrophes """
+        self.assertEqual(tokenize("“Old Buck’s strain.” tide-water _italic_ can't ‘élève’ dogs'"),
+                         ["old", "buck's", "strain", "tide", "water", "italic", "can't", "élève", "dogs"])
+        self.assertEqual(tokenize(" — ... "), [])
+
+    def test_read_tokens(self) -> None:
+        """ Words are never split across buffers """
+        text = "alpha beta\ngamma deltaepsilon zeta"
+        for buffer_size in [1, 3, 7, 100]:
+            words = [word for batch in read_tokens(io.StringIO(text), buffer_size) for word in batch]
+            self.assertEqual(words, ["alpha", "beta", "gamma", "deltaepsilon", "zeta"])
+
+    def test_read_lines(self) -> None:
+        """ One entry per line, trailing whitespace removed, inner spaces kept """
+        self.assertEqual(read_lines(io.StringIO("a\nb \n\na priori\n")), ["a", "b", "", "a priori"])
+        self.assertEqual(read_lines(io.StringIO("a\nb")), ["a", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+""" Tokenizer
+
+Splits text into normalised words for Frequency and Dictionary. Whole
+buffers are lowercased and have their apostrophes unified with a few
+str.lower/str.replace calls, and the words are then picked out by a single
+precompiled regular expression, so no per-token Python code runs.
+(str.translate would do the replacing in one call, but it is an order of
+magnitude slower than str.replace on non-ASCII text.)
+
+A word is a run of letters or digits (any script, so accented French
+letters are kept), possibly joined by apostrophes as in "can't". Numbers
+come out as words too and are left for the dictionary to reject.
+Everything else, including Unicode punctuation such as curly quotes and
+dashes, underscores and hyphens, separates words.
+"""
+__author__ = 'Daiki Kubo'
+
+import re
+from typing import Iterator, List, TextIO
+
+# curly and modifier apostrophes are written as ', which is what the word lists use
+APOSTROPHES = ['’', '‘', 'ʼ']
+WORD = re.compile(r"\w+(?:'\w+)*")
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Returns the normalised words of text, in order
+    :complexity: O(N) where N is the size of text
+    """
+    for apostrophe in APOSTROPHES:
+        text = text.replace(apostrophe, "'")
+    return WORD.findall(text.replace("_", " ").lower())
+
+
+def read_tokens(file: TextIO, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[List[str]]:
+    """
+    Yields the normalised words of an open text file in batches, one per buffer of about buffer_size characters.
+    Buffers are cut after the last whitespace they contain, so no word is split across two batches.
+    :complexity: O(N) where N is the size of the file
+    """
+    remainder = ""
+    while True:
+        buffer = file.read(buffer_size)
+        if not buffer:
+            break
+        buffer = remainder + buffer
+        cut = max(buffer.rfind(" "), buffer.rfind("\n"))
+        if cut <= 0:
+            remainder = buffer
+            continue
+        remainder = buffer[cut:]
+        yield tokenize(buffer[:cut])
+    if remainder:
+        yield tokenize(remainder)
+
+
+def read_lines(file: TextIO) -> List[str]:
+    """
+    Returns the lines of an open word list file with trailing whitespace removed, one entry per line.
+    Word lists have one entry per line and entries may contain spaces, so lines are not tokenized.
+    :complexity: O(N) where N is the size of the file
+    """
+    lines = file.read().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return list(map(str.rstrip, lines))